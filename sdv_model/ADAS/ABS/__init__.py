@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class ABS(Model):
@@ -38,6 +39,8 @@ class ABS(Model):
 
     """
 
+    __slots__ = ("IsEnabled", "IsError", "IsEngaged")
+
     def __init__(self, name, parent):
         """Create a new ABS model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointFloat, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointFloat
+from sdv_model.model import Model
 
 
 class CruiseControl(Model):
@@ -42,6 +43,8 @@ class CruiseControl(Model):
 
     """
 
+    __slots__ = ("IsEnabled", "IsActive", "SpeedSet", "IsError")
+
     def __init__(self, name, parent):
         """Create a new CruiseControl model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class RoadFriction(Model):
@@ -44,6 +45,8 @@ class RoadFriction(Model):
         Unit: percent
     """
 
+    __slots__ = ("MostProbable", "LowerBound", "UpperBound")
+
     def __init__(self, name, parent):
         """Create a new RoadFriction model."""
         super().__init__(parent)
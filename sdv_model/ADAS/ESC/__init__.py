@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.ADAS.ESC.RoadFriction import RoadFriction
+__getattr__ = lazy_import(__name__, ("RoadFriction",))
 
 
 class ESC(Model):
@@ -46,6 +48,10 @@ class ESC(Model):
 
     """
 
+    __slots__ = ("IsEnabled", "IsError", "IsEngaged", "IsStrongCrossWindDetected")
+
+    RoadFriction = LazyBranch("RoadFriction")
+
     def __init__(self, name, parent):
         """Create a new ESC model."""
         super().__init__(parent)
@@ -57,4 +63,3 @@ def __init__(self, name, parent):
         self.IsStrongCrossWindDetected = DataPointBoolean(
             "IsStrongCrossWindDetected", self
         )
-        self.RoadFriction = RoadFriction("RoadFriction", self)
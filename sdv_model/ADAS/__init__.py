@@ -19,16 +19,23 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
-
-from sdv_model.ADAS.ABS import ABS
-from sdv_model.ADAS.CruiseControl import CruiseControl
-from sdv_model.ADAS.EBA import EBA
-from sdv_model.ADAS.EBD import EBD
-from sdv_model.ADAS.ESC import ESC
-from sdv_model.ADAS.LaneDepartureDetection import LaneDepartureDetection
-from sdv_model.ADAS.ObstacleDetection import ObstacleDetection
-from sdv_model.ADAS.TCS import TCS
+from sdv_model.datapoints import DataPointString
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "ABS",
+        "CruiseControl",
+        "EBA",
+        "EBD",
+        "ESC",
+        "LaneDepartureDetection",
+        "ObstacleDetection",
+        "TCS",
+    ),
+)
 
 
 class ADAS(Model):
@@ -72,6 +79,17 @@ class ADAS(Model):
 
     """
 
+    __slots__ = ("ActiveAutonomyLevel", "SupportedAutonomyLevel")
+
+    CruiseControl = LazyBranch("CruiseControl")
+    LaneDepartureDetection = LazyBranch("LaneDepartureDetection")
+    ObstacleDetection = LazyBranch("ObstacleDetection")
+    ABS = LazyBranch("ABS")
+    TCS = LazyBranch("TCS")
+    ESC = LazyBranch("ESC")
+    EBD = LazyBranch("EBD")
+    EBA = LazyBranch("EBA")
+
     def __init__(self, name, parent):
         """Create a new ADAS model."""
         super().__init__(parent)
@@ -79,13 +97,3 @@ def __init__(self, name, parent):
 
         self.ActiveAutonomyLevel = DataPointString("ActiveAutonomyLevel", self)
         self.SupportedAutonomyLevel = DataPointString("SupportedAutonomyLevel", self)
-        self.CruiseControl = CruiseControl("CruiseControl", self)
-        self.LaneDepartureDetection = LaneDepartureDetection(
-            "LaneDepartureDetection", self
-        )
-        self.ObstacleDetection = ObstacleDetection("ObstacleDetection", self)
-        self.ABS = ABS("ABS", self)
-        self.TCS = TCS("TCS", self)
-        self.ESC = ESC("ESC", self)
-        self.EBD = EBD("EBD", self)
-        self.EBA = EBA("EBA", self)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class Acceleration(Model):
@@ -41,6 +42,8 @@ class Acceleration(Model):
         Unit: m/s^2
     """
 
+    __slots__ = ("Longitudinal", "Lateral", "Vertical")
+
     def __init__(self, name, parent):
         """Create a new Acceleration model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class AngularVelocity(Model):
@@ -41,6 +42,8 @@ class AngularVelocity(Model):
         Unit: degrees/s
     """
 
+    __slots__ = ("Roll", "Pitch", "Yaw")
+
     def __init__(self, name, parent):
         """Create a new AngularVelocity model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class Lights(Model):
@@ -62,6 +63,20 @@ class Lights(Model):
 
     """
 
+    __slots__ = (
+        "IsHighBeamOn",
+        "IsLowBeamOn",
+        "IsRunningOn",
+        "IsBackupOn",
+        "IsParkingOn",
+        "IsBrakeOn",
+        "IsRearFogOn",
+        "IsFrontFogOn",
+        "IsHazardOn",
+        "IsLeftIndicatorOn",
+        "IsRightIndicatorOn",
+    )
+
     def __init__(self, name, parent):
         """Create a new Lights model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointInt8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointInt8
+from sdv_model.model import Model
 
 
 class Mirrors(Model):
@@ -42,6 +43,8 @@ class Mirrors(Model):
 
     """
 
+    __slots__ = ("Tilt", "Pan", "IsHeatingOn")
+
     def __init__(self, name, parent):
         """Create a new Mirrors model."""
         super().__init__(parent)
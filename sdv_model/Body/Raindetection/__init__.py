@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointUint8, Model
+from sdv_model.datapoints import DataPointUint8
+from sdv_model.model import Model
 
 
 class Raindetection(Model):
@@ -34,6 +35,8 @@ class Raindetection(Model):
         Unit: percent
     """
 
+    __slots__ = ("Intensity",)
+
     def __init__(self, name, parent):
         """Create a new Raindetection model."""
         super().__init__(parent)
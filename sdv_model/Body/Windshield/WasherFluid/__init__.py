@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointUint8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointUint8
+from sdv_model.model import Model
 
 
 class WasherFluid(Model):
@@ -37,6 +38,8 @@ class WasherFluid(Model):
         Unit: percent
     """
 
+    __slots__ = ("IsLevelLow", "Level")
+
     def __init__(self, name, parent):
         """Create a new WasherFluid model."""
         super().__init__(parent)
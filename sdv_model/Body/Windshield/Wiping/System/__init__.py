@@ -19,13 +19,13 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointString,
     DataPointUint8,
-    Model,
 )
+from sdv_model.model import Model
 
 
 class System(Model):
@@ -82,6 +82,20 @@ class System(Model):
 
     """
 
+    __slots__ = (
+        "Mode",
+        "Frequency",
+        "TargetPosition",
+        "ActualPosition",
+        "DriveCurrent",
+        "IsWiping",
+        "IsEndingWipeCycle",
+        "IsWiperError",
+        "IsPositionReached",
+        "IsBlocked",
+        "IsOverheated",
+    )
+
     def __init__(self, name, parent):
         """Create a new System model."""
         super().__init__(parent)
@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointString, DataPointUint8
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Body.Windshield.Wiping.System import System
+__getattr__ = lazy_import(__name__, ("System",))
 
 
 class Wiping(Model):
@@ -50,6 +52,10 @@ class Wiping(Model):
 
     """
 
+    __slots__ = ("Mode", "Intensity", "WiperWear", "IsWipersWorn")
+
+    System = LazyBranch("System")
+
     def __init__(self, name, parent):
         """Create a new Wiping model."""
         super().__init__(parent)
@@ -57,6 +63,5 @@ def __init__(self, name, parent):
 
         self.Mode = DataPointString("Mode", self)
         self.Intensity = DataPointUint8("Intensity", self)
-        self.System = System("System", self)
         self.WiperWear = DataPointUint8("WiperWear", self)
         self.IsWipersWorn = DataPointBoolean("IsWipersWorn", self)
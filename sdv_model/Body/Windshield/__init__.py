@@ -19,10 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Body.Windshield.WasherFluid import WasherFluid
-from sdv_model.Body.Windshield.Wiping import Wiping
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "WasherFluid",
+        "Wiping",
+    ),
+)
 
 
 class Windshield(Model):
@@ -41,11 +48,14 @@ class Windshield(Model):
 
     """
 
+    __slots__ = ("IsHeatingOn",)
+
+    Wiping = LazyBranch("Wiping")
+    WasherFluid = LazyBranch("WasherFluid")
+
     def __init__(self, name, parent):
         """Create a new Windshield model."""
         super().__init__(parent)
         self.name = name
 
-        self.Wiping = Wiping("Wiping", self)
         self.IsHeatingOn = DataPointBoolean("IsHeatingOn", self)
-        self.WasherFluid = WasherFluid("WasherFluid", self)
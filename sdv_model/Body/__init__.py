@@ -19,15 +19,23 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, DataPointString, Model
-
-from sdv_model.Body.Hood import Hood
-from sdv_model.Body.Horn import Horn
-from sdv_model.Body.Lights import Lights
-from sdv_model.Body.Mirrors import Mirrors
-from sdv_model.Body.Raindetection import Raindetection
-from sdv_model.Body.Trunk import Trunk
-from sdv_model.Body.Windshield import Windshield
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointFloat, DataPointString
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Hood",
+        "Horn",
+        "Lights",
+        "Mirrors",
+        "Raindetection",
+        "Trunk",
+        "Windshield",
+    ),
+)
 
 
 class Body(Model):
@@ -70,6 +78,16 @@ class Body(Model):
         Unit: percent
     """
 
+    __slots__ = ("BodyType", "RefuelPosition", "RearMainSpoilerPosition")
+
+    Hood = LazyBranch("Hood")
+    Trunk = LazyBranch("TrunkCollection")
+    Horn = LazyBranch("Horn")
+    Raindetection = LazyBranch("Raindetection")
+    Windshield = LazyBranch("WindshieldCollection")
+    Lights = LazyBranch("Lights")
+    Mirrors = LazyBranch("MirrorsCollection")
+
     def __init__(self, name, parent):
         """Create a new Body model."""
         super().__init__(parent)
@@ -77,62 +95,52 @@ def __init__(self, name, parent):
 
         self.BodyType = DataPointString("BodyType", self)
         self.RefuelPosition = DataPointString("RefuelPosition", self)
-        self.Hood = Hood("Hood", self)
-        self.Trunk = TrunkCollection("Trunk", self)
-        self.Horn = Horn("Horn", self)
-        self.Raindetection = Raindetection("Raindetection", self)
-        self.Windshield = WindshieldCollection("Windshield", self)
-        self.Lights = Lights("Lights", self)
-        self.Mirrors = MirrorsCollection("Mirrors", self)
         self.RearMainSpoilerPosition = DataPointFloat("RearMainSpoilerPosition", self)
 
 
-class TrunkCollection(Model):
+class TrunkCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Front", "Rear")
+
+    Front = LazyBranch("Trunk")
+    Rear = LazyBranch("Trunk")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Front = Trunk("Front", self)
-        self.Rear = Trunk("Rear", self)
 
     def element(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Front,
-            2: self.Rear,
-        }
-        return _options.get(index)
+        return self._element(index)
 
 
-class WindshieldCollection(Model):
+class WindshieldCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Front", "Rear")
+
+    Front = LazyBranch("Windshield")
+    Rear = LazyBranch("Windshield")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Front = Windshield("Front", self)
-        self.Rear = Windshield("Rear", self)
 
     def element(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Front,
-            2: self.Rear,
-        }
-        return _options.get(index)
+        return self._element(index)
+
+
+class MirrorsCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Left", "Right")
 
+    Left = LazyBranch("Mirrors")
+    Right = LazyBranch("Mirrors")
 
-class MirrorsCollection(Model):
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Left = Mirrors("Left", self)
-        self.Right = Mirrors("Right", self)
 
     def element(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Left,
-            2: self.Right,
-        }
-        return _options.get(index)
+        return self._element(index)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.model import Model
 
 
 class Convertible(Model):
@@ -33,6 +34,8 @@ class Convertible(Model):
         Allowed values: UNDEFINED, CLOSED, OPEN, CLOSING, OPENING, STALLED
     """
 
+    __slots__ = ("Status",)
+
     def __init__(self, name, parent):
         """Create a new Convertible model."""
         super().__init__(parent)
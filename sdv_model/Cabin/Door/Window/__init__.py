@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointString, DataPointUint8
+from sdv_model.model import Model
 
 
 class Window(Model):
@@ -44,6 +45,8 @@ class Window(Model):
         Allowed values: INACTIVE, CLOSE, OPEN, ONE_SHOT_CLOSE, ONE_SHOT_OPEN
     """
 
+    __slots__ = ("IsOpen", "Position", "IsChildLockEngaged", "Switch")
+
     def __init__(self, name, parent):
         """Create a new Window model."""
         super().__init__(parent)
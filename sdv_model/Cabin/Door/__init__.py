@@ -19,10 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Door.Shade import Shade
-from sdv_model.Cabin.Door.Window import Window
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Shade",
+        "Window",
+    ),
+)
 
 
 class Door(Model):
@@ -47,6 +54,11 @@ class Door(Model):
 
     """
 
+    __slots__ = ("IsOpen", "IsLocked", "IsChildLockActive")
+
+    Window = LazyBranch("Window")
+    Shade = LazyBranch("Shade")
+
     def __init__(self, name, parent):
         """Create a new Door model."""
         super().__init__(parent)
@@ -54,6 +66,4 @@ def __init__(self, name, parent):
 
         self.IsOpen = DataPointBoolean("IsOpen", self)
         self.IsLocked = DataPointBoolean("IsLocked", self)
-        self.Window = Window("Window", self)
         self.IsChildLockActive = DataPointBoolean("IsChildLockActive", self)
-        self.Shade = Shade("Shade", self)
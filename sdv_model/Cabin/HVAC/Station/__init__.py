@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointInt8, DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointInt8, DataPointString, DataPointUint8
+from sdv_model.model import Model
 
 
 class Station(Model):
@@ -42,6 +43,8 @@ class Station(Model):
         Allowed values: UP, MIDDLE, DOWN
     """
 
+    __slots__ = ("FanSpeed", "Temperature", "AirDistribution")
+
     def __init__(self, name, parent):
         """Create a new Station model."""
         super().__init__(parent)
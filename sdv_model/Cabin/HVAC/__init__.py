@@ -19,9 +19,12 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointFloat, Model
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointBoolean, DataPointFloat
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.HVAC.Station import Station
+__getattr__ = lazy_import(__name__, ("Station",))
 
 
 class HVAC(Model):
@@ -50,12 +53,21 @@ class HVAC(Model):
         Unit: celsius
     """
 
+    __slots__ = (
+        "IsRecirculationActive",
+        "IsFrontDefrosterActive",
+        "IsRearDefrosterActive",
+        "IsAirConditioningActive",
+        "AmbientAirTemperature",
+    )
+
+    Station = LazyBranch("StationCollection")
+
     def __init__(self, name, parent):
         """Create a new HVAC model."""
         super().__init__(parent)
         self.name = name
 
-        self.Station = StationCollection("Station", self)
         self.IsRecirculationActive = DataPointBoolean("IsRecirculationActive", self)
         self.IsFrontDefrosterActive = DataPointBoolean("IsFrontDefrosterActive", self)
         self.IsRearDefrosterActive = DataPointBoolean("IsRearDefrosterActive", self)
@@ -63,38 +75,34 @@ def __init__(self, name, parent):
         self.AmbientAirTemperature = DataPointFloat("AmbientAirTemperature", self)
 
 
-class StationCollection(Model):
+class StationCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Row1", "Row2", "Row3", "Row4")
+
+    Row1 = LazyBranch("StationCollection.RowType")
+    Row2 = LazyBranch("StationCollection.RowType")
+    Row3 = LazyBranch("StationCollection.RowType")
+    Row4 = LazyBranch("StationCollection.RowType")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Row1 = self.RowType("Row1", self)
-        self.Row2 = self.RowType("Row2", self)
-        self.Row3 = self.RowType("Row3", self)
-        self.Row4 = self.RowType("Row4", self)
 
     def Row(self, index: int):
-        if index < 1 or index > 4:
-            raise IndexError(f"Index {index} is out of range [1, 4]")
-        _options = {
-            1: self.Row1,
-            2: self.Row2,
-            3: self.Row3,
-            4: self.Row4,
-        }
-        return _options.get(index)
-
-    class RowType(Model):
+        return self._element(index)
+
+    class RowType(Collection):
+        __slots__ = ()
+
+        _elements = ("Left", "Right")
+
+        Left = LazyBranch("Station")
+        Right = LazyBranch("Station")
+
         def __init__(self, name, parent):
             super().__init__(parent)
             self.name = name
-            self.Left = Station("Left", self)
-            self.Right = Station("Right", self)
 
         def element(self, index: int):
-            if index < 1 or index > 2:
-                raise IndexError(f"Index {index} is out of range [1, 2]")
-            _options = {
-                1: self.Left,
-                2: self.Right,
-            }
-            return _options.get(index)
+            return self._element(index)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.model import Model
 
 
 class HMI(Model):
@@ -60,6 +61,17 @@ class HMI(Model):
         Allowed values: DAY, NIGHT
     """
 
+    __slots__ = (
+        "CurrentLanguage",
+        "DateFormat",
+        "TimeFormat",
+        "DistanceUnit",
+        "FuelEconomyUnits",
+        "EVEconomyUnits",
+        "TemperatureUnit",
+        "DayNightMode",
+    )
+
     def __init__(self, name, parent):
         """Create a new HMI model."""
         super().__init__(parent)
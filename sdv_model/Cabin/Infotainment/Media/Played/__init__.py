@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.model import Model
 
 
 class Played(Model):
@@ -45,6 +46,8 @@ class Played(Model):
 
     """
 
+    __slots__ = ("Source", "Artist", "Album", "Track", "URI")
+
     def __init__(self, name, parent):
         """Create a new Played model."""
         super().__init__(parent)
@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointString, DataPointUint8
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Infotainment.Media.Played import Played
+__getattr__ = lazy_import(__name__, ("Played",))
 
 
 class Media(Model):
@@ -48,13 +50,16 @@ class Media(Model):
         Value range: [0, 100]
     """
 
+    __slots__ = ("Action", "DeclinedURI", "SelectedURI", "Volume")
+
+    Played = LazyBranch("Played")
+
     def __init__(self, name, parent):
         """Create a new Media model."""
         super().__init__(parent)
         self.name = name
 
         self.Action = DataPointString("Action", self)
-        self.Played = Played("Played", self)
         self.DeclinedURI = DataPointString("DeclinedURI", self)
         self.SelectedURI = DataPointString("SelectedURI", self)
         self.Volume = DataPointUint8("Volume", self)
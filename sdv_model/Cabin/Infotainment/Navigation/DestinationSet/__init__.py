@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointDouble, Model
+from sdv_model.datapoints import DataPointDouble
+from sdv_model.model import Model
 
 
 class DestinationSet(Model):
@@ -39,6 +40,8 @@ class DestinationSet(Model):
         Unit: degrees
     """
 
+    __slots__ = ("Latitude", "Longitude")
+
     def __init__(self, name, parent):
         """Create a new DestinationSet model."""
         super().__init__(parent)
@@ -19,9 +19,10 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import Model
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Infotainment.Navigation.DestinationSet import DestinationSet
+__getattr__ = lazy_import(__name__, ("DestinationSet",))
 
 
 class Navigation(Model):
@@ -34,9 +35,11 @@ class Navigation(Model):
 
     """
 
+    __slots__ = ()
+
+    DestinationSet = LazyBranch("DestinationSet")
+
     def __init__(self, name, parent):
         """Create a new Navigation model."""
         super().__init__(parent)
         self.name = name
-
-        self.DestinationSet = DestinationSet("DestinationSet", self)
@@ -19,11 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import Model
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Infotainment.HMI import HMI
-from sdv_model.Cabin.Infotainment.Media import Media
-from sdv_model.Cabin.Infotainment.Navigation import Navigation
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "HMI",
+        "Media",
+        "Navigation",
+    ),
+)
 
 
 class Infotainment(Model):
@@ -42,11 +48,13 @@ class Infotainment(Model):
 
     """
 
+    __slots__ = ()
+
+    Media = LazyBranch("Media")
+    Navigation = LazyBranch("Navigation")
+    HMI = LazyBranch("HMI")
+
     def __init__(self, name, parent):
         """Create a new Infotainment model."""
         super().__init__(parent)
         self.name = name
-
-        self.Media = Media("Media", self)
-        self.Navigation = Navigation("Navigation", self)
-        self.HMI = HMI("HMI", self)
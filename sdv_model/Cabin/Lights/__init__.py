@@ -19,9 +19,12 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointUint8, Model
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointBoolean, DataPointUint8
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Lights.Spotlight import Spotlight
+__getattr__ = lazy_import(__name__, ("Spotlight",))
 
 
 class Lights(Model):
@@ -53,6 +56,16 @@ class Lights(Model):
 
     """
 
+    __slots__ = (
+        "IsGloveBoxOn",
+        "IsTrunkOn",
+        "IsDomeOn",
+        "AmbientLight",
+        "LightIntensity",
+    )
+
+    Spotlight = LazyBranch("SpotlightCollection")
+
     def __init__(self, name, parent):
         """Create a new Lights model."""
         super().__init__(parent)
@@ -63,25 +76,21 @@ def __init__(self, name, parent):
         self.IsDomeOn = DataPointBoolean("IsDomeOn", self)
         self.AmbientLight = DataPointUint8("AmbientLight", self)
         self.LightIntensity = DataPointUint8("LightIntensity", self)
-        self.Spotlight = SpotlightCollection("Spotlight", self)
 
 
-class SpotlightCollection(Model):
+class SpotlightCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Row1", "Row2", "Row3", "Row4")
+
+    Row1 = LazyBranch("Spotlight")
+    Row2 = LazyBranch("Spotlight")
+    Row3 = LazyBranch("Spotlight")
+    Row4 = LazyBranch("Spotlight")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Row1 = Spotlight("Row1", self)
-        self.Row2 = Spotlight("Row2", self)
-        self.Row3 = Spotlight("Row3", self)
-        self.Row4 = Spotlight("Row4", self)
 
     def Row(self, index: int):
-        if index < 1 or index > 4:
-            raise IndexError(f"Index {index} is out of range [1, 4]")
-        _options = {
-            1: self.Row1,
-            2: self.Row2,
-            3: self.Row3,
-            4: self.Row4,
-        }
-        return _options.get(index)
+        return self._element(index)
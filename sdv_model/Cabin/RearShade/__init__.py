@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointString, DataPointUint8
+from sdv_model.model import Model
 
 
 class RearShade(Model):
@@ -38,6 +39,8 @@ class RearShade(Model):
         Unit: percent
     """
 
+    __slots__ = ("Switch", "Position")
+
     def __init__(self, name, parent):
         """Create a new RearShade model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class Airbag(Model):
@@ -32,6 +33,8 @@ class Airbag(Model):
 
     """
 
+    __slots__ = ("IsDeployed",)
+
     def __init__(self, name, parent):
         """Create a new Airbag model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, DataPointUint8, Model
+from sdv_model.datapoints import DataPointFloat, DataPointUint8
+from sdv_model.model import Model
 
 
 class Lumbar(Model):
@@ -39,6 +40,8 @@ class Lumbar(Model):
         Unit: mm
     """
 
+    __slots__ = ("Support", "Height")
+
     def __init__(self, name, parent):
         """Create a new Lumbar model."""
         super().__init__(parent)
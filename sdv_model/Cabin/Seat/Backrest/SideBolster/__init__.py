@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class SideBolster(Model):
@@ -34,6 +35,8 @@ class SideBolster(Model):
         Unit: percent
     """
 
+    __slots__ = ("Support",)
+
     def __init__(self, name, parent):
         """Create a new SideBolster model."""
         super().__init__(parent)
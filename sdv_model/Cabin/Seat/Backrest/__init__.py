@@ -19,10 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Seat.Backrest.Lumbar import Lumbar
-from sdv_model.Cabin.Seat.Backrest.SideBolster import SideBolster
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Lumbar",
+        "SideBolster",
+    ),
+)
 
 
 class Backrest(Model):
@@ -44,11 +51,14 @@ class Backrest(Model):
 
     """
 
+    __slots__ = ("Recline",)
+
+    Lumbar = LazyBranch("Lumbar")
+    SideBolster = LazyBranch("SideBolster")
+
     def __init__(self, name, parent):
         """Create a new Backrest model."""
         super().__init__(parent)
         self.name = name
 
         self.Recline = DataPointFloat("Recline", self)
-        self.Lumbar = Lumbar("Lumbar", self)
-        self.SideBolster = SideBolster("SideBolster", self)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, DataPointUint8, Model
+from sdv_model.datapoints import DataPointFloat, DataPointUint8
+from sdv_model.model import Model
 
 
 class Headrest(Model):
@@ -38,6 +39,8 @@ class Headrest(Model):
         Unit: degrees
     """
 
+    __slots__ = ("Height", "Angle")
+
     def __init__(self, name, parent):
         """Create a new Headrest model."""
         super().__init__(parent)
@@ -19,9 +19,10 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import Model
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Seat.Occupant.Identifier import Identifier
+__getattr__ = lazy_import(__name__, ("Identifier",))
 
 
 class Occupant(Model):
@@ -34,9 +35,11 @@ class Occupant(Model):
 
     """
 
+    __slots__ = ()
+
+    Identifier = LazyBranch("Identifier")
+
     def __init__(self, name, parent):
         """Create a new Occupant model."""
         super().__init__(parent)
         self.name = name
-
-        self.Identifier = Identifier("Identifier", self)
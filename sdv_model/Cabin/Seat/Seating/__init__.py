@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointUint16, Model
+from sdv_model.datapoints import DataPointUint16
+from sdv_model.model import Model
 
 
 class Seating(Model):
@@ -34,6 +35,8 @@ class Seating(Model):
         Unit: mm
     """
 
+    __slots__ = ("Length",)
+
     def __init__(self, name, parent):
         """Create a new Seating model."""
         super().__init__(parent)
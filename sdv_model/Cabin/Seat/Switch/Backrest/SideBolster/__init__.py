@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class SideBolster(Model):
@@ -35,6 +36,8 @@ class SideBolster(Model):
 
     """
 
+    __slots__ = ("IsMoreSupportEngaged", "IsLessSupportEngaged")
+
     def __init__(self, name, parent):
         """Create a new SideBolster model."""
         super().__init__(parent)
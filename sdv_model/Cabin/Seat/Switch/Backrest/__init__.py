@@ -19,10 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Seat.Switch.Backrest.Lumbar import Lumbar
-from sdv_model.Cabin.Seat.Switch.Backrest.SideBolster import SideBolster
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Lumbar",
+        "SideBolster",
+    ),
+)
 
 
 class Backrest(Model):
@@ -44,6 +51,11 @@ class Backrest(Model):
 
     """
 
+    __slots__ = ("IsReclineForwardEngaged", "IsReclineBackwardEngaged")
+
+    Lumbar = LazyBranch("Lumbar")
+    SideBolster = LazyBranch("SideBolster")
+
     def __init__(self, name, parent):
         """Create a new Backrest model."""
         super().__init__(parent)
@@ -53,5 +65,3 @@ def __init__(self, name, parent):
         self.IsReclineBackwardEngaged = DataPointBoolean(
             "IsReclineBackwardEngaged", self
         )
-        self.Lumbar = Lumbar("Lumbar", self)
-        self.SideBolster = SideBolster("SideBolster", self)
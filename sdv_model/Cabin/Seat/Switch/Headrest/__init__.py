@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class Headrest(Model):
@@ -41,6 +42,13 @@ class Headrest(Model):
 
     """
 
+    __slots__ = (
+        "IsUpEngaged",
+        "IsDownEngaged",
+        "IsForwardEngaged",
+        "IsBackwardEngaged",
+    )
+
     def __init__(self, name, parent):
         """Create a new Headrest model."""
         super().__init__(parent)
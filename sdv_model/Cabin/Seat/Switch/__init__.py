@@ -19,12 +19,19 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Seat.Switch.Backrest import Backrest
-from sdv_model.Cabin.Seat.Switch.Headrest import Headrest
-from sdv_model.Cabin.Seat.Switch.Massage import Massage
-from sdv_model.Cabin.Seat.Switch.Seating import Seating
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Backrest",
+        "Headrest",
+        "Massage",
+        "Seating",
+    ),
+)
 
 
 class Switch(Model):
@@ -70,6 +77,22 @@ class Switch(Model):
 
     """
 
+    __slots__ = (
+        "IsWarmerEngaged",
+        "IsCoolerEngaged",
+        "IsForwardEngaged",
+        "IsBackwardEngaged",
+        "IsUpEngaged",
+        "IsDownEngaged",
+        "IsTiltForwardEngaged",
+        "IsTiltBackwardEngaged",
+    )
+
+    Backrest = LazyBranch("Backrest")
+    Seating = LazyBranch("Seating")
+    Headrest = LazyBranch("Headrest")
+    Massage = LazyBranch("Massage")
+
     def __init__(self, name, parent):
         """Create a new Switch model."""
         super().__init__(parent)
@@ -83,7 +106,3 @@ def __init__(self, name, parent):
         self.IsDownEngaged = DataPointBoolean("IsDownEngaged", self)
         self.IsTiltForwardEngaged = DataPointBoolean("IsTiltForwardEngaged", self)
         self.IsTiltBackwardEngaged = DataPointBoolean("IsTiltBackwardEngaged", self)
-        self.Backrest = Backrest("Backrest", self)
-        self.Seating = Seating("Seating", self)
-        self.Headrest = Headrest("Headrest", self)
-        self.Massage = Massage("Massage", self)
@@ -19,21 +19,27 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointInt8,
     DataPointUint8,
     DataPointUint16,
-    Model,
 )
-
-from sdv_model.Cabin.Seat.Airbag import Airbag
-from sdv_model.Cabin.Seat.Backrest import Backrest
-from sdv_model.Cabin.Seat.Headrest import Headrest
-from sdv_model.Cabin.Seat.Occupant import Occupant
-from sdv_model.Cabin.Seat.Seating import Seating
-from sdv_model.Cabin.Seat.Switch import Switch
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Airbag",
+        "Backrest",
+        "Headrest",
+        "Occupant",
+        "Seating",
+        "Switch",
+    ),
+)
 
 
 class Seat(Model):
@@ -93,21 +99,32 @@ class Seat(Model):
 
     """
 
+    __slots__ = (
+        "IsOccupied",
+        "IsBelted",
+        "Heating",
+        "Massage",
+        "Position",
+        "Height",
+        "Tilt",
+    )
+
+    Occupant = LazyBranch("Occupant")
+    Backrest = LazyBranch("Backrest")
+    Seating = LazyBranch("Seating")
+    Headrest = LazyBranch("Headrest")
+    Airbag = LazyBranch("Airbag")
+    Switch = LazyBranch("Switch")
+
     def __init__(self, name, parent):
         """Create a new Seat model."""
         super().__init__(parent)
         self.name = name
 
         self.IsOccupied = DataPointBoolean("IsOccupied", self)
-        self.Occupant = Occupant("Occupant", self)
         self.IsBelted = DataPointBoolean("IsBelted", self)
         self.Heating = DataPointInt8("Heating", self)
         self.Massage = DataPointUint8("Massage", self)
         self.Position = DataPointUint16("Position", self)
         self.Height = DataPointUint16("Height", self)
         self.Tilt = DataPointFloat("Tilt", self)
-        self.Backrest = Backrest("Backrest", self)
-        self.Seating = Seating("Seating", self)
-        self.Headrest = Headrest("Headrest", self)
-        self.Airbag = Airbag("Airbag", self)
-        self.Switch = Switch("Switch", self)
@@ -14,8 +14,13 @@
 
 # pylint: disable=C0103
 
-from sdv.model import Service
+import asyncio
+import weakref
+from typing import Optional
 
+from sdv.model import Node, Service
+
+from sdv_model.channels import connect_service
 from sdv_model.proto.seats_pb2 import (
     CurrentPositionRequest,
     MoveComponentRequest,
@@ -48,11 +53,40 @@ class SeatService(Service):
     CurrentPosition(row=int, index=int)
         Get the current position of the addressed seat
 
+    close()
+        Release the channel to the service
+
     """
 
     def __init__(self):
-        super().__init__()
-        self._stub = SeatsStub(self.channel)
+        # The channel to the service is only taken from the pool by the first
+        # call. The pool shares it with the other services at the same address.
+        Node.__init__(self)  # pylint: disable=W0233
+        self.address = None
+        self.channel = None
+        self.metadata = None
+        self._stub: Optional[SeatsStub] = None
+        self._loop: Optional["weakref.ref[asyncio.AbstractEventLoop]"] = None
+
+    def _connect(self) -> SeatsStub:
+        # channels are bound to the event loop they were created in
+        loop = asyncio.get_running_loop()
+        if self._stub is None or self._loop is None or self._loop() is not loop:
+            self.address, self.channel, self.metadata = connect_service(self.name)
+            self._stub = SeatsStub(self.channel)
+            self._loop = weakref.ref(loop)
+        return self._stub
+
+    async def close(self):
+        """
+        Summary
+        -------
+            Release the channel to the service. The next call takes a channel
+            from the pool again. The pooled channels stay open for the other
+            services, get_channel_pool().close() closes them.
+        """
+        self.channel = None
+        self._stub = None
 
     async def Move(self, seat: Seat):
         """
@@ -72,7 +106,9 @@ async def Move(self, seat: Seat):
             * INVALID_ARGUMENT - At least one of the requested component positions is invalid
             * INTERNAL - A seat service internal error happened - see error message for details
         """
-        response = await self._stub.Move(MoveRequest(seat=seat), metadata=self.metadata)
+        response = await self._connect().Move(
+            MoveRequest(seat=seat), metadata=self.metadata
+        )
         return response
 
     async def MoveComponent(
@@ -100,7 +136,7 @@ async def MoveComponent(
             * INTERNAL - A seat service internal error happened - see error message for details
 
         """
-        response = await self._stub.MoveComponent(
+        response = await self._connect().MoveComponent(
             MoveComponentRequest(
                 seat=seatLocation,
                 component=component,  # type: ignore
@@ -124,7 +160,7 @@ async def CurrentPosition(self, row: int, index: int):
             * OK - Seat positions returned
             * OUT_OF_RANGE - The addressed seat is not present in this vehicle
         """
-        response = await self._stub.CurrentPosition(
+        response = await self._connect().CurrentPosition(
             CurrentPositionRequest(row=row, index=index),
             metadata=self.metadata,
         )
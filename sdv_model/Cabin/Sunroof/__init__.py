@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointInt8, DataPointString, Model
+from sdv_model.datapoints import DataPointInt8, DataPointString
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Cabin.Sunroof.Shade import Shade
+__getattr__ = lazy_import(__name__, ("Shade",))
 
 
 class Sunroof(Model):
@@ -42,6 +44,10 @@ class Sunroof(Model):
 
     """
 
+    __slots__ = ("Position", "Switch")
+
+    Shade = LazyBranch("Shade")
+
     def __init__(self, name, parent):
         """Create a new Sunroof model."""
         super().__init__(parent)
@@ -49,4 +55,3 @@ def __init__(self, name, parent):
 
         self.Position = DataPointInt8("Position", self)
         self.Switch = DataPointString("Switch", self)
-        self.Shade = Shade("Shade", self)
@@ -19,18 +19,26 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointUint8, DataPointUint8Array, Model
-
-from sdv_model.Cabin.Convertible import Convertible
-from sdv_model.Cabin.Door import Door
-from sdv_model.Cabin.HVAC import HVAC
-from sdv_model.Cabin.Infotainment import Infotainment
-from sdv_model.Cabin.Lights import Lights
-from sdv_model.Cabin.RearShade import RearShade
-from sdv_model.Cabin.RearviewMirror import RearviewMirror
-from sdv_model.Cabin.Seat import Seat
 from sdv_model.Cabin.SeatService import SeatService
-from sdv_model.Cabin.Sunroof import Sunroof
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointUint8, DataPointUint8Array
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Convertible",
+        "Door",
+        "HVAC",
+        "Infotainment",
+        "Lights",
+        "RearShade",
+        "RearviewMirror",
+        "Seat",
+        "Sunroof",
+    ),
+)
 
 
 class Cabin(Model):
@@ -85,90 +93,94 @@ class Cabin(Model):
 
     """
 
+    __slots__ = (
+        "DoorCount",
+        "SeatService",
+        "DriverPosition",
+        "SeatRowCount",
+        "SeatPosCount",
+    )
+
+    RearShade = LazyBranch("RearShade")
+    HVAC = LazyBranch("HVAC")
+    Infotainment = LazyBranch("Infotainment")
+    Sunroof = LazyBranch("Sunroof")
+    RearviewMirror = LazyBranch("RearviewMirror")
+    Lights = LazyBranch("Lights")
+    Door = LazyBranch("DoorCollection")
+    Seat = LazyBranch("SeatCollection")
+    Convertible = LazyBranch("Convertible")
+
     def __init__(self, name, parent):
         """Create a new Cabin model."""
         super().__init__(parent)
         self.name = name
 
-        self.RearShade = RearShade("RearShade", self)
-        self.HVAC = HVAC("HVAC", self)
-        self.Infotainment = Infotainment("Infotainment", self)
-        self.Sunroof = Sunroof("Sunroof", self)
-        self.RearviewMirror = RearviewMirror("RearviewMirror", self)
-        self.Lights = Lights("Lights", self)
-        self.Door = DoorCollection("Door", self)
         self.DoorCount = DataPointUint8("DoorCount", self)
         self.SeatService = SeatService()
-        self.Seat = SeatCollection("Seat", self)
         self.DriverPosition = DataPointUint8("DriverPosition", self)
         self.SeatRowCount = DataPointUint8("SeatRowCount", self)
         self.SeatPosCount = DataPointUint8Array("SeatPosCount", self)
-        self.Convertible = Convertible("Convertible", self)
 
 
-class DoorCollection(Model):
+class DoorCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Row1", "Row2")
+
+    Row1 = LazyBranch("DoorCollection.RowType")
+    Row2 = LazyBranch("DoorCollection.RowType")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Row1 = self.RowType("Row1", self)
-        self.Row2 = self.RowType("Row2", self)
 
     def Row(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Row1,
-            2: self.Row2,
-        }
-        return _options.get(index)
-
-    class RowType(Model):
+        return self._element(index)
+
+    class RowType(Collection):
+        __slots__ = ()
+
+        _elements = ("Left", "Right")
+
+        Left = LazyBranch("Door")
+        Right = LazyBranch("Door")
+
         def __init__(self, name, parent):
             super().__init__(parent)
             self.name = name
-            self.Left = Door("Left", self)
-            self.Right = Door("Right", self)
 
         def element(self, index: int):
-            if index < 1 or index > 2:
-                raise IndexError(f"Index {index} is out of range [1, 2]")
-            _options = {
-                1: self.Left,
-                2: self.Right,
-            }
-            return _options.get(index)
+            return self._element(index)
 
 
-class SeatCollection(Model):
+class SeatCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Row1", "Row2")
+
+    Row1 = LazyBranch("SeatCollection.RowType")
+    Row2 = LazyBranch("SeatCollection.RowType")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Row1 = self.RowType("Row1", self)
-        self.Row2 = self.RowType("Row2", self)
 
     def Row(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Row1,
-            2: self.Row2,
-        }
-        return _options.get(index)
-
-    class RowType(Model):
+        return self._element(index)
+
+    class RowType(Collection):
+        __slots__ = ()
+
+        _elements = ("Pos1", "Pos2", "Pos3")
+
+        Pos1 = LazyBranch("Seat")
+        Pos2 = LazyBranch("Seat")
+        Pos3 = LazyBranch("Seat")
+
         def __init__(self, name, parent):
             super().__init__(parent)
             self.name = name
-            self.Pos1 = Seat("Pos1", self)
-            self.Pos2 = Seat("Pos2", self)
-            self.Pos3 = Seat("Pos3", self)
 
         def Pos(self, index: int):
-            if index < 1 or index > 3:
-                raise IndexError(f"Index {index} is out of range [1, 3]")
-            _options = {
-                1: self.Pos1,
-                2: self.Pos2,
-                3: self.Pos3,
-            }
-            return _options.get(index)
+            return self._element(index)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointUint8, Model
+from sdv_model.datapoints import DataPointUint8
+from sdv_model.model import Model
 
 
 class Accelerator(Model):
@@ -34,6 +35,8 @@ class Accelerator(Model):
         Unit: percent
     """
 
+    __slots__ = ("PedalPosition",)
+
     def __init__(self, name, parent):
         """Create a new Accelerator model."""
         super().__init__(parent)
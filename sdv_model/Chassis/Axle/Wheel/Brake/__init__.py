@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointUint8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointUint8
+from sdv_model.model import Model
 
 
 class Brake(Model):
@@ -45,6 +46,8 @@ class Brake(Model):
 
     """
 
+    __slots__ = ("FluidLevel", "IsFluidLevelLow", "PadWear", "IsBrakesWorn")
+
     def __init__(self, name, parent):
         """Create a new Brake model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointFloat, DataPointUint16, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointFloat, DataPointUint16
+from sdv_model.model import Model
 
 
 class Tire(Model):
@@ -40,6 +41,8 @@ class Tire(Model):
         Unit: celsius
     """
 
+    __slots__ = ("Pressure", "IsPressureLow", "Temperature")
+
     def __init__(self, name, parent):
         """Create a new Tire model."""
         super().__init__(parent)
@@ -19,10 +19,17 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Chassis.Axle.Wheel.Brake import Brake
-from sdv_model.Chassis.Axle.Wheel.Tire import Tire
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Brake",
+        "Tire",
+    ),
+)
 
 
 class Wheel(Model):
@@ -42,11 +49,14 @@ class Wheel(Model):
         Unit: km/h
     """
 
+    __slots__ = ("Speed",)
+
+    Brake = LazyBranch("Brake")
+    Tire = LazyBranch("Tire")
+
     def __init__(self, name, parent):
         """Create a new Wheel model."""
         super().__init__(parent)
         self.name = name
 
-        self.Brake = Brake("Brake", self)
-        self.Tire = Tire("Tire", self)
         self.Speed = DataPointFloat("Speed", self)
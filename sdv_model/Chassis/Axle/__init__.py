@@ -19,9 +19,12 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, DataPointUint8, DataPointUint16, Model
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointFloat, DataPointUint8, DataPointUint16
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Chassis.Axle.Wheel import Wheel
+__getattr__ = lazy_import(__name__, ("Wheel",))
 
 
 class Axle(Model):
@@ -57,6 +60,17 @@ class Axle(Model):
 
     """
 
+    __slots__ = (
+        "WheelCount",
+        "WheelDiameter",
+        "WheelWidth",
+        "TireDiameter",
+        "TireWidth",
+        "TireAspectRatio",
+    )
+
+    Wheel = LazyBranch("WheelCollection")
+
     def __init__(self, name, parent):
         """Create a new Axle model."""
         super().__init__(parent)
@@ -68,21 +82,19 @@ def __init__(self, name, parent):
         self.TireDiameter = DataPointFloat("TireDiameter", self)
         self.TireWidth = DataPointUint16("TireWidth", self)
         self.TireAspectRatio = DataPointUint8("TireAspectRatio", self)
-        self.Wheel = WheelCollection("Wheel", self)
 
 
-class WheelCollection(Model):
+class WheelCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Left", "Right")
+
+    Left = LazyBranch("Wheel")
+    Right = LazyBranch("Wheel")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Left = Wheel("Left", self)
-        self.Right = Wheel("Right", self)
 
     def element(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Left,
-            2: self.Right,
-        }
-        return _options.get(index)
+        return self._element(index)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointInt16, DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointInt16, DataPointString, DataPointUint8
+from sdv_model.model import Model
 
 
 class SteeringWheel(Model):
@@ -47,6 +48,8 @@ class SteeringWheel(Model):
         Allowed values: FRONT_LEFT, FRONT_RIGHT
     """
 
+    __slots__ = ("Angle", "Tilt", "Extension", "Position")
+
     def __init__(self, name, parent):
         """Create a new SteeringWheel model."""
         super().__init__(parent)
@@ -19,13 +19,21 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointUint8, DataPointUint16, Model
-
-from sdv_model.Chassis.Accelerator import Accelerator
-from sdv_model.Chassis.Axle import Axle
-from sdv_model.Chassis.Brake import Brake
-from sdv_model.Chassis.ParkingBrake import ParkingBrake
-from sdv_model.Chassis.SteeringWheel import SteeringWheel
+from sdv_model.collection import Collection
+from sdv_model.datapoints import DataPointUint8, DataPointUint16
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Accelerator",
+        "Axle",
+        "Brake",
+        "ParkingBrake",
+        "SteeringWheel",
+    ),
+)
 
 
 class Chassis(Model):
@@ -61,6 +69,14 @@ class Chassis(Model):
 
     """
 
+    __slots__ = ("Wheelbase", "Track", "AxleCount")
+
+    Axle = LazyBranch("AxleCollection")
+    ParkingBrake = LazyBranch("ParkingBrake")
+    SteeringWheel = LazyBranch("SteeringWheel")
+    Accelerator = LazyBranch("Accelerator")
+    Brake = LazyBranch("Brake")
+
     def __init__(self, name, parent):
         """Create a new Chassis model."""
         super().__init__(parent)
@@ -68,26 +84,20 @@ def __init__(self, name, parent):
 
         self.Wheelbase = DataPointUint16("Wheelbase", self)
         self.Track = DataPointUint16("Track", self)
-        self.Axle = AxleCollection("Axle", self)
         self.AxleCount = DataPointUint8("AxleCount", self)
-        self.ParkingBrake = ParkingBrake("ParkingBrake", self)
-        self.SteeringWheel = SteeringWheel("SteeringWheel", self)
-        self.Accelerator = Accelerator("Accelerator", self)
-        self.Brake = Brake("Brake", self)
 
 
-class AxleCollection(Model):
+class AxleCollection(Collection):
+    __slots__ = ()
+
+    _elements = ("Row1", "Row2")
+
+    Row1 = LazyBranch("Axle")
+    Row2 = LazyBranch("Axle")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Row1 = Axle("Row1", self)
-        self.Row2 = Axle("Row2", self)
 
     def Row(self, index: int):
-        if index < 1 or index > 2:
-            raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {
-            1: self.Row1,
-            2: self.Row2,
-        }
-        return _options.get(index)
+        return self._element(index)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, Model
+from sdv_model.datapoints import DataPointBoolean
+from sdv_model.model import Model
 
 
 class Connectivity(Model):
@@ -34,6 +35,8 @@ class Connectivity(Model):
 
     """
 
+    __slots__ = ("IsConnectivityAvailable",)
+
     def __init__(self, name, parent):
         """Create a new Connectivity model."""
         super().__init__(parent)
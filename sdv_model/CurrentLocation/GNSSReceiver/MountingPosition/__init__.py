@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointInt16, Model
+from sdv_model.datapoints import DataPointInt16
+from sdv_model.model import Model
 
 
 class MountingPosition(Model):
@@ -41,6 +42,8 @@ class MountingPosition(Model):
         Unit: mm
     """
 
+    __slots__ = ("X", "Y", "Z")
+
     def __init__(self, name, parent):
         """Create a new MountingPosition model."""
         super().__init__(parent)
@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.CurrentLocation.GNSSReceiver.MountingPosition import MountingPosition
+__getattr__ = lazy_import(__name__, ("MountingPosition",))
 
 
 class GNSSReceiver(Model):
@@ -38,10 +40,13 @@ class GNSSReceiver(Model):
 
     """
 
+    __slots__ = ("FixType",)
+
+    MountingPosition = LazyBranch("MountingPosition")
+
     def __init__(self, name, parent):
         """Create a new GNSSReceiver model."""
         super().__init__(parent)
         self.name = name
 
         self.FixType = DataPointString("FixType", self)
-        self.MountingPosition = MountingPosition("MountingPosition", self)
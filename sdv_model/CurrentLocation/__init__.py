@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointDouble, DataPointString, Model
+from sdv_model.datapoints import DataPointDouble, DataPointString
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.CurrentLocation.GNSSReceiver import GNSSReceiver
+__getattr__ = lazy_import(__name__, ("GNSSReceiver",))
 
 
 class CurrentLocation(Model):
@@ -64,6 +66,18 @@ class CurrentLocation(Model):
 
     """
 
+    __slots__ = (
+        "Timestamp",
+        "Latitude",
+        "Longitude",
+        "Heading",
+        "HorizontalAccuracy",
+        "Altitude",
+        "VerticalAccuracy",
+    )
+
+    GNSSReceiver = LazyBranch("GNSSReceiver")
+
     def __init__(self, name, parent):
         """Create a new CurrentLocation model."""
         super().__init__(parent)
@@ -76,4 +90,3 @@ def __init__(self, name, parent):
         self.HorizontalAccuracy = DataPointDouble("HorizontalAccuracy", self)
         self.Altitude = DataPointDouble("Altitude", self)
         self.VerticalAccuracy = DataPointDouble("VerticalAccuracy", self)
-        self.GNSSReceiver = GNSSReceiver("GNSSReceiver", self)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.model import Model
 
 
 class Identifier(Model):
@@ -35,6 +36,8 @@ class Identifier(Model):
 
     """
 
+    __slots__ = ("Subject", "Issuer")
+
     def __init__(self, name, parent):
         """Create a new Identifier model."""
         super().__init__(parent)
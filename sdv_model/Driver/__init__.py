@@ -19,9 +19,11 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointFloat, DataPointUint16, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointFloat, DataPointUint16
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.Driver.Identifier import Identifier
+__getattr__ = lazy_import(__name__, ("Identifier",))
 
 
 class Driver(Model):
@@ -55,12 +57,21 @@ class Driver(Model):
 
     """
 
+    __slots__ = (
+        "DistractionLevel",
+        "IsEyesOnRoad",
+        "AttentiveProbability",
+        "FatigueLevel",
+        "HeartRate",
+    )
+
+    Identifier = LazyBranch("Identifier")
+
     def __init__(self, name, parent):
         """Create a new Driver model."""
         super().__init__(parent)
         self.name = name
 
-        self.Identifier = Identifier("Identifier", self)
         self.DistractionLevel = DataPointFloat("DistractionLevel", self)
         self.IsEyesOnRoad = DataPointBoolean("IsEyesOnRoad", self)
         self.AttentiveProbability = DataPointFloat("AttentiveProbability", self)
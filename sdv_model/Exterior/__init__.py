@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class Exterior(Model):
@@ -45,6 +46,8 @@ class Exterior(Model):
         Unit: percent
     """
 
+    __slots__ = ("AirTemperature", "Humidity", "LightIntensity")
+
     def __init__(self, name, parent):
         """Create a new Exterior model."""
         super().__init__(parent)
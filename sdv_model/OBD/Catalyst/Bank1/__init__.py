@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class Bank1(Model):
@@ -37,6 +38,8 @@ class Bank1(Model):
         Unit: celsius
     """
 
+    __slots__ = ("Temperature1", "Temperature2")
+
     def __init__(self, name, parent):
         """Create a new Bank1 model."""
         super().__init__(parent)
@@ -19,10 +19,16 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import Model
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
 
-from sdv_model.OBD.Catalyst.Bank1 import Bank1
-from sdv_model.OBD.Catalyst.Bank2 import Bank2
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Bank1",
+        "Bank2",
+    ),
+)
 
 
 class Catalyst(Model):
@@ -38,10 +44,12 @@ class Catalyst(Model):
 
     """
 
+    __slots__ = ()
+
+    Bank1 = LazyBranch("Bank1")
+    Bank2 = LazyBranch("Bank2")
+
     def __init__(self, name, parent):
         """Create a new Catalyst model."""
         super().__init__(parent)
         self.name = name
-
-        self.Bank1 = Bank1("Bank1", self)
-        self.Bank2 = Bank2("Bank2", self)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointString, DataPointUint8, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointString, DataPointUint8
+from sdv_model.model import Model
 
 
 class DriveCycleStatus(Model):
@@ -39,6 +40,8 @@ class DriveCycleStatus(Model):
         Allowed values: SPARK, COMPRESSION
     """
 
+    __slots__ = ("IsMILOn", "DTCCount", "IgnitionType")
+
     def __init__(self, name, parent):
         """Create a new DriveCycleStatus model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class O2(Model):
@@ -37,6 +38,8 @@ class O2(Model):
         Unit: percent
     """
 
+    __slots__ = ("Voltage", "ShortTermFuelTrim")
+
     def __init__(self, name, parent):
         """Create a new O2 model."""
         super().__init__(parent)
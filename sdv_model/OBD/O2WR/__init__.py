@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class O2WR(Model):
@@ -40,6 +41,8 @@ class O2WR(Model):
         Unit: A
     """
 
+    __slots__ = ("Lambda", "Voltage", "Current")
+
     def __init__(self, name, parent):
         """Create a new O2WR model."""
         super().__init__(parent)
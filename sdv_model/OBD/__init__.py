@@ -19,21 +19,28 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.collection import Collection
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointString,
     DataPointStringArray,
     DataPointUint8,
     DataPointUint32,
-    Model,
 )
-
-from sdv_model.OBD.Catalyst import Catalyst
-from sdv_model.OBD.DriveCycleStatus import DriveCycleStatus
-from sdv_model.OBD.O2 import O2
-from sdv_model.OBD.O2WR import O2WR
-from sdv_model.OBD.Status import Status
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Catalyst",
+        "DriveCycleStatus",
+        "O2",
+        "O2WR",
+        "Status",
+    ),
+)
 
 
 class OBD(Model):
@@ -321,13 +328,90 @@ class OBD(Model):
         Unit: l/h
     """
 
+    __slots__ = (
+        "PidsA",
+        "DTCList",
+        "FreezeDTC",
+        "FuelStatus",
+        "EngineLoad",
+        "CoolantTemperature",
+        "ShortTermFuelTrim1",
+        "LongTermFuelTrim1",
+        "ShortTermFuelTrim2",
+        "LongTermFuelTrim2",
+        "FuelPressure",
+        "MAP",
+        "EngineSpeed",
+        "Speed",
+        "TimingAdvance",
+        "IntakeTemp",
+        "MAF",
+        "ThrottlePosition",
+        "AirStatus",
+        "OxygenSensorsIn2Banks",
+        "OBDStandards",
+        "OxygenSensorsIn4Banks",
+        "IsPTOActive",
+        "RunTime",
+        "PidsB",
+        "DistanceWithMIL",
+        "FuelRailPressureVac",
+        "FuelRailPressureDirect",
+        "CommandedEGR",
+        "EGRError",
+        "CommandedEVAP",
+        "FuelLevel",
+        "WarmupsSinceDTCClear",
+        "DistanceSinceDTCClear",
+        "EVAPVaporPressure",
+        "BarometricPressure",
+        "PidsC",
+        "ControlModuleVoltage",
+        "AbsoluteLoad",
+        "CommandedEquivalenceRatio",
+        "RelativeThrottlePosition",
+        "AmbientAirTemperature",
+        "ThrottlePositionB",
+        "ThrottlePositionC",
+        "AcceleratorPositionD",
+        "AcceleratorPositionE",
+        "AcceleratorPositionF",
+        "ThrottleActuator",
+        "RunTimeMIL",
+        "TimeSinceDTCCleared",
+        "MaxMAF",
+        "FuelType",
+        "EthanolPercent",
+        "EVAPVaporPressureAbsolute",
+        "EVAPVaporPressureAlternate",
+        "ShortTermO2Trim1",
+        "ShortTermO2Trim3",
+        "LongTermO2Trim1",
+        "LongTermO2Trim3",
+        "ShortTermO2Trim2",
+        "ShortTermO2Trim4",
+        "LongTermO2Trim2",
+        "LongTermO2Trim4",
+        "FuelRailPressureAbsolute",
+        "RelativeAcceleratorPosition",
+        "HybridBatteryRemaining",
+        "OilTemperature",
+        "FuelInjectionTiming",
+        "FuelRate",
+    )
+
+    Status = LazyBranch("Status")
+    O2 = LazyBranch("O2Collection")
+    O2WR = LazyBranch("O2WRCollection")
+    Catalyst = LazyBranch("Catalyst")
+    DriveCycleStatus = LazyBranch("DriveCycleStatus")
+
     def __init__(self, name, parent):
         """Create a new OBD model."""
         super().__init__(parent)
         self.name = name
 
         self.PidsA = DataPointUint32("PidsA", self)
-        self.Status = Status("Status", self)
         self.DTCList = DataPointStringArray("DTCList", self)
         self.FreezeDTC = DataPointString("FreezeDTC", self)
         self.FuelStatus = DataPointString("FuelStatus", self)
@@ -347,7 +431,6 @@ def __init__(self, name, parent):
         self.ThrottlePosition = DataPointFloat("ThrottlePosition", self)
         self.AirStatus = DataPointString("AirStatus", self)
         self.OxygenSensorsIn2Banks = DataPointUint8("OxygenSensorsIn2Banks", self)
-        self.O2 = O2Collection("O2", self)
         self.OBDStandards = DataPointUint8("OBDStandards", self)
         self.OxygenSensorsIn4Banks = DataPointUint8("OxygenSensorsIn4Banks", self)
         self.IsPTOActive = DataPointBoolean("IsPTOActive", self)
@@ -356,7 +439,6 @@ def __init__(self, name, parent):
         self.DistanceWithMIL = DataPointFloat("DistanceWithMIL", self)
         self.FuelRailPressureVac = DataPointFloat("FuelRailPressureVac", self)
         self.FuelRailPressureDirect = DataPointFloat("FuelRailPressureDirect", self)
-        self.O2WR = O2WRCollection("O2WR", self)
         self.CommandedEGR = DataPointFloat("CommandedEGR", self)
         self.EGRError = DataPointFloat("EGRError", self)
         self.CommandedEVAP = DataPointFloat("CommandedEVAP", self)
@@ -365,9 +447,7 @@ def __init__(self, name, parent):
         self.DistanceSinceDTCClear = DataPointFloat("DistanceSinceDTCClear", self)
         self.EVAPVaporPressure = DataPointFloat("EVAPVaporPressure", self)
         self.BarometricPressure = DataPointFloat("BarometricPressure", self)
-        self.Catalyst = Catalyst("Catalyst", self)
         self.PidsC = DataPointUint32("PidsC", self)
-        self.DriveCycleStatus = DriveCycleStatus("DriveCycleStatus", self)
         self.ControlModuleVoltage = DataPointFloat("ControlModuleVoltage", self)
         self.AbsoluteLoad = DataPointFloat("AbsoluteLoad", self)
         self.CommandedEquivalenceRatio = DataPointFloat(
@@ -410,59 +490,63 @@ def __init__(self, name, parent):
         self.FuelRate = DataPointFloat("FuelRate", self)
 
 
-class O2Collection(Model):
+class O2Collection(Collection):
+    __slots__ = ()
+
+    _elements = (
+        "Sensor1",
+        "Sensor2",
+        "Sensor3",
+        "Sensor4",
+        "Sensor5",
+        "Sensor6",
+        "Sensor7",
+        "Sensor8",
+    )
+
+    Sensor1 = LazyBranch("O2")
+    Sensor2 = LazyBranch("O2")
+    Sensor3 = LazyBranch("O2")
+    Sensor4 = LazyBranch("O2")
+    Sensor5 = LazyBranch("O2")
+    Sensor6 = LazyBranch("O2")
+    Sensor7 = LazyBranch("O2")
+    Sensor8 = LazyBranch("O2")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Sensor1 = O2("Sensor1", self)
-        self.Sensor2 = O2("Sensor2", self)
-        self.Sensor3 = O2("Sensor3", self)
-        self.Sensor4 = O2("Sensor4", self)
-        self.Sensor5 = O2("Sensor5", self)
-        self.Sensor6 = O2("Sensor6", self)
-        self.Sensor7 = O2("Sensor7", self)
-        self.Sensor8 = O2("Sensor8", self)
 
     def Sensor(self, index: int):
-        if index < 1 or index > 8:
-            raise IndexError(f"Index {index} is out of range [1, 8]")
-        _options = {
-            1: self.Sensor1,
-            2: self.Sensor2,
-            3: self.Sensor3,
-            4: self.Sensor4,
-            5: self.Sensor5,
-            6: self.Sensor6,
-            7: self.Sensor7,
-            8: self.Sensor8,
-        }
-        return _options.get(index)
-
-
-class O2WRCollection(Model):
+        return self._element(index)
+
+
+class O2WRCollection(Collection):
+    __slots__ = ()
+
+    _elements = (
+        "Sensor1",
+        "Sensor2",
+        "Sensor3",
+        "Sensor4",
+        "Sensor5",
+        "Sensor6",
+        "Sensor7",
+        "Sensor8",
+    )
+
+    Sensor1 = LazyBranch("O2WR")
+    Sensor2 = LazyBranch("O2WR")
+    Sensor3 = LazyBranch("O2WR")
+    Sensor4 = LazyBranch("O2WR")
+    Sensor5 = LazyBranch("O2WR")
+    Sensor6 = LazyBranch("O2WR")
+    Sensor7 = LazyBranch("O2WR")
+    Sensor8 = LazyBranch("O2WR")
+
     def __init__(self, name, parent):
         super().__init__(parent)
         self.name = name
-        self.Sensor1 = O2WR("Sensor1", self)
-        self.Sensor2 = O2WR("Sensor2", self)
-        self.Sensor3 = O2WR("Sensor3", self)
-        self.Sensor4 = O2WR("Sensor4", self)
-        self.Sensor5 = O2WR("Sensor5", self)
-        self.Sensor6 = O2WR("Sensor6", self)
-        self.Sensor7 = O2WR("Sensor7", self)
-        self.Sensor8 = O2WR("Sensor8", self)
 
     def Sensor(self, index: int):
-        if index < 1 or index > 8:
-            raise IndexError(f"Index {index} is out of range [1, 8]")
-        _options = {
-            1: self.Sensor1,
-            2: self.Sensor2,
-            3: self.Sensor3,
-            4: self.Sensor4,
-            5: self.Sensor5,
-            6: self.Sensor6,
-            7: self.Sensor7,
-            8: self.Sensor8,
-        }
-        return _options.get(index)
+        return self._element(index)
@@ -19,13 +19,13 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointUint8,
     DataPointUint32,
-    Model,
 )
+from sdv_model.model import Model
 
 
 class DieselExhaustFluid(Model):
@@ -51,6 +51,8 @@ class DieselExhaustFluid(Model):
 
     """
 
+    __slots__ = ("Capacity", "Level", "Range", "IsLevelLow")
+
     def __init__(self, name, parent):
         """Create a new DieselExhaustFluid model."""
         super().__init__(parent)
@@ -19,7 +19,7 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointInt16,
@@ -27,12 +27,16 @@
     DataPointString,
     DataPointUint8,
     DataPointUint16,
-    Model,
 )
-
-from sdv_model.Powertrain.CombustionEngine.DieselExhaustFluid import DieselExhaustFluid
-from sdv_model.Powertrain.CombustionEngine.DieselParticulateFilter import (
-    DieselParticulateFilter,
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "DieselExhaustFluid",
+        "DieselParticulateFilter",
+    ),
 )
 
 
@@ -163,6 +167,39 @@ class CombustionEngine(Model):
 
     """
 
+    __slots__ = (
+        "EngineCode",
+        "Displacement",
+        "StrokeLength",
+        "Bore",
+        "Configuration",
+        "NumberOfCylinders",
+        "NumberOfValvesPerCylinder",
+        "CompressionRatio",
+        "EngineOilCapacity",
+        "EngineCoolantCapacity",
+        "MaxPower",
+        "MaxTorque",
+        "AspirationType",
+        "EngineOilLevel",
+        "OilLifeRemaining",
+        "IsRunning",
+        "Speed",
+        "EngineHours",
+        "IdleHours",
+        "ECT",
+        "EOT",
+        "MAP",
+        "MAF",
+        "TPS",
+        "EOP",
+        "Power",
+        "Torque",
+    )
+
+    DieselExhaustFluid = LazyBranch("DieselExhaustFluid")
+    DieselParticulateFilter = LazyBranch("DieselParticulateFilter")
+
     def __init__(self, name, parent):
         """Create a new CombustionEngine model."""
         super().__init__(parent)
@@ -197,7 +234,3 @@ def __init__(self, name, parent):
         self.EOP = DataPointUint16("EOP", self)
         self.Power = DataPointUint16("Power", self)
         self.Torque = DataPointUint16("Torque", self)
-        self.DieselExhaustFluid = DieselExhaustFluid("DieselExhaustFluid", self)
-        self.DieselParticulateFilter = DieselParticulateFilter(
-            "DieselParticulateFilter", self
-        )
@@ -19,13 +19,13 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointInt16,
     DataPointInt32,
     DataPointString,
     DataPointUint16,
-    Model,
 )
+from sdv_model.model import Model
 
 
 class ElectricMotor(Model):
@@ -74,6 +74,19 @@ class ElectricMotor(Model):
         Unit: Nm
     """
 
+    __slots__ = (
+        "EngineCode",
+        "MaxPower",
+        "MaxTorque",
+        "MaxRegenPower",
+        "MaxRegenTorque",
+        "Speed",
+        "Temperature",
+        "CoolantTemperature",
+        "Power",
+        "Torque",
+    )
+
     def __init__(self, name, parent):
         """Create a new ElectricMotor model."""
         super().__init__(parent)
@@ -19,15 +19,15 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointString,
     DataPointStringArray,
     DataPointUint8,
     DataPointUint32,
-    Model,
 )
+from sdv_model.model import Model
 
 
 class FuelSystem(Model):
@@ -90,6 +90,21 @@ class FuelSystem(Model):
 
     """
 
+    __slots__ = (
+        "SupportedFuelTypes",
+        "SupportedFuel",
+        "HybridType",
+        "TankCapacity",
+        "Level",
+        "Range",
+        "InstantConsumption",
+        "AverageConsumption",
+        "ConsumptionSinceStart",
+        "TimeSinceStart",
+        "IsEngineStopStartEnabled",
+        "IsFuelLevelLow",
+    )
+
     def __init__(self, name, parent):
         """Create a new FuelSystem model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class ChargeCurrent(Model):
@@ -45,6 +46,8 @@ class ChargeCurrent(Model):
         Unit: A
     """
 
+    __slots__ = ("DC", "Phase1", "Phase2", "Phase3")
+
     def __init__(self, name, parent):
         """Create a new ChargeCurrent model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, Model
+from sdv_model.datapoints import DataPointString
+from sdv_model.model import Model
 
 
 class Timer(Model):
@@ -36,6 +37,8 @@ class Timer(Model):
 
     """
 
+    __slots__ = ("Mode", "Time")
+
     def __init__(self, name, parent):
         """Create a new Timer model."""
         super().__init__(parent)
@@ -19,22 +19,26 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointString,
     DataPointStringArray,
     DataPointUint8,
     DataPointUint32,
-    Model,
 )
-
-from sdv_model.Powertrain.TractionBattery.Charging.ChargeCurrent import ChargeCurrent
-from sdv_model.Powertrain.TractionBattery.Charging.ChargeVoltage import ChargeVoltage
-from sdv_model.Powertrain.TractionBattery.Charging.MaximumChargingCurrent import (
-    MaximumChargingCurrent,
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "ChargeCurrent",
+        "ChargeVoltage",
+        "MaximumChargingCurrent",
+        "Timer",
+    ),
 )
-from sdv_model.Powertrain.TractionBattery.Charging.Timer import Timer
 
 
 class Charging(Model):
@@ -113,15 +117,33 @@ class Charging(Model):
 
     """
 
+    __slots__ = (
+        "ChargeLimit",
+        "ChargePortFlap",
+        "IsChargingCableConnected",
+        "IsChargingCableLocked",
+        "ChargePlugType",
+        "Mode",
+        "IsCharging",
+        "IsDischarging",
+        "StartStopCharging",
+        "PowerLoss",
+        "Temperature",
+        "ChargeRate",
+        "TimeToComplete",
+    )
+
+    MaximumChargingCurrent = LazyBranch("MaximumChargingCurrent")
+    ChargeCurrent = LazyBranch("ChargeCurrent")
+    ChargeVoltage = LazyBranch("ChargeVoltage")
+    Timer = LazyBranch("Timer")
+
     def __init__(self, name, parent):
         """Create a new Charging model."""
         super().__init__(parent)
         self.name = name
 
         self.ChargeLimit = DataPointUint8("ChargeLimit", self)
-        self.MaximumChargingCurrent = MaximumChargingCurrent(
-            "MaximumChargingCurrent", self
-        )
         self.ChargePortFlap = DataPointString("ChargePortFlap", self)
         self.IsChargingCableConnected = DataPointBoolean(
             "IsChargingCableConnected", self
@@ -132,10 +154,7 @@ def __init__(self, name, parent):
         self.IsCharging = DataPointBoolean("IsCharging", self)
         self.IsDischarging = DataPointBoolean("IsDischarging", self)
         self.StartStopCharging = DataPointString("StartStopCharging", self)
-        self.ChargeCurrent = ChargeCurrent("ChargeCurrent", self)
-        self.ChargeVoltage = ChargeVoltage("ChargeVoltage", self)
         self.PowerLoss = DataPointFloat("PowerLoss", self)
         self.Temperature = DataPointFloat("Temperature", self)
         self.ChargeRate = DataPointFloat("ChargeRate", self)
         self.TimeToComplete = DataPointUint32("TimeToComplete", self)
-        self.Timer = Timer("Timer", self)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, Model
+from sdv_model.datapoints import DataPointFloat
+from sdv_model.model import Model
 
 
 class StateOfCharge(Model):
@@ -39,6 +40,8 @@ class StateOfCharge(Model):
         Unit: percent
     """
 
+    __slots__ = ("Current", "Displayed")
+
     def __init__(self, name, parent):
         """Create a new StateOfCharge model."""
         super().__init__(parent)
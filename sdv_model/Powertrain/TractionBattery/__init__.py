@@ -19,19 +19,25 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointString,
     DataPointUint16,
     DataPointUint32,
-    Model,
 )
-
-from sdv_model.Powertrain.TractionBattery.Charging import Charging
-from sdv_model.Powertrain.TractionBattery.DCDC import DCDC
-from sdv_model.Powertrain.TractionBattery.StateOfCharge import StateOfCharge
-from sdv_model.Powertrain.TractionBattery.Temperature import Temperature
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "Charging",
+        "DCDC",
+        "StateOfCharge",
+        "Temperature",
+    ),
+)
 
 
 class TractionBattery(Model):
@@ -132,6 +138,32 @@ class TractionBattery(Model):
 
     """
 
+    __slots__ = (
+        "Id",
+        "ProductionDate",
+        "IsPowerConnected",
+        "IsGroundConnected",
+        "GrossCapacity",
+        "NetCapacity",
+        "StateOfHealth",
+        "NominalVoltage",
+        "MaxVoltage",
+        "CurrentVoltage",
+        "CurrentCurrent",
+        "CurrentPower",
+        "AccumulatedChargedEnergy",
+        "AccumulatedConsumedEnergy",
+        "AccumulatedChargedThroughput",
+        "AccumulatedConsumedThroughput",
+        "PowerLoss",
+        "Range",
+    )
+
+    Temperature = LazyBranch("Temperature")
+    StateOfCharge = LazyBranch("StateOfCharge")
+    Charging = LazyBranch("Charging")
+    DCDC = LazyBranch("DCDC")
+
     def __init__(self, name, parent):
         """Create a new TractionBattery model."""
         super().__init__(parent)
@@ -141,11 +173,9 @@ def __init__(self, name, parent):
         self.ProductionDate = DataPointString("ProductionDate", self)
         self.IsPowerConnected = DataPointBoolean("IsPowerConnected", self)
         self.IsGroundConnected = DataPointBoolean("IsGroundConnected", self)
-        self.Temperature = Temperature("Temperature", self)
         self.GrossCapacity = DataPointUint16("GrossCapacity", self)
         self.NetCapacity = DataPointUint16("NetCapacity", self)
         self.StateOfHealth = DataPointFloat("StateOfHealth", self)
-        self.StateOfCharge = StateOfCharge("StateOfCharge", self)
         self.NominalVoltage = DataPointUint16("NominalVoltage", self)
         self.MaxVoltage = DataPointUint16("MaxVoltage", self)
         self.CurrentVoltage = DataPointFloat("CurrentVoltage", self)
@@ -163,5 +193,3 @@ def __init__(self, name, parent):
         )
         self.PowerLoss = DataPointFloat("PowerLoss", self)
         self.Range = DataPointUint32("Range", self)
-        self.Charging = Charging("Charging", self)
-        self.DCDC = DCDC("DCDC", self)
@@ -19,15 +19,15 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointInt8,
     DataPointInt16,
     DataPointString,
     DataPointUint8,
-    Model,
 )
+from sdv_model.model import Model
 
 
 class Transmission(Model):
@@ -108,6 +108,26 @@ class Transmission(Model):
         Unit: percent
     """
 
+    __slots__ = (
+        "Type",
+        "GearCount",
+        "DriveType",
+        "TravelledDistance",
+        "CurrentGear",
+        "SelectedGear",
+        "IsParkLockEngaged",
+        "IsLowRangeEngaged",
+        "IsElectricalPowertrainEngaged",
+        "PerformanceMode",
+        "GearChangeMode",
+        "Temperature",
+        "ClutchEngagement",
+        "ClutchWear",
+        "DiffLockFrontEngagement",
+        "DiffLockRearEngagement",
+        "TorqueDistribution",
+    )
+
     def __init__(self, name, parent):
         """Create a new Transmission model."""
         super().__init__(parent)
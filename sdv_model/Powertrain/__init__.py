@@ -19,13 +19,20 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointFloat, DataPointString, DataPointUint32, Model
-
-from sdv_model.Powertrain.CombustionEngine import CombustionEngine
-from sdv_model.Powertrain.ElectricMotor import ElectricMotor
-from sdv_model.Powertrain.FuelSystem import FuelSystem
-from sdv_model.Powertrain.TractionBattery import TractionBattery
-from sdv_model.Powertrain.Transmission import Transmission
+from sdv_model.datapoints import DataPointFloat, DataPointString, DataPointUint32
+from sdv_model.lazy import LazyBranch, lazy_import
+from sdv_model.model import Model
+
+__getattr__ = lazy_import(
+    __name__,
+    (
+        "CombustionEngine",
+        "ElectricMotor",
+        "FuelSystem",
+        "TractionBattery",
+        "Transmission",
+    ),
+)
 
 
 class Powertrain(Model):
@@ -64,6 +71,14 @@ class Powertrain(Model):
 
     """
 
+    __slots__ = ("AccumulatedBrakingEnergy", "Range", "Type")
+
+    CombustionEngine = LazyBranch("CombustionEngine")
+    Transmission = LazyBranch("Transmission")
+    ElectricMotor = LazyBranch("ElectricMotor")
+    TractionBattery = LazyBranch("TractionBattery")
+    FuelSystem = LazyBranch("FuelSystem")
+
     def __init__(self, name, parent):
         """Create a new Powertrain model."""
         super().__init__(parent)
@@ -72,8 +87,3 @@ def __init__(self, name, parent):
         self.AccumulatedBrakingEnergy = DataPointFloat("AccumulatedBrakingEnergy", self)
         self.Range = DataPointUint32("Range", self)
         self.Type = DataPointString("Type", self)
-        self.CombustionEngine = CombustionEngine("CombustionEngine", self)
-        self.Transmission = Transmission("Transmission", self)
-        self.ElectricMotor = ElectricMotor("ElectricMotor", self)
-        self.TractionBattery = TractionBattery("TractionBattery", self)
-        self.FuelSystem = FuelSystem("FuelSystem", self)
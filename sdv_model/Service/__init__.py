@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointBoolean, DataPointFloat, DataPointInt32, Model
+from sdv_model.datapoints import DataPointBoolean, DataPointFloat, DataPointInt32
+from sdv_model.model import Model
 
 
 class Service(Model):
@@ -40,6 +41,8 @@ class Service(Model):
         Unit: s
     """
 
+    __slots__ = ("IsServiceDue", "DistanceToService", "TimeToService")
+
     def __init__(self, name, parent):
         """Create a new Service model."""
         super().__init__(parent)
@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, DataPointUint16, Model
+from sdv_model.datapoints import DataPointString, DataPointUint16
+from sdv_model.model import Model
 
 
 class VehicleIdentification(Model):
@@ -83,6 +84,27 @@ class VehicleIdentification(Model):
 
     """
 
+    __slots__ = (
+        "VIN",
+        "WMI",
+        "Brand",
+        "Model",
+        "Year",
+        "AcrissCode",
+        "BodyType",
+        "DateVehicleFirstRegistered",
+        "MeetsEmissionStandard",
+        "ProductionDate",
+        "PurchaseDate",
+        "VehicleModelDate",
+        "VehicleConfiguration",
+        "VehicleSeatingCapacity",
+        "VehicleSpecialUsage",
+        "VehicleInteriorColor",
+        "VehicleInteriorType",
+        "KnownVehicleDamages",
+    )
+
     def __init__(self, name, parent):
         """Create a new VehicleIdentification model."""
         super().__init__(parent)
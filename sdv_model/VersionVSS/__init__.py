@@ -19,7 +19,8 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import DataPointString, DataPointUint32, Model
+from sdv_model.datapoints import DataPointString, DataPointUint32
+from sdv_model.model import Model
 
 
 class VersionVSS(Model):
@@ -41,6 +42,8 @@ class VersionVSS(Model):
 
     """
 
+    __slots__ = ("Major", "Minor", "Patch", "Label")
+
     def __init__(self, name, parent):
         """Create a new VersionVSS model."""
         super().__init__(parent)
@@ -19,31 +19,49 @@
 # pylint: disable=C0103,R0801,R0902,R0915,C0301,W0235
 
 
-from sdv.model import (
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
+
+from sdv.model import DataPoint
+
+from sdv_model.datapoints import (
     DataPointBoolean,
     DataPointFloat,
     DataPointInt16,
     DataPointString,
     DataPointUint16,
-    Model,
 )
-
-from sdv_model.Acceleration import Acceleration
-from sdv_model.ADAS import ADAS
-from sdv_model.AngularVelocity import AngularVelocity
-from sdv_model.Body import Body
-from sdv_model.Cabin import Cabin
-from sdv_model.Chassis import Chassis
-from sdv_model.Connectivity import Connectivity
-from sdv_model.CurrentLocation import CurrentLocation
-from sdv_model.Driver import Driver
-from sdv_model.Exterior import Exterior
-from sdv_model.OBD import OBD
-from sdv_model.Powertrain import Powertrain
-from sdv_model.Service import Service
-from sdv_model.Trailer import Trailer
-from sdv_model.VehicleIdentification import VehicleIdentification
-from sdv_model.VersionVSS import VersionVSS
+from sdv_model.lazy import LazyBranch, lazy_import, materialize
+from sdv_model.model import Model
+
+if TYPE_CHECKING:
+    from sdv_model.attributes import AttributeCache
+    from sdv_model.index import ModelNode, PathIndex
+    from sdv_model.mirror import Mirror
+    from sdv_model.multiplexer import SubscriptionMultiplexer
+    from sdv_model.validation import ValidationFailure
+
+_import_child = lazy_import(
+    __name__,
+    (
+        "Acceleration",
+        "ADAS",
+        "AngularVelocity",
+        "Body",
+        "Cabin",
+        "Chassis",
+        "Connectivity",
+        "CurrentLocation",
+        "Driver",
+        "Exterior",
+        "OBD",
+        "Powertrain",
+        "Service",
+        "Trailer",
+        "VehicleIdentification",
+        "VersionVSS",
+    ),
+)
 
 
 class Vehicle(Model):
@@ -174,15 +192,57 @@ class Vehicle(Model):
 
     """
 
-    def __init__(self, name):
-        """Create a new Vehicle model."""
+    __slots__ = (
+        "LowVoltageSystemState",
+        "Speed",
+        "TravelledDistance",
+        "TripMeterReading",
+        "IsBrokenDown",
+        "IsMoving",
+        "AverageSpeed",
+        "RoofLoad",
+        "CargoVolume",
+        "EmissionsCO2",
+        "CurrentOverallWeight",
+        "CurbWeight",
+        "GrossWeight",
+        "MaxTowWeight",
+        "MaxTowBallWeight",
+        "Length",
+        "Height",
+        "Width",
+        "_index",
+        "_attributes",
+        "_mirror",
+        "_multiplexer",
+    )
+
+    VersionVSS = LazyBranch("VersionVSS")
+    VehicleIdentification = LazyBranch("VehicleIdentification")
+    Acceleration = LazyBranch("Acceleration")
+    AngularVelocity = LazyBranch("AngularVelocity")
+    Trailer = LazyBranch("Trailer")
+    CurrentLocation = LazyBranch("CurrentLocation")
+    Powertrain = LazyBranch("Powertrain")
+    Body = LazyBranch("Body")
+    Cabin = LazyBranch("Cabin")
+    ADAS = LazyBranch("ADAS")
+    Chassis = LazyBranch("Chassis")
+    OBD = LazyBranch("OBD")
+    Driver = LazyBranch("Driver")
+    Exterior = LazyBranch("Exterior")
+    Service = LazyBranch("Service")
+    Connectivity = LazyBranch("Connectivity")
+
+    def __init__(self, name, lazy: bool = False):
+        """Create a new Vehicle model.
+
+        With lazy set, the branches of the tree are only created the first time
+        they are accessed instead of up front.
+        """
         super().__init__()
         self.name = name
 
-        self.VersionVSS = VersionVSS("VersionVSS", self)
-        self.VehicleIdentification = VehicleIdentification(
-            "VehicleIdentification", self
-        )
         self.LowVoltageSystemState = DataPointString("LowVoltageSystemState", self)
         self.Speed = DataPointFloat("Speed", self)
         self.TravelledDistance = DataPointFloat("TravelledDistance", self)
@@ -190,8 +250,6 @@ def __init__(self, name):
         self.IsBrokenDown = DataPointBoolean("IsBrokenDown", self)
         self.IsMoving = DataPointBoolean("IsMoving", self)
         self.AverageSpeed = DataPointFloat("AverageSpeed", self)
-        self.Acceleration = Acceleration("Acceleration", self)
-        self.AngularVelocity = AngularVelocity("AngularVelocity", self)
         self.RoofLoad = DataPointInt16("RoofLoad", self)
         self.CargoVolume = DataPointFloat("CargoVolume", self)
         self.EmissionsCO2 = DataPointInt16("EmissionsCO2", self)
@@ -203,18 +261,129 @@ def __init__(self, name):
         self.Length = DataPointUint16("Length", self)
         self.Height = DataPointUint16("Height", self)
         self.Width = DataPointUint16("Width", self)
-        self.Trailer = Trailer("Trailer", self)
-        self.CurrentLocation = CurrentLocation("CurrentLocation", self)
-        self.Powertrain = Powertrain("Powertrain", self)
-        self.Body = Body("Body", self)
-        self.Cabin = Cabin("Cabin", self)
-        self.ADAS = ADAS("ADAS", self)
-        self.Chassis = Chassis("Chassis", self)
-        self.OBD = OBD("OBD", self)
-        self.Driver = Driver("Driver", self)
-        self.Exterior = Exterior("Exterior", self)
-        self.Service = Service("Service", self)
-        self.Connectivity = Connectivity("Connectivity", self)
-
-
-vehicle = Vehicle("Vehicle")
+
+        self._index: Optional["PathIndex"] = None
+        self._attributes: Optional["AttributeCache"] = None
+        self._mirror: Optional["Mirror"] = None
+        self._multiplexer: Optional["SubscriptionMultiplexer"] = None
+        if not lazy:
+            materialize(self)
+
+    @property
+    def index(self) -> "PathIndex":
+        """Index of all data points and branches by VSS path, built on first use."""
+        if self._index is None:
+            from sdv_model.index import PathIndex  # pylint: disable=C0415
+
+            self._index = PathIndex(self)
+        return self._index
+
+    @property
+    def attributes(self) -> Optional["AttributeCache"]:
+        """The cache of attribute values read by DataPoint.get(), if enabled."""
+        return self._attributes
+
+    def enable_attribute_cache(self) -> "AttributeCache":
+        """Serve get() of attributes from a cache filled on the first read."""
+        if self._attributes is None:
+            from sdv_model.attributes import AttributeCache  # pylint: disable=C0415
+
+            self._attributes = AttributeCache(self.get_client())
+        return self._attributes
+
+    def disable_attribute_cache(self):
+        """Read attributes from the Databroker on every get() again."""
+        self._attributes = None
+
+    @property
+    def multiplexer(self) -> "SubscriptionMultiplexer":
+        """Upstream subscription shared by all subscriptions to data points."""
+        if self._multiplexer is None:
+            # pylint: disable=C0415
+            from sdv_model.multiplexer import SubscriptionMultiplexer
+
+            self._multiplexer = SubscriptionMultiplexer(self.get_client())
+        return self._multiplexer
+
+    @property
+    def mirror(self) -> Optional["Mirror"]:
+        """The running mirror of data point values, if any."""
+        return self._mirror
+
+    async def start_mirror(
+        self, *nodes: "ModelNode", max_age: Optional[float] = None
+    ) -> "Mirror":
+        """Mirror the values of data points and branches in memory.
+
+        One subscription to all given data points and the data points below
+        the given branches (the whole vehicle if none are given) keeps their
+        latest values. While the mirror runs, get() of these data points is a
+        local read, unless the latest update is older than max_age seconds.
+        """
+        # pylint: disable=C0415
+        from sdv_model.mirror import Mirror
+        from sdv_model.snapshot import iter_datapoints
+
+        await self.stop_mirror()
+        datapoints = {}
+        for node in nodes or (self,):
+            path = self.path_of(node)
+            if isinstance(node, DataPoint):
+                datapoints[path] = node
+            else:
+                datapoints.update(iter_datapoints(node, path))
+        self._mirror = Mirror(datapoints, max_age)
+        self._mirror.start(self.multiplexer)
+        return self._mirror
+
+    async def stop_mirror(self):
+        """End the subscription of the mirror; get() reads from the broker again."""
+        if self._mirror is not None:
+            mirror, self._mirror = self._mirror, None
+            await mirror.stop()
+
+    def get_by_path(self, path: str) -> "ModelNode":
+        """Return the data point or branch with the given VSS path."""
+        return self.index.get(path)
+
+    def path_of(self, node: "ModelNode") -> str:
+        """Return the VSS path of a data point or branch of this vehicle."""
+        return self.index.path_of(node)
+
+    def select(self, pattern: str) -> List[DataPoint]:
+        """Return the data points whose VSS path matches a wildcard pattern.
+
+        A "*" segment matches any single path segment, "**" any number of
+        segments. Other segments may contain shell wildcards, e.g. "Is*On".
+        """
+        return self.index.select(pattern)
+
+    def validate_many(
+        self, items: Iterable[Tuple[Union[str, DataPoint], Any]]
+    ) -> List["ValidationFailure"]:
+        """Validate many (path or data point, value) pairs in one call.
+
+        Returns the rejected values with the reason, in the order of the pairs.
+        Numeric values are range checked in bulk if NumPy is installed.
+        """
+        from sdv_model.validation import validate_many  # pylint: disable=C0415
+
+        index = self.index
+        return validate_many(
+            (index.get(key) if isinstance(key, str) else key, value)  # type: ignore
+            for key, value in items
+        )
+
+
+@lru_cache(maxsize=None)
+def get_vehicle() -> Vehicle:
+    """Return the shared Vehicle model, creating it on first use."""
+    return Vehicle("Vehicle", lazy=True)
+
+
+def __getattr__(name: str):
+    # The module level vehicle is only created when it is first imported, so
+    # importing the package itself does not build the tree.
+    if name == "vehicle":
+        return get_vehicle()
+    return _import_child(name)
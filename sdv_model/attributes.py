@@ -0,0 +1,123 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Session cache of the values of the attributes of a vehicle."""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+import grpc
+from sdv.model import DataPoint
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.vdb.types import TypedDataPointResult
+
+from sdv_model.index import instance_paths
+from sdv_model.metadata import ATTRIBUTE, SIGNALS
+
+logger = logging.getLogger(__name__)
+
+
+def _has_value(broker_data_point: BrokerDatapoint) -> bool:
+    return broker_data_point.WhichOneof("value") not in (None, "failure_value")
+
+
+class AttributeCache:
+    """
+    Values of the attribute data points of a vehicle, like CurbWeight or
+    Cabin.SeatPosCount, which do not change while an application runs.
+    Created by Vehicle.enable_attribute_cache().
+
+    The first read fetches all attributes of the metadata table with one
+    request. Attributes below repeated branches are requested for every
+    instance, like Chassis.Axle.Row1.WheelCount and Chassis.Axle.Row2.WheelCount,
+    with the paths taken from the model classes, so no branch of the vehicle
+    needs to be created for it. Attributes the batched request returned no
+    value for are read one by one, as are all of them if the batched request
+    failed. Values are served from memory until
+    the cache is invalidated; failures are not cached.
+
+    ...
+
+    Methods
+    -------
+    get(datapoint=DataPoint)
+        Return the value of an attribute, read from memory if cached
+
+    load()
+        Fetch the values of all attributes with one request, unless done yet
+
+    invalidate()
+        Drop the cached values, so the next read fetches them again
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._values: Dict[str, BrokerDatapoint] = {}
+        self._loaded = False
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        """The VSS paths of the attributes fetched together."""
+        return tuple(
+            path
+            for spec_path, metadata in SIGNALS.items()
+            if metadata.kind == ATTRIBUTE
+            for path in instance_paths(spec_path)
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    async def get(self, datapoint: DataPoint) -> TypedDataPointResult:
+        path = datapoint.get_path()
+        broker_data_point = self._values.get(path)
+        if broker_data_point is None and not self._loaded:
+            await self.load()
+            broker_data_point = self._values.get(path)
+        if broker_data_point is None:
+            response = await self._client.GetDatapoints([path])
+            broker_data_point = response.datapoints[path]
+            if _has_value(broker_data_point):
+                self._values[path] = broker_data_point
+        return datapoint.result_of(broker_data_point)  # type: ignore
+
+    async def load(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # concurrent first reads wait for a single request
+            if not self._loaded:
+                await self._fetch()
+                self._loaded = True
+
+    async def _fetch(self):
+        paths = self.paths
+        try:
+            response = await self._client.GetDatapoints(list(paths))
+        except grpc.aio.AioRpcError as error:
+            logger.warning(
+                "Reading all attributes failed (%s), reading them one by one",
+                error.code(),
+            )
+            return
+        for path, broker_data_point in response.datapoints.items():
+            if _has_value(broker_data_point):
+                self._values[path] = broker_data_point
+
+    def invalidate(self):
+        self._values.clear()
+        self._loaded = False
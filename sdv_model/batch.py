@@ -0,0 +1,113 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Setting the values of many data points with one request."""
+
+import logging
+from typing import Any, Dict, Iterable, Tuple
+
+from sdv import model
+from sdv.model import DataPoint
+from sdv.proto.types_pb2 import DatapointError
+
+from sdv_model.datapoints import plain_value
+from sdv_model.validation import ValidationError, validate_many
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSetError(TypeError):
+    """
+    Raised when the Databroker rejects data points of a batch.
+
+    Derives from TypeError, which the batch of the SDK raises in this case.
+
+    ...
+
+    Attributes
+    ----------
+    errors : dict
+        Name of the error of each rejected data point, by path
+    """
+
+    def __init__(self, errors: Dict[str, str]):
+        super().__init__(
+            "Some data point values could not be set: "
+            + ", ".join(f"{path} ({error})" for path, error in errors.items())
+        )
+        self.errors = errors
+
+
+class BatchSetBuilder(model.BatchSetBuilder):
+    """
+    Collects data points to be set in a single request:
+
+        await (
+            vehicle.set_many()
+            .add_each(vehicle.select("Vehicle.Cabin.Door.*.*.IsLocked"), True)
+            .add(vehicle.Cabin.Seat.Row1.Pos1.Heating, 50)
+            .apply()
+        )
+
+    All values are validated when the batch is applied. If any of them is
+    invalid, a ValidationError listing all invalid values is raised and nothing
+    is sent. Errors reported by the Databroker for single data points are
+    raised together as BatchSetError.
+    """
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._client = client
+        self._values: Dict[str, Tuple[DataPoint, Any]] = {}
+
+    def add(self, node: DataPoint, value) -> "BatchSetBuilder":  # type: ignore
+        self._values[node.get_path()] = (node, plain_value(value))
+        return self
+
+    def add_all(self, items: Iterable[Tuple[DataPoint, Any]]) -> "BatchSetBuilder":
+        """Add many (data point, value) pairs."""
+        for node, value in items:
+            self.add(node, value)
+        return self
+
+    def add_each(self, nodes: Iterable[DataPoint], value) -> "BatchSetBuilder":
+        """Add the same value for each of the data points, e.g. of a selection."""
+        for node in nodes:
+            self.add(node, value)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    async def apply(self):
+        if not self._values:
+            logger.warning("Empty node list, nothing updated")
+            return
+
+        failures = validate_many(self._values.values())
+        if failures:
+            raise ValidationError(failures)
+
+        datapoints = {
+            path: node.create_validated_broker_data_point(value)  # type: ignore
+            for path, (node, value) in self._values.items()
+        }
+        response = await self._client.SetDatapoints(datapoints)
+        if response.errors:
+            raise BatchSetError(
+                {
+                    path: DatapointError.Name(error)
+                    for path, error in response.errors.items()
+                }
+            )
@@ -0,0 +1,214 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Process-wide pool of the gRPC channels to the services of the vehicle."""
+
+import asyncio
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import grpc
+from sdv import config
+
+
+class _AddressChannels:
+    """The channels to one address, and the one to hand out next."""
+
+    def __init__(self, channels: List[grpc.aio.Channel]):
+        self.channels = channels
+        self.next = 0
+
+
+class _LoopChannels:
+    """
+    The channels of one event loop by address, and the task closing them
+    when the tasks of the loop are cancelled, as asyncio.run() does before
+    it closes the loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        # the channels refer to the loop, the pool does not
+        self.loop = weakref.ref(loop)
+        self.addresses: Dict[str, _AddressChannels] = {}
+        self.keeper: Optional["asyncio.Task[None]"] = None
+
+    def channels(self) -> List[grpc.aio.Channel]:
+        return [
+            channel
+            for address_channels in self.addresses.values()
+            for channel in address_channels.channels
+        ]
+
+
+class ChannelPool:
+    """
+    gRPC channels shared by all service stubs of a process, keyed by the
+    address of the service.
+
+    Every address gets size channels, 1 unless set_size() says otherwise.
+    channel() hands them out in turn, so the services connecting to an
+    address are spread over its channels. A service keeps the channel it got
+    for all its calls, e.g. SeatService caches its stub, so the calls of one
+    service instance all use one channel. Each channel is one HTTP/2
+    connection, whose number of concurrent calls is limited by the max
+    concurrent streams setting of the service, so addresses serving many
+    concurrent calls, e.g. long-running streams, can be given more channels
+    used by several service instances.
+
+    The channels of grpc.aio are bound to the event loop they were created
+    in, so every running event loop gets channels of its own, e.g. every
+    asyncio.run() of a test. The channels of a loop are closed when the
+    tasks of the loop are cancelled at its end, as asyncio.run() does.
+    Channels of loops closed otherwise are dropped by the next channel()
+    call of any loop.
+
+    ...
+
+    Attributes
+    ----------
+    keepalive_time : float, optional
+        Seconds after which an idle connection is checked with a ping, None to
+        not send pings
+    keepalive_timeout : float
+        Seconds to wait for the answer to a ping before the connection is
+        closed
+    options : sequence
+        Further gRPC channel arguments, as (key, value) pairs
+
+    Methods
+    -------
+    channel(address=str)
+        Return a channel to the address, creating it on first use
+
+    set_size(address=str, size=int)
+        Set the number of channels to an address
+
+    close()
+        Close all channels of the running event loop
+    """
+
+    def __init__(
+        self,
+        keepalive_time: Optional[float] = 300.0,
+        keepalive_timeout: float = 20.0,
+        options: Sequence[Tuple[str, Any]] = (),
+    ):
+        self.keepalive_time = keepalive_time
+        self.keepalive_timeout = keepalive_timeout
+        self.options = tuple(options)
+        self._sizes: Dict[str, int] = {}
+        # channels by id() of their event loop
+        self._loops: Dict[int, _LoopChannels] = {}
+
+    def _channel_options(self, size: int) -> List[Tuple[str, Any]]:
+        options: List[Tuple[str, Any]] = []
+        if self.keepalive_time is not None:
+            options += [
+                ("grpc.keepalive_time_ms", int(self.keepalive_time * 1000)),
+                ("grpc.keepalive_timeout_ms", int(self.keepalive_timeout * 1000)),
+            ]
+        if size > 1:
+            # channels with equal arguments would share one connection otherwise
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        return options + list(self.options)
+
+    def set_size(self, address: str, size: int):
+        """
+        Set the number of channels to an address. Takes effect when the
+        channels to the address are created, i.e. before their first use or
+        after close().
+        """
+        if size < 1:
+            raise ValueError("The size must be at least 1")
+        self._sizes[address] = size
+
+    def channel(self, address: str) -> grpc.aio.Channel:
+        """
+        Return a channel to the address for the running event loop, the next
+        one of the channels to the address in turn. The channels are created
+        on first use. Must be called with an event loop running.
+        """
+        channels = self._loop_channels(asyncio.get_running_loop())
+        address_channels = channels.addresses.get(address)
+        if address_channels is None:
+            size = self._sizes.get(address, 1)
+            options = self._channel_options(size)
+            address_channels = _AddressChannels(
+                [
+                    grpc.aio.insecure_channel(address, options=options)
+                    for _ in range(size)
+                ]
+            )
+            channels.addresses[address] = address_channels
+        position = address_channels.next
+        address_channels.next = (position + 1) % len(address_channels.channels)
+        return address_channels.channels[position]
+
+    def _loop_channels(self, loop: asyncio.AbstractEventLoop) -> _LoopChannels:
+        for key, entry in list(self._loops.items()):
+            other = entry.loop()
+            if other is None or other.is_closed():
+                # closing needs the loop; the channels close when collected
+                del self._loops[key]
+        channels = self._loops.get(id(loop))
+        if channels is None or channels.loop() is not loop:
+            channels = _LoopChannels(loop)
+            channels.keeper = loop.create_task(self._keep(id(loop), channels))
+            self._loops[id(loop)] = channels
+        return channels
+
+    async def _keep(self, key: int, channels: _LoopChannels):
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            if self._loops.get(key) is channels:
+                del self._loops[key]
+            for channel in channels.channels():
+                await channel.close()
+            raise
+
+    async def close(self):
+        """
+        Close all channels of the running event loop. Channels requested
+        afterwards are new ones.
+        """
+        loop = asyncio.get_running_loop()
+        channels = self._loops.get(id(loop))
+        if channels is None or channels.loop() is not loop:
+            return
+        del self._loops[id(loop)]
+        if channels.keeper is not None:
+            channels.keeper.cancel()
+        for channel in channels.channels():
+            await channel.close()
+
+
+@lru_cache(maxsize=None)
+def get_channel_pool() -> ChannelPool:
+    """Return the channel pool of the process, creating it on first use."""
+    return ChannelPool()
+
+
+def connect_service(name: str) -> Tuple[str, grpc.aio.Channel, Any]:
+    """
+    Return the address of a service, a pooled channel to it and the metadata
+    of its calls, as found by the service locator of the middleware.
+    """
+    service_locator = config.middleware.service_locator
+    location = urlparse(service_locator.get_service_location(name))
+    address = f"{location.hostname}:{location.port}"
+    channel = get_channel_pool().channel(address)
+    return address, channel, service_locator.get_metadata(name)
@@ -0,0 +1,64 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Base class of the generated collections of branch instances."""
+
+from typing import Iterator, Tuple, Union
+
+from sdv_model.model import Model
+
+
+class Collection(Model):
+    """
+    Branch holding the instances of a repeated branch, e.g. the rows of seats.
+
+    The instance names are listed once per class in _elements, so the indexed
+    accessors of the generated collections (Row(), Pos(), element(), ...) do
+    not allocate anything per call.
+
+    Iterating a collection yields its instances in order. Indexing accepts the
+    instance name, or the 1-based position of the instance, like Row() and
+    Pos() and the instance names do:
+
+        for row in vehicle.Cabin.Seat:
+            for seat in row:
+                ...
+
+        vehicle.Cabin.Seat[1] is vehicle.Cabin.Seat["Row1"]
+    """
+
+    __slots__ = ()
+
+    _elements: Tuple[str, ...] = ()
+
+    def _element(self, index: int):
+        if index < 1 or index > len(self._elements):
+            raise IndexError(
+                f"Index {index} is out of range [1, {len(self._elements)}]"
+            )
+        return getattr(self, self._elements[index - 1])
+
+    def __getitem__(self, key: Union[int, str]):
+        if isinstance(key, str):
+            if key not in self._elements:
+                raise KeyError(key)
+            return getattr(self, key)
+        return self._element(key)
+
+    def __iter__(self) -> Iterator[Model]:
+        for name in self._elements:
+            yield getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self._elements)
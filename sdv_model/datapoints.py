@@ -0,0 +1,327 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Data point classes of the vehicle model."""
+
+# pylint: disable=R0901
+
+from enum import Enum, IntEnum
+from typing import TYPE_CHECKING, Optional, Type
+
+from sdv import model
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.vdb.types import TypedDataPointResult
+
+from sdv_model.queues import DROP_OLDEST
+
+if TYPE_CHECKING:
+    from sdv_model.attributes import AttributeCache
+    from sdv_model.metadata import SignalMetadata
+    from sdv_model.mirror import Mirror
+    from sdv_model.multiplexer import SubscriptionMultiplexer
+    from sdv_model.timeseries import TimeSeries
+
+
+class DataPointMixin:
+    """Additions of the vehicle model to the data point classes of the SDK."""
+
+    __slots__ = ()
+
+    # name of the value field of the broker data point
+    _field = ""
+
+    @property
+    def metadata(self) -> "SignalMetadata":
+        """Unit, value range, allowed values, datatype and kind of the signal."""
+        # the metadata table is only imported when it is first needed
+        from sdv_model.metadata import get_metadata  # pylint: disable=C0415
+
+        return get_metadata(self)  # type: ignore
+
+    def validate(self, value):
+        """
+        Raise a ValidationError if the value does not conform to the datatype,
+        range or allowed values of the signal.
+        """
+        from sdv_model.validation import validate  # pylint: disable=C0415
+
+        validate(self, value)  # type: ignore
+
+    def convert(self, value, unit: str):
+        """
+        Convert a value of the signal to another unit, e.g. from km/h to "m/s".
+        Sequences and NumPy arrays of values are converted in one vectorized
+        operation, which requires NumPy.
+        """
+        from sdv_model.units import conversion_of  # pylint: disable=C0415
+
+        conversion = conversion_of(self, unit)  # type: ignore
+        if isinstance(value, (int, float)):
+            return conversion(value)
+        return conversion.convert_array(value)
+
+    @property
+    def enum(self) -> Optional[Type[IntEnum]]:
+        """IntEnum of the allowed values of the signal, None if they are not closed."""
+        from sdv_model.enums import enum_of  # pylint: disable=C0415
+
+        return enum_of(self)  # type: ignore
+
+    def _require_enum(self) -> Type[IntEnum]:
+        enum_type = self.enum
+        if enum_type is None:
+            raise TypeError(f"{self.get_path()} has no enumeration")  # type: ignore
+        return enum_type
+
+    def encode(self, value):
+        """
+        Return the enum member of a string value of the signal, or the list of
+        members of an array value. Members compare and hash as small ints.
+        """
+        enum_type = self._require_enum()
+        if isinstance(value, str):
+            return enum_type[value]
+        return [enum_type[element] for element in value]
+
+    def decode(self, code: int) -> str:
+        """Return the string value of the signal for an integer code."""
+        from sdv_model.enums import members  # pylint: disable=C0415
+
+        return members(self._require_enum())[code].name
+
+    def value_of(self, broker_data_point: BrokerDatapoint):
+        """Return the value of a data point received from the Databroker."""
+        value = getattr(broker_data_point, self._field)
+        if self._field.endswith("_array"):
+            return list(value.values)
+        return value
+
+    def result_of(self, broker_data_point: BrokerDatapoint) -> TypedDataPointResult:
+        """Return the typed result of a data point received from the Databroker."""
+        return TypedDataPointResult(
+            self.get_path(),  # type: ignore
+            self.value_of(broker_data_point),
+            broker_data_point.timestamp,
+        )
+
+    def _root(self):
+        root = self
+        while root.parent is not None:  # type: ignore
+            root = root.parent  # type: ignore
+        return root
+
+    async def get(self):
+        root = self._root()
+        mirror: Optional["Mirror"] = getattr(root, "mirror", None)
+        if mirror is not None:
+            result = mirror.get(self)  # type: ignore
+            if result is not None:
+                return result
+
+        if self.metadata.kind == "attribute":
+            attributes: Optional["AttributeCache"] = getattr(root, "attributes", None)
+            if attributes is not None:
+                return await attributes.get(self)  # type: ignore
+
+        return await super().get()  # type: ignore
+
+    async def subscribe(
+        self,
+        on_update,
+        *,
+        deadband: Optional[float] = None,
+        relative_deadband: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        policy: str = DROP_OLDEST,
+        multiplex: bool = False,
+        as_enum: bool = False,
+    ):
+        """
+        Subscribe to updates of the data point, or of the joined data points.
+
+        With multiplex set, the subscription shares the upstream subscription
+        of the vehicle with the other multiplexed subscriptions, see
+        sdv_model.multiplexer.SubscriptionMultiplexer, instead of getting one
+        of its own. Subscriptions with a where() condition cannot be
+        multiplexed.
+
+        With as_enum set, get() of the replies returns the values of
+        enumerated string signals as members of their IntEnum, see
+        sdv_model.enums.EnumReply.
+
+        The optional filters drop updates of numeric data points before they
+        reach the callback, see sdv_model.filters.UpdateFilter.
+
+        With a queue_size, updates are queued for the callback, which is then
+        called by a task of its own. A full queue applies the policy, see
+        sdv_model.queues.UpdateQueue; the queue and its counters are the
+        queue attribute of the returned subscription.
+        """
+        if as_enum:
+            from sdv_model.enums import enum_replies  # pylint: disable=C0415
+
+            on_update = enum_replies(on_update)
+
+        queue = None
+        if queue_size is not None:
+            # pylint: disable=C0415
+            from sdv_model.queues import QueuedCallback, UpdateQueue
+
+            queue = UpdateQueue(queue_size, policy)
+            on_update = QueuedCallback(on_update, queue).on_update
+
+        if any(
+            option is not None
+            for option in (deadband, relative_deadband, min_interval, max_rate)
+        ):
+            from sdv_model.filters import UpdateFilter  # pylint: disable=C0415
+
+            if deadband is not None or relative_deadband is not None:
+                datatype = self.metadata.datatype
+                if datatype in ("boolean", "string") or datatype.endswith("[]"):
+                    raise TypeError("A deadband needs a numeric data point")
+            on_update = UpdateFilter(
+                self,  # type: ignore
+                on_update,
+                deadband,
+                relative_deadband,
+                min_interval,
+                max_rate,
+            ).on_update
+
+        multiplexer: Optional["SubscriptionMultiplexer"] = None
+        if multiplex:
+            multiplexer = getattr(self._root(), "multiplexer", None)
+        if multiplexer is None:
+            subscription = await super().subscribe(on_update)  # type: ignore
+        else:
+            context = self.get_context()  # type: ignore
+            if "WHERE" in context:
+                raise ValueError("Subscriptions with a condition cannot be multiplexed")
+            paths = context[::2] if context else [self.get_path()]  # type: ignore
+            self.set_context([])  # type: ignore
+            subscription = multiplexer.subscribe(paths, on_update)
+        subscription.queue = queue
+        return subscription
+
+    async def record(self, capacity: int) -> "TimeSeries":
+        """
+        Return a time series of the latest capacity values of the numeric data
+        point, filled from its updates. Requires NumPy.
+        """
+        from sdv_model.timeseries import TimeSeries  # pylint: disable=C0415
+
+        series = TimeSeries(self, capacity)  # type: ignore
+        await series.start()
+        return series
+
+    async def set(self, value):
+        # the SDK logs every error of set() with its traceback, so invalid
+        # values are rejected before
+        self.validate(plain_value(value))
+        await super().set(value)  # type: ignore
+
+    def create_broker_data_point(self, value):
+        value = plain_value(value)
+        # set() and BatchSetBuilder.add() of the SDK both create the broker data
+        # point here, so invalid values are rejected before any request is sent
+        self.validate(value)
+        return super().create_broker_data_point(value)  # type: ignore
+
+    def create_validated_broker_data_point(self, value):
+        """Create the broker data point of a plain value that was validated already."""
+        return super().create_broker_data_point(value)  # type: ignore
+
+
+def plain_value(value):
+    """Return the value with enum members replaced by their string values."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, list) and value and isinstance(value[0], Enum):
+        return [element.name for element in value]
+    return value
+
+
+class DataPointBoolean(DataPointMixin, model.DataPointBoolean):
+    """A data point with a value of type bool."""
+
+    _field = "bool_value"
+
+
+class DataPointDouble(DataPointMixin, model.DataPointDouble):
+    """A data point with a value of type double."""
+
+    _field = "double_value"
+
+
+class DataPointFloat(DataPointMixin, model.DataPointFloat):
+    """A data point with a value of type float."""
+
+    _field = "float_value"
+
+
+class DataPointInt8(DataPointMixin, model.DataPointInt8):
+    """A data point with a value of type int8."""
+
+    _field = "int32_value"
+
+
+class DataPointInt16(DataPointMixin, model.DataPointInt16):
+    """A data point with a value of type int16."""
+
+    _field = "int32_value"
+
+
+class DataPointInt32(DataPointMixin, model.DataPointInt32):
+    """A data point with a value of type int32."""
+
+    _field = "int32_value"
+
+
+class DataPointString(DataPointMixin, model.DataPointString):
+    """A data point with a value of type string."""
+
+    _field = "string_value"
+
+
+class DataPointStringArray(DataPointMixin, model.DataPointStringArray):
+    """A data point array with a value of type string."""
+
+    _field = "string_array"
+
+
+class DataPointUint8(DataPointMixin, model.DataPointUint8):
+    """A data point with a value of type uint8."""
+
+    _field = "uint32_value"
+
+
+class DataPointUint8Array(DataPointMixin, model.DataPointUint8Array):
+    """A data point array with a value of type uint8."""
+
+    _field = "uint32_array"
+
+
+class DataPointUint16(DataPointMixin, model.DataPointUint16):
+    """A data point with a value of type uint16."""
+
+    _field = "uint32_value"
+
+
+class DataPointUint32(DataPointMixin, model.DataPointUint32):
+    """A data point with a value of type uint32."""
+
+    _field = "uint32_value"
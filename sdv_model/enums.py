@@ -0,0 +1,567 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Integer enumerations of the string signals with a closed set of values.
+
+Generated from the allowed values of the VSS specification together with the
+model classes. The integer of a member is the position of its value in the
+specification, so the values of every signal fit into one byte.
+"""
+
+# pylint: disable=C0103,C0301
+
+import asyncio
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from sdv.model import DataPoint
+from sdv.vdb.reply import DataPointReply
+
+from sdv_model.metadata import spec_path
+
+
+class ActiveAutonomyLevel(IntEnum):
+    """Allowed values of Vehicle.ADAS.ActiveAutonomyLevel."""
+
+    SAE_0 = 0
+    SAE_1 = 1
+    SAE_2_DISENGAGING = 2
+    SAE_2 = 3
+    SAE_3_DISENGAGING = 4
+    SAE_3 = 5
+    SAE_4_DISENGAGING = 6
+    SAE_4 = 7
+    SAE_5 = 8
+
+
+class SupportedAutonomyLevel(IntEnum):
+    """Allowed values of Vehicle.ADAS.SupportedAutonomyLevel."""
+
+    SAE_0 = 0
+    SAE_1 = 1
+    SAE_2 = 2
+    SAE_3 = 3
+    SAE_4 = 4
+    SAE_5 = 5
+
+
+class SystemMode(IntEnum):
+    """Allowed values of Vehicle.Body.Windshield.Wiping.System.Mode."""
+
+    STOP_HOLD = 0
+    WIPE = 1
+    PLANT_MODE = 2
+    EMERGENCY_STOP = 3
+
+
+class WipingMode(IntEnum):
+    """Allowed values of Vehicle.Body.Windshield.Wiping.Mode."""
+
+    OFF = 0
+    SLOW = 1
+    MEDIUM = 2
+    FAST = 3
+    INTERVAL = 4
+    RAIN_SENSOR = 5
+
+
+class RefuelPosition(IntEnum):
+    """Allowed values of Vehicle.Body.RefuelPosition."""
+
+    FRONT_LEFT = 0
+    FRONT_RIGHT = 1
+    MIDDLE_LEFT = 2
+    MIDDLE_RIGHT = 3
+    REAR_LEFT = 4
+    REAR_RIGHT = 5
+
+
+class Status(IntEnum):
+    """Allowed values of Vehicle.Cabin.Convertible.Status."""
+
+    UNDEFINED = 0
+    CLOSED = 1
+    OPEN = 2
+    CLOSING = 3
+    OPENING = 4
+    STALLED = 5
+
+
+class DoorShadeSwitch(IntEnum):
+    """Allowed values of Vehicle.Cabin.Door.Shade.Switch."""
+
+    INACTIVE = 0
+    CLOSE = 1
+    OPEN = 2
+    ONE_SHOT_CLOSE = 3
+    ONE_SHOT_OPEN = 4
+
+
+class WindowSwitch(IntEnum):
+    """Allowed values of Vehicle.Cabin.Door.Window.Switch."""
+
+    INACTIVE = 0
+    CLOSE = 1
+    OPEN = 2
+    ONE_SHOT_CLOSE = 3
+    ONE_SHOT_OPEN = 4
+
+
+class AirDistribution(IntEnum):
+    """Allowed values of Vehicle.Cabin.HVAC.Station.AirDistribution."""
+
+    UP = 0
+    MIDDLE = 1
+    DOWN = 2
+
+
+class DateFormat(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.DateFormat."""
+
+    YYYY_MM_DD = 0
+    DD_MM_YYYY = 1
+    MM_DD_YYYY = 2
+    YY_MM_DD = 3
+    DD_MM_YY = 4
+    MM_DD_YY = 5
+
+
+class TimeFormat(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.TimeFormat."""
+
+    HR_12 = 0
+    HR_24 = 1
+
+
+class DistanceUnit(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.DistanceUnit."""
+
+    MILES = 0
+    KILOMETERS = 1
+
+
+class FuelEconomyUnits(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.FuelEconomyUnits."""
+
+    MPG_UK = 0
+    MPG_US = 1
+    MILES_PER_LITER = 2
+    KILOMETERS_PER_LITER = 3
+    LITERS_PER_100_KILOMETERS = 4
+
+
+class EVEconomyUnits(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.EVEconomyUnits."""
+
+    MILES_PER_KILOWATT_HOUR = 0
+    KILOMETERS_PER_KILOWATT_HOUR = 1
+    KILOWATT_HOURS_PER_100_MILES = 2
+    KILOWATT_HOURS_PER_100_KILOMETERS = 3
+    WATT_HOURS_PER_MILE = 4
+    WATT_HOURS_PER_KILOMETER = 5
+
+
+class TemperatureUnit(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.TemperatureUnit."""
+
+    C = 0
+    F = 1
+
+
+class DayNightMode(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.HMI.DayNightMode."""
+
+    DAY = 0
+    NIGHT = 1
+
+
+class Source(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.Media.Played.Source."""
+
+    UNKNOWN = 0
+    SIRIUS_XM = 1
+    AM = 2
+    FM = 3
+    DAB = 4
+    TV = 5
+    CD = 6
+    DVD = 7
+    AUX = 8
+    USB = 9
+    DISK = 10
+    BLUETOOTH = 11
+    INTERNET = 12
+    VOICE = 13
+    BEEP = 14
+
+
+class Action(IntEnum):
+    """Allowed values of Vehicle.Cabin.Infotainment.Media.Action."""
+
+    UNKNOWN = 0
+    STOP = 1
+    PLAY = 2
+    FAST_FORWARD = 3
+    FAST_BACKWARD = 4
+    SKIP_FORWARD = 5
+    SKIP_BACKWARD = 6
+
+
+class RearShadeSwitch(IntEnum):
+    """Allowed values of Vehicle.Cabin.RearShade.Switch."""
+
+    INACTIVE = 0
+    CLOSE = 1
+    OPEN = 2
+    ONE_SHOT_CLOSE = 3
+    ONE_SHOT_OPEN = 4
+
+
+class SunroofShadeSwitch(IntEnum):
+    """Allowed values of Vehicle.Cabin.Sunroof.Shade.Switch."""
+
+    INACTIVE = 0
+    CLOSE = 1
+    OPEN = 2
+    ONE_SHOT_CLOSE = 3
+    ONE_SHOT_OPEN = 4
+
+
+class SunroofSwitch(IntEnum):
+    """Allowed values of Vehicle.Cabin.Sunroof.Switch."""
+
+    INACTIVE = 0
+    CLOSE = 1
+    OPEN = 2
+    ONE_SHOT_CLOSE = 3
+    ONE_SHOT_OPEN = 4
+    TILT_UP = 5
+    TILT_DOWN = 6
+
+
+class Position(IntEnum):
+    """Allowed values of Vehicle.Chassis.SteeringWheel.Position."""
+
+    FRONT_LEFT = 0
+    FRONT_RIGHT = 1
+
+
+class FixType(IntEnum):
+    """Allowed values of Vehicle.CurrentLocation.GNSSReceiver.FixType."""
+
+    NONE = 0
+    TWO_D = 1
+    TWO_D_SATELLITE_BASED_AUGMENTATION = 2
+    TWO_D_GROUND_BASED_AUGMENTATION = 3
+    TWO_D_SATELLITE_AND_GROUND_BASED_AUGMENTATION = 4
+    THREE_D = 5
+    THREE_D_SATELLITE_BASED_AUGMENTATION = 6
+    THREE_D_GROUND_BASED_AUGMENTATION = 7
+    THREE_D_SATELLITE_AND_GROUND_BASED_AUGMENTATION = 8
+
+
+class DriveCycleStatusIgnitionType(IntEnum):
+    """Allowed values of Vehicle.OBD.DriveCycleStatus.IgnitionType."""
+
+    SPARK = 0
+    COMPRESSION = 1
+
+
+class StatusIgnitionType(IntEnum):
+    """Allowed values of Vehicle.OBD.Status.IgnitionType."""
+
+    SPARK = 0
+    COMPRESSION = 1
+
+
+class Configuration(IntEnum):
+    """Allowed values of Vehicle.Powertrain.CombustionEngine.Configuration."""
+
+    UNKNOWN = 0
+    STRAIGHT = 1
+    V = 2
+    BOXER = 3
+    W = 4
+    ROTARY = 5
+    RADIAL = 6
+    SQUARE = 7
+    H = 8
+    U = 9
+    OPPOSED = 10
+    X = 11
+
+
+class AspirationType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.CombustionEngine.AspirationType."""
+
+    UNKNOWN = 0
+    NATURAL = 1
+    SUPERCHARGER = 2
+    TURBOCHARGER = 3
+
+
+class EngineOilLevel(IntEnum):
+    """Allowed values of Vehicle.Powertrain.CombustionEngine.EngineOilLevel."""
+
+    CRITICALLY_LOW = 0
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
+    CRITICALLY_HIGH = 4
+
+
+class SupportedFuelTypes(IntEnum):
+    """Allowed values of Vehicle.Powertrain.FuelSystem.SupportedFuelTypes."""
+
+    GASOLINE = 0
+    DIESEL = 1
+    E85 = 2
+    LPG = 3
+    CNG = 4
+    LNG = 5
+    H2 = 6
+    OTHER = 7
+
+
+class SupportedFuel(IntEnum):
+    """Allowed values of Vehicle.Powertrain.FuelSystem.SupportedFuel."""
+
+    E5_95 = 0
+    E5_98 = 1
+    E10_95 = 2
+    E10_98 = 3
+    E85 = 4
+    B7 = 5
+    B10 = 6
+    B20 = 7
+    B30 = 8
+    B100 = 9
+    XTL = 10
+    LPG = 11
+    CNG = 12
+    LNG = 13
+    H2 = 14
+    OTHER = 15
+
+
+class HybridType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.FuelSystem.HybridType."""
+
+    UNKNOWN = 0
+    NOT_APPLICABLE = 1
+    STOP_START = 2
+    BELT_ISG = 3
+    CIMG = 4
+    PHEV = 5
+
+
+class TimerMode(IntEnum):
+    """Allowed values of Vehicle.Powertrain.TractionBattery.Charging.Timer.Mode."""
+
+    INACTIVE = 0
+    START_TIME = 1
+    END_TIME = 2
+
+
+class ChargePortFlap(IntEnum):
+    """Allowed values of Vehicle.Powertrain.TractionBattery.Charging.ChargePortFlap."""
+
+    OPEN = 0
+    CLOSED = 1
+
+
+class ChargePlugType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.TractionBattery.Charging.ChargePlugType."""
+
+    IEC_TYPE_1_AC = 0
+    IEC_TYPE_2_AC = 1
+    IEC_TYPE_3_AC = 2
+    IEC_TYPE_4_DC = 3
+    IEC_TYPE_1_CCS_DC = 4
+    IEC_TYPE_2_CCS_DC = 5
+    TESLA_ROADSTER = 6
+    TESLA_HPWC = 7
+    TESLA_SUPERCHARGER = 8
+    GBT_AC = 9
+    GBT_DC = 10
+    OTHER = 11
+
+
+class ChargingMode(IntEnum):
+    """Allowed values of Vehicle.Powertrain.TractionBattery.Charging.Mode."""
+
+    MANUAL = 0
+    TIMER = 1
+    GRID = 2
+    PROFILE = 3
+
+
+class StartStopCharging(IntEnum):
+    """Allowed values of Vehicle.Powertrain.TractionBattery.Charging.StartStopCharging."""
+
+    START = 0
+    STOP = 1
+
+
+class TransmissionType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.Transmission.Type."""
+
+    UNKNOWN = 0
+    SEQUENTIAL = 1
+    H = 2
+    AUTOMATIC = 3
+    DSG = 4
+    CVT = 5
+
+
+class DriveType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.Transmission.DriveType."""
+
+    UNKNOWN = 0
+    FORWARD_WHEEL_DRIVE = 1
+    REAR_WHEEL_DRIVE = 2
+    ALL_WHEEL_DRIVE = 3
+
+
+class PerformanceMode(IntEnum):
+    """Allowed values of Vehicle.Powertrain.Transmission.PerformanceMode."""
+
+    NORMAL = 0
+    SPORT = 1
+    ECONOMY = 2
+    SNOW = 3
+    RAIN = 4
+
+
+class GearChangeMode(IntEnum):
+    """Allowed values of Vehicle.Powertrain.Transmission.GearChangeMode."""
+
+    MANUAL = 0
+    AUTOMATIC = 1
+
+
+class PowertrainType(IntEnum):
+    """Allowed values of Vehicle.Powertrain.Type."""
+
+    COMBUSTION = 0
+    HYBRID = 1
+    ELECTRIC = 2
+
+
+class LowVoltageSystemState(IntEnum):
+    """Allowed values of Vehicle.LowVoltageSystemState."""
+
+    UNDEFINED = 0
+    LOCK = 1
+    OFF = 2
+    ACC = 3
+    ON = 4
+    START = 5
+
+
+ENUMS: Dict[str, Type[IntEnum]] = {
+    "Vehicle.ADAS.ActiveAutonomyLevel": ActiveAutonomyLevel,
+    "Vehicle.ADAS.SupportedAutonomyLevel": SupportedAutonomyLevel,
+    "Vehicle.Body.Windshield.Wiping.System.Mode": SystemMode,
+    "Vehicle.Body.Windshield.Wiping.Mode": WipingMode,
+    "Vehicle.Body.RefuelPosition": RefuelPosition,
+    "Vehicle.Cabin.Convertible.Status": Status,
+    "Vehicle.Cabin.Door.Shade.Switch": DoorShadeSwitch,
+    "Vehicle.Cabin.Door.Window.Switch": WindowSwitch,
+    "Vehicle.Cabin.HVAC.Station.AirDistribution": AirDistribution,
+    "Vehicle.Cabin.Infotainment.HMI.DateFormat": DateFormat,
+    "Vehicle.Cabin.Infotainment.HMI.TimeFormat": TimeFormat,
+    "Vehicle.Cabin.Infotainment.HMI.DistanceUnit": DistanceUnit,
+    "Vehicle.Cabin.Infotainment.HMI.FuelEconomyUnits": FuelEconomyUnits,
+    "Vehicle.Cabin.Infotainment.HMI.EVEconomyUnits": EVEconomyUnits,
+    "Vehicle.Cabin.Infotainment.HMI.TemperatureUnit": TemperatureUnit,
+    "Vehicle.Cabin.Infotainment.HMI.DayNightMode": DayNightMode,
+    "Vehicle.Cabin.Infotainment.Media.Played.Source": Source,
+    "Vehicle.Cabin.Infotainment.Media.Action": Action,
+    "Vehicle.Cabin.RearShade.Switch": RearShadeSwitch,
+    "Vehicle.Cabin.Sunroof.Shade.Switch": SunroofShadeSwitch,
+    "Vehicle.Cabin.Sunroof.Switch": SunroofSwitch,
+    "Vehicle.Chassis.SteeringWheel.Position": Position,
+    "Vehicle.CurrentLocation.GNSSReceiver.FixType": FixType,
+    "Vehicle.OBD.DriveCycleStatus.IgnitionType": DriveCycleStatusIgnitionType,
+    "Vehicle.OBD.Status.IgnitionType": StatusIgnitionType,
+    "Vehicle.Powertrain.CombustionEngine.Configuration": Configuration,
+    "Vehicle.Powertrain.CombustionEngine.AspirationType": AspirationType,
+    "Vehicle.Powertrain.CombustionEngine.EngineOilLevel": EngineOilLevel,
+    "Vehicle.Powertrain.FuelSystem.SupportedFuelTypes": SupportedFuelTypes,
+    "Vehicle.Powertrain.FuelSystem.SupportedFuel": SupportedFuel,
+    "Vehicle.Powertrain.FuelSystem.HybridType": HybridType,
+    "Vehicle.Powertrain.TractionBattery.Charging.Timer.Mode": TimerMode,
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargePortFlap": ChargePortFlap,
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargePlugType": ChargePlugType,
+    "Vehicle.Powertrain.TractionBattery.Charging.Mode": ChargingMode,
+    "Vehicle.Powertrain.TractionBattery.Charging.StartStopCharging": StartStopCharging,
+    "Vehicle.Powertrain.Transmission.Type": TransmissionType,
+    "Vehicle.Powertrain.Transmission.DriveType": DriveType,
+    "Vehicle.Powertrain.Transmission.PerformanceMode": PerformanceMode,
+    "Vehicle.Powertrain.Transmission.GearChangeMode": GearChangeMode,
+    "Vehicle.Powertrain.Type": PowertrainType,
+    "Vehicle.LowVoltageSystemState": LowVoltageSystemState,
+}
+
+
+def enum_of(datapoint: DataPoint) -> Optional[Type[IntEnum]]:
+    """Return the enumeration of a data point, None if its values are not closed."""
+    return ENUMS.get(spec_path(datapoint))
+
+
+@lru_cache(maxsize=None)
+def members(enum_type: Type[IntEnum]) -> Tuple[IntEnum, ...]:
+    """Return the members of an enumeration, indexable by their integer."""
+    return tuple(enum_type)
+
+
+def member_of(enum_type: Type[IntEnum], value):
+    """
+    Return the member of a string value, or the list of members of an array
+    value. Strings outside the enumeration, e.g. of an unset value, are
+    returned unchanged.
+    """
+    if isinstance(value, str):
+        return enum_type.__members__.get(value, value)
+    return [enum_type.__members__.get(element, element) for element in value]
+
+
+class EnumReply(DataPointReply):
+    """
+    Reply of a subscription whose get() returns the values of enumerated
+    string signals as members of their IntEnum instead of strings.
+    """
+
+    def get(self, datapoint):  # type: ignore
+        result = super().get(datapoint)
+        enum_type = enum_of(datapoint)
+        if enum_type is not None:
+            result.value = member_of(enum_type, result.value)
+        return result
+
+
+def enum_replies(
+    call_back: Callable[[DataPointReply], Any],
+) -> Callable[[DataPointReply], Any]:
+    """Wrap a subscription callback to receive EnumReply instead of the replies."""
+    if asyncio.iscoroutinefunction(call_back):
+
+        async def on_update(reply: DataPointReply):
+            await call_back(EnumReply(reply.reply))
+
+        return on_update
+
+    return lambda reply: call_back(EnumReply(reply.reply))
@@ -0,0 +1,364 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process stand-in for the Databroker, serving a vehicle model from memory."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import grpc
+from sdv.proto.broker_pb2 import (
+    GetDatapointsReply,
+    GetMetadataReply,
+    SetDatapointsReply,
+    SubscribeReply,
+)
+from sdv.proto.types_pb2 import ChangeType
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.proto.types_pb2 import DatapointError, DataType, Metadata
+from sdv.vdb.client import VehicleDataBrokerClient
+
+from sdv_model.metadata import SIGNALS, spec_path
+from sdv_model.snapshot import iter_datapoints
+from sdv_model.validation import get_validator
+
+# field of the broker data point holding the values of each VSS datatype
+_FIELDS = {
+    "boolean": "bool_value",
+    "string": "string_value",
+    "float": "float_value",
+    "double": "double_value",
+    "int8": "int32_value",
+    "int16": "int32_value",
+    "int32": "int32_value",
+    "uint8": "uint32_value",
+    "uint16": "uint32_value",
+    "uint32": "uint32_value",
+    "string[]": "string_array",
+    "uint8[]": "uint32_array",
+}
+
+
+def _data_type(datatype: str):
+    name = datatype.replace("boolean", "bool").replace("[]", "_array").upper()
+    return DataType.Value(name)
+
+
+def _rpc_error(code: grpc.StatusCode, details: str) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(
+        code, grpc.aio.Metadata(), grpc.aio.Metadata(), details=details
+    )
+
+
+class _Subscriber:
+    """Changes of the data points of one subscription, not delivered yet."""
+
+    def __init__(self, paths: Tuple[str, ...]):
+        self.paths = paths
+        self.changes: Dict[str, BrokerDatapoint] = {}
+        self.changed = asyncio.Event()
+        # set while the subscriber waits for changes, with none pending
+        self.idle = asyncio.Event()
+
+
+class FakeDatabroker:
+    """
+    In-process stand-in for the Databroker, which serves all data points of a
+    vehicle model from memory, without any network.
+
+    Once installed, it replaces the gRPC stub of the VehicleDataBrokerClient,
+    so get(), set(), subscribe() and everything built on them take the same
+    code paths as with a real Databroker, which makes it possible to measure
+    the overhead of the model and the app on their own:
+
+        with FakeDatabroker(vehicle, latency=0.001) as broker:
+            broker.update({"Vehicle.Speed": 50.0})
+            await vehicle.Speed.get()
+
+    Like the Databroker, sets of several data points are applied all or none,
+    type and range errors are returned per data point, and subscriptions start
+    with the current values of their data points, followed by the changes.
+    Queries with WHERE clauses are not supported.
+
+    Changes are coalesced per subscription: all changes made while a reply
+    of the subscription is pending, i.e. during the latency delay, the
+    update_rate interval, or until the subscriber asks for the next reply,
+    are merged into the next reply, with the latest value of every data
+    point. Only changes made one at a time, with the subscriber waiting,
+    arrive in replies of their own.
+
+    ...
+
+    Attributes
+    ----------
+    latency : float
+        Seconds every request takes, and every update takes to reach the
+        subscribers
+    update_rate : float, optional
+        Maximum number of replies per second of each subscription. Changes
+        in between are merged into the next reply, as the Databroker does for
+        slow subscribers. Without a rate, replies are only limited by the
+        latency and by the subscriber.
+
+    Methods
+    -------
+    install()
+        Serve the requests of the VehicleDataBrokerClient
+
+    uninstall()
+        Restore the gRPC stub of the VehicleDataBrokerClient and end all
+        subscriptions
+
+    update(values=dict)
+        Set the values of data points, keyed by path
+
+    feed(path=str, values=iterable, rate=float)
+        Start a task setting a data point to one value after the other
+
+    drain()
+        Wait until the subscribers handled all changes made so far
+    """
+
+    def __init__(
+        self,
+        vehicle,
+        latency: float = 0.0,
+        update_rate: Optional[float] = None,
+    ):
+        self.latency = latency
+        self.update_rate = update_rate
+        self._vehicle = vehicle
+        self._datatypes: Dict[str, str] = {}
+        self._kinds: Dict[str, str] = {}
+        for path, datapoint in iter_datapoints(vehicle, vehicle.get_path()):
+            metadata = SIGNALS[spec_path(datapoint)]
+            self._datatypes[path] = metadata.datatype
+            self._kinds[path] = metadata.kind
+        self._values: Dict[str, BrokerDatapoint] = {}
+        self._subscribers: List[_Subscriber] = []
+        self._feeds: List["asyncio.Task[None]"] = []
+        self._previous_stub: Any = None
+        self._installed = False
+
+    def install(self):
+        if self._installed:
+            return
+        client = VehicleDataBrokerClient()
+        self._previous_stub = client._stub  # pylint: disable=W0212
+        VehicleDataBrokerClient._stub = self  # pylint: disable=W0212
+        self._installed = True
+
+    def uninstall(self):
+        if not self._installed:
+            return
+        VehicleDataBrokerClient._stub = self._previous_stub  # pylint: disable=W0212
+        self._previous_stub = None
+        self._installed = False
+        # the feeds remove themselves once they are cancelled
+        for feed in list(self._feeds):
+            feed.cancel()
+        subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.changed.set()
+
+    def __enter__(self) -> "FakeDatabroker":
+        self.install()
+        return self
+
+    def __exit__(self, *args):
+        self.uninstall()
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        return tuple(self._datatypes)
+
+    def value_of(self, path: str):
+        """Return the current value of a data point, None if it has none."""
+        broker_data_point = self._values.get(path)
+        if broker_data_point is None:
+            return None
+        return self._vehicle.get_by_path(path).value_of(broker_data_point)
+
+    def update(self, values: Mapping[str, Any]):
+        """
+        Set the values of data points, keyed by path, as a provider would.
+        Raises a KeyError for unknown paths; values are not validated.
+        """
+        changes = {}
+        for path, value in values.items():
+            if path not in self._datatypes:
+                raise KeyError(path)
+            datapoint = self._vehicle.get_by_path(path)
+            changes[path] = datapoint.create_validated_broker_data_point(value)
+        self._apply(changes)
+
+    def feed(
+        self, path: str, values: Iterable[Any], rate: float
+    ) -> "asyncio.Task[None]":
+        """
+        Start a task which sets a data point to the values one after the other,
+        rate times per second. The task ends with the values, or when the
+        broker is uninstalled.
+        """
+        if path not in self._datatypes:
+            raise KeyError(path)
+        task = asyncio.ensure_future(self._feed(path, values, 1 / rate))
+        self._feeds.append(task)
+        task.add_done_callback(self._feeds.remove)
+        return task
+
+    async def drain(self):
+        """
+        Wait until every subscription took the changes made so far, and its
+        subscriber handled them and asks for the next reply.
+        """
+        while True:
+            busy = [
+                subscriber
+                for subscriber in self._subscribers
+                if not subscriber.idle.is_set()
+            ]
+            if not busy:
+                return
+            await asyncio.gather(*(subscriber.idle.wait() for subscriber in busy))
+
+    async def _feed(self, path: str, values: Iterable[Any], period: float):
+        start = time.monotonic()
+        for count, value in enumerate(values):
+            delay = start + count * period - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.update({path: value})
+
+    def _apply(self, changes: Dict[str, BrokerDatapoint]):
+        now = time.time_ns()
+        for broker_data_point in changes.values():
+            broker_data_point.timestamp.FromNanoseconds(now)
+        self._values.update(changes)
+        for subscriber in self._subscribers:
+            for path in subscriber.paths:
+                if path in changes:
+                    subscriber.changes[path] = changes[path]
+                    subscriber.changed.set()
+                    subscriber.idle.clear()
+
+    async def _delay(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    # Methods of the gRPC stub used by the VehicleDataBrokerClient
+
+    async def GetDatapoints(self, request, metadata=None) -> GetDatapointsReply:
+        await self._delay()
+        reply = GetDatapointsReply()
+        for path in request.datapoints:
+            broker_data_point = reply.datapoints[path]
+            if path in self._values:
+                broker_data_point.CopyFrom(self._values[path])
+            elif path in self._datatypes:
+                broker_data_point.failure_value = BrokerDatapoint.NOT_AVAILABLE
+            else:
+                broker_data_point.failure_value = BrokerDatapoint.UNKNOWN_DATAPOINT
+        return reply
+
+    async def SetDatapoints(self, request, metadata=None) -> SetDatapointsReply:
+        await self._delay()
+        reply = SetDatapointsReply()
+        changes = {}
+        for path, broker_data_point in request.datapoints.items():
+            datatype = self._datatypes.get(path)
+            if datatype is None:
+                reply.errors[path] = DatapointError.UNKNOWN_DATAPOINT
+            elif broker_data_point.WhichOneof("value") != _FIELDS[datatype]:
+                reply.errors[path] = DatapointError.INVALID_TYPE
+            else:
+                datapoint = self._vehicle.get_by_path(path)
+                value = datapoint.value_of(broker_data_point)
+                if get_validator(spec_path(datapoint)).check(value) is not None:
+                    reply.errors[path] = DatapointError.OUT_OF_BOUNDS
+                else:
+                    changes[path] = BrokerDatapoint()
+                    changes[path].CopyFrom(broker_data_point)
+        if not reply.errors:
+            self._apply(changes)
+        return reply
+
+    async def GetMetadata(self, request, metadata=None) -> GetMetadataReply:
+        await self._delay()
+        reply = GetMetadataReply()
+        paths = list(self._datatypes)
+        for identifier, path in enumerate(paths):
+            if request.names and path not in request.names:
+                continue
+            change_type = (
+                ChangeType.STATIC
+                if self._kinds[path] == "attribute"
+                else ChangeType.ON_CHANGE
+            )
+            reply.list.append(
+                Metadata(
+                    id=identifier,
+                    name=path,
+                    data_type=_data_type(self._datatypes[path]),
+                    change_type=change_type,
+                )
+            )
+        return reply
+
+    def Subscribe(self, request, metadata=None) -> AsyncIterator[SubscribeReply]:
+        return self._subscribe(request.query)
+
+    async def _subscribe(self, query: str) -> AsyncIterator[SubscribeReply]:
+        if " WHERE " in query.upper() or not query.upper().startswith("SELECT "):
+            raise _rpc_error(
+                grpc.StatusCode.INVALID_ARGUMENT, f"Unsupported query: {query}"
+            )
+        paths = tuple(path.strip() for path in query[len("SELECT ") :].split(","))
+        unknown = [path for path in paths if path not in self._datatypes]
+        if unknown:
+            raise _rpc_error(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"Unknown data points: {', '.join(unknown)}",
+            )
+
+        subscriber = _Subscriber(paths)
+        self._subscribers.append(subscriber)
+        try:
+            await self._delay()
+            reply = SubscribeReply()
+            for path in paths:
+                if path in self._values:
+                    reply.fields[path].CopyFrom(self._values[path])
+            if reply.fields:
+                yield reply
+            while True:
+                if not subscriber.changed.is_set():
+                    subscriber.idle.set()
+                await subscriber.changed.wait()
+                if not self._installed:
+                    return
+                await self._delay()
+                subscriber.changed.clear()
+                changes, subscriber.changes = subscriber.changes, {}
+                reply = SubscribeReply()
+                for path, broker_data_point in changes.items():
+                    reply.fields[path].CopyFrom(broker_data_point)
+                yield reply
+                if self.update_rate:
+                    await asyncio.sleep(1 / self.update_rate)
+        finally:
+            subscriber.idle.set()
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
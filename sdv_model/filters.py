@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Filters reducing the updates of numeric data points passed to callbacks."""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from sdv.model import DataPoint
+from sdv.vdb.reply import DataPointReply
+
+
+class UpdateFilter:
+    """
+    Passes the updates of a subscription on to a callback, dropping the updates
+    which do not pass the configured filters. The filters only look at the
+    value of the filtered data point; updates without it, e.g. of the other
+    data points of a joined subscription, are passed on unfiltered:
+
+    deadband
+        Drop updates whose value differs by less than this from the value
+        passed on last.
+    relative_deadband
+        Drop updates whose value differs by less than this fraction of the
+        value passed on last, e.g. 0.01 for 1 %. With both deadbands set, an
+        update passes if it exceeds either of them.
+    min_interval
+        Drop updates arriving less than this many seconds after the update
+        passed on last.
+    max_rate
+        Pass on at most this many updates per second. Updates arriving in
+        between are held back, and the latest of them is passed on once the
+        interval is over, so the callback always ends up with the last value.
+    """
+
+    def __init__(
+        self,
+        datapoint: DataPoint,
+        call_back: Callable[[DataPointReply], Any],
+        deadband: Optional[float] = None,
+        relative_deadband: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_rate: Optional[float] = None,
+    ):
+        self._path = datapoint.get_path()
+        self._datapoint = datapoint
+        self._call_back = call_back
+        self._is_async = asyncio.iscoroutinefunction(call_back)
+        self._deadband = deadband
+        self._relative_deadband = relative_deadband
+        self._min_interval = min_interval
+        self._period = 1 / max_rate if max_rate else None
+
+        self._last_value: Optional[float] = None
+        self._last_time = -float("inf")
+        self._pending: Optional[DataPointReply] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _exceeds_deadband(self, value: float) -> bool:
+        last = self._last_value
+        if last is None:
+            return True
+        if self._deadband is None and self._relative_deadband is None:
+            return True
+        change = abs(value - last)
+        if self._deadband is not None and change >= self._deadband:
+            return True
+        return (
+            self._relative_deadband is not None
+            and change >= self._relative_deadband * abs(last)
+        )
+
+    async def on_update(self, reply: DataPointReply):
+        broker_data_point = reply.reply.fields.get(self._path)
+        if broker_data_point is None:
+            await self._call(reply)
+            return
+        value = self._datapoint.value_of(broker_data_point)  # type: ignore
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        if self._min_interval is not None and elapsed < self._min_interval:
+            return
+
+        passes = self._exceeds_deadband(value)
+        if self._period is not None and elapsed < self._period:
+            # latest value wins: hold it back until the interval is over, or
+            # drop the held value if the latest one is back within the deadband
+            self._pending = reply if passes else None
+            if passes and self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    self._period - elapsed, self._flush
+                )
+            return
+
+        if passes:
+            await self._deliver(reply, value, now)
+
+    def _flush(self):
+        self._timer = None
+        reply, self._pending = self._pending, None
+        if reply is not None:
+            value = self._datapoint.value_of(  # type: ignore
+                reply.reply.fields[self._path]
+            )
+            # passed on now, so updates arriving before the callback ran are
+            # filtered against this value and time
+            self._last_value = value
+            self._last_time = time.monotonic()
+            if self._is_async:
+                asyncio.ensure_future(self._call_back(reply))
+            else:
+                self._call_back(reply)
+
+    async def _deliver(self, reply: DataPointReply, value: float, now: float):
+        self._last_value = value
+        self._last_time = now
+        await self._call(reply)
+
+    async def _call(self, reply: DataPointReply):
+        if self._is_async:
+            await self._call_back(reply)
+        else:
+            self._call_back(reply)
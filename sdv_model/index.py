@@ -0,0 +1,159 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Lookup of model nodes by their VSS path."""
+
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from sdv.model import DataPoint, Model
+
+from sdv_model.collection import Collection
+from sdv_model.lazy import branch_names
+from sdv_model.query import PathTrie
+
+ModelNode = Union[DataPoint, Model]
+
+
+# slots of every branch which do not hold children
+_NODE_ATTRIBUTES = ("name", "parent")
+
+_child_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def child_names(model_type: type) -> Tuple[str, ...]:
+    """Return the attribute names of all possible children of a model class."""
+    cached = _child_names.get(model_type)
+    if cached is not None:
+        return cached
+    names = []
+    for cls in reversed(model_type.__mro__):
+        for name in getattr(cls, "__slots__", ()):
+            if name not in names and name not in _NODE_ATTRIBUTES:
+                names.append(name)
+    names.extend(name for name in branch_names(model_type) if name not in names)
+    cached = _child_names[model_type] = tuple(names)
+    return cached
+
+
+_instance_paths: Dict[str, Tuple[str, ...]] = {}
+
+
+def instance_paths(spec_path: str) -> Tuple[str, ...]:
+    """
+    Return the VSS paths of all instances of a specification path, e.g.
+    Vehicle.Chassis.Axle.Row1.WheelCount and Vehicle.Chassis.Axle.Row2.WheelCount
+    for Vehicle.Chassis.Axle.WheelCount, by walking the model classes, so no
+    branch is created.
+    """
+    cached = _instance_paths.get(spec_path)
+    if cached is not None:
+        return cached
+    from sdv_model import Vehicle  # pylint: disable=C0415
+
+    *branches, name = spec_path.split(".")
+    nodes: List[Tuple[str, type]] = [(branches[0], Vehicle)]
+    for branch in branches[1:]:
+        nodes = [
+            instance
+            for path, model_type in nodes
+            for instance in _instances(
+                f"{path}.{branch}", getattr(model_type, branch).resolve()
+            )
+        ]
+    cached = _instance_paths[spec_path] = tuple(f"{path}.{name}" for path, _ in nodes)
+    return cached
+
+
+def _instances(path: str, model_type: type) -> List[Tuple[str, type]]:
+    # a collection stands for its elements, which may be collections again
+    if not issubclass(model_type, Collection):
+        return [(path, model_type)]
+    return [
+        instance
+        for element in model_type._elements
+        for instance in _instances(
+            f"{path}.{element}", getattr(model_type, element).resolve()
+        )
+    ]
+
+
+def iter_children(model: Model) -> Iterator[Tuple[str, ModelNode]]:
+    """Yield the names and nodes of all data points and branches of a model."""
+    for name in child_names(type(model)):
+        child = getattr(model, name, None)
+        if isinstance(child, (DataPoint, Model)):
+            yield name, child
+
+
+class PathIndex:
+    """
+    Flat lookup tables between VSS paths and the nodes of a model tree.
+
+    Building the index creates all not yet created branches of the tree.
+
+    ...
+
+    Methods
+    -------
+    get(path=str)
+        Return the data point or branch with the given path
+
+    path_of(node=DataPoint | Model)
+        Return the path of a data point or branch of the tree
+
+    select(pattern=str)
+        Return the data points matching a wildcard pattern
+    """
+
+    def __init__(self, root: Model):
+        self._nodes: Dict[str, ModelNode] = {}
+        self._paths: Dict[ModelNode, str] = {}
+        self._trie: Optional[PathTrie] = None
+        self._add(root, root.get_path())
+
+    def _add(self, node: ModelNode, path: str):
+        self._nodes[path] = node
+        self._paths[node] = path
+        if isinstance(node, Model):
+            for name, child in iter_children(node):
+                self._add(child, f"{path}.{name}")
+
+    def get(self, path: str) -> ModelNode:
+        try:
+            return self._nodes[path]
+        except KeyError:
+            raise KeyError(f"No data point or branch with path {path!r}") from None
+
+    def path_of(self, node: ModelNode) -> str:
+        try:
+            return self._paths[node]
+        except KeyError:
+            raise KeyError(f"{node!r} is not part of this model") from None
+
+    def select(self, pattern: str) -> List[DataPoint]:
+        if self._trie is None:
+            self._trie = PathTrie(self._nodes.items())
+        return self._trie.select(pattern)
+
+    def items(self):
+        return self._nodes.items()
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
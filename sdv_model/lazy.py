@@ -0,0 +1,131 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-demand construction of model branches."""
+
+import sys
+from types import ModuleType
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+from sdv_model.model import Model
+
+
+class LazyBranch:
+    """
+    Class attribute creating a model branch the first time it is read.
+
+    The created branch is stored as instance attribute of the same name, so
+    every following access is a plain attribute lookup.
+
+    ...
+
+    Attributes
+    ----------
+    type_name : str
+        Name of the branch class, relative to the module of the owning class
+        (e.g. "Seat" or "SeatCollection.RowType").
+    """
+
+    def __init__(self, type_name: str):
+        self.type_name = type_name
+        self.name = type_name
+        self._module = ""
+        self._type = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._module = owner.__module__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        branch_type = self._type or self.resolve()
+        branch = branch_type(self.name, instance)
+        # setattr keeps the instance attributes in their compact form, while
+        # writing to __dict__ directly would materialize a dictionary
+        setattr(instance, self.name, branch)
+        return branch
+
+    def resolve(self):
+        """Return the branch class, looking it up on first use."""
+        if self._type is None:
+            target = sys.modules[self._module]
+            for part in self.type_name.split("."):
+                target = getattr(target, part)
+            self._type = target
+        return self._type
+
+
+_lazy_children: Dict[str, FrozenSet[str]] = {}
+
+
+class _Package(ModuleType):
+    """Generated package exposing the classes of its child packages."""
+
+    def __setattr__(self, name, value):
+        # The import system binds every imported child package to an attribute
+        # of its parent, which would hide the child class of the same name.
+        if isinstance(value, ModuleType) and name in _lazy_children[self.__name__]:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def load(package: str, name: str) -> type:
+    """Import the class of the given name from the child package of the same name."""
+    module_name = f"{package}.{name}"
+    # unlike importlib.import_module, __import__ takes the path of the import
+    # statement, which python -X importtime reports
+    __import__(module_name)
+    model_type = getattr(sys.modules[module_name], name)
+    setattr(sys.modules[package], name, model_type)
+    return model_type
+
+
+def lazy_import(package: str, children: Iterable[str]):
+    """
+    Return a module level __getattr__ (PEP 562) for a generated package, which
+    imports the classes of its child packages only when they are first accessed.
+    """
+    names = _lazy_children[package] = frozenset(children)
+    sys.modules[package].__class__ = _Package
+
+    def __getattr__(name: str):
+        if name in names:
+            return load(package, name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+_branch_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def branch_names(model_type: type) -> Tuple[str, ...]:
+    """Return the names of all lazily created branches of a model class."""
+    cached = _branch_names.get(model_type)
+    if cached is not None:
+        return cached
+    names = []
+    for cls in reversed(model_type.__mro__):
+        for name, value in vars(cls).items():
+            if isinstance(value, LazyBranch) and name not in names:
+                names.append(name)
+    cached = _branch_names[model_type] = tuple(names)
+    return cached
+
+
+def materialize(model: Model):
+    """Create all not yet created branches below the given model."""
+    for name in branch_names(type(model)):
+        materialize(getattr(model, name))
@@ -0,0 +1,1225 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Metadata of the data points of the vehicle model.
+
+Generated from the VSS specification together with the model classes. The
+table is keyed by the specification path of a signal, which does not contain
+instance names like Row1 or Left.
+"""
+
+# pylint: disable=C0301
+
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from sdv.model import DataPoint
+
+SENSOR = "sensor"
+ACTUATOR = "actuator"
+ATTRIBUTE = "attribute"
+
+
+class SignalMetadata(NamedTuple):
+    """Static description of a VSS signal."""
+
+    kind: str
+    datatype: str
+    unit: Optional[str] = None
+    min: Optional[Union[int, float]] = None
+    max: Optional[Union[int, float]] = None
+    allowed: Optional[Tuple[str, ...]] = None
+
+
+SIGNALS: Dict[str, SignalMetadata] = {
+    "Vehicle.ADAS.ABS.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.ABS.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ABS.IsEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.CruiseControl.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.CruiseControl.IsActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.CruiseControl.SpeedSet": SignalMetadata(
+        ACTUATOR, "float", unit="km/h"
+    ),
+    "Vehicle.ADAS.CruiseControl.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.EBA.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.EBA.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.EBA.IsEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.EBD.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.EBD.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.EBD.IsEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ESC.RoadFriction.MostProbable": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.ADAS.ESC.RoadFriction.LowerBound": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.ADAS.ESC.RoadFriction.UpperBound": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.ADAS.ESC.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.ESC.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ESC.IsEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ESC.IsStrongCrossWindDetected": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.LaneDepartureDetection.IsEnabled": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.ADAS.LaneDepartureDetection.IsWarning": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.LaneDepartureDetection.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ObstacleDetection.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.ObstacleDetection.IsWarning": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ObstacleDetection.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.TCS.IsEnabled": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.ADAS.TCS.IsError": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.TCS.IsEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.ADAS.ActiveAutonomyLevel": SignalMetadata(
+        SENSOR,
+        "string",
+        allowed=(
+            "SAE_0",
+            "SAE_1",
+            "SAE_2_DISENGAGING",
+            "SAE_2",
+            "SAE_3_DISENGAGING",
+            "SAE_3",
+            "SAE_4_DISENGAGING",
+            "SAE_4",
+            "SAE_5",
+        ),
+    ),
+    "Vehicle.ADAS.SupportedAutonomyLevel": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=("SAE_0", "SAE_1", "SAE_2", "SAE_3", "SAE_4", "SAE_5"),
+    ),
+    "Vehicle.Acceleration.Longitudinal": SignalMetadata(SENSOR, "float", unit="m/s^2"),
+    "Vehicle.Acceleration.Lateral": SignalMetadata(SENSOR, "float", unit="m/s^2"),
+    "Vehicle.Acceleration.Vertical": SignalMetadata(SENSOR, "float", unit="m/s^2"),
+    "Vehicle.AngularVelocity.Roll": SignalMetadata(SENSOR, "float", unit="degrees/s"),
+    "Vehicle.AngularVelocity.Pitch": SignalMetadata(SENSOR, "float", unit="degrees/s"),
+    "Vehicle.AngularVelocity.Yaw": SignalMetadata(SENSOR, "float", unit="degrees/s"),
+    "Vehicle.Body.Hood.IsOpen": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Horn.IsActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsHighBeamOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsLowBeamOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsRunningOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsBackupOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsParkingOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsBrakeOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsRearFogOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsFrontFogOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsHazardOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsLeftIndicatorOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Lights.IsRightIndicatorOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Mirrors.Tilt": SignalMetadata(
+        ACTUATOR, "int8", unit="percent", min=-100, max=100
+    ),
+    "Vehicle.Body.Mirrors.Pan": SignalMetadata(
+        ACTUATOR, "int8", unit="percent", min=-100, max=100
+    ),
+    "Vehicle.Body.Mirrors.IsHeatingOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Raindetection.Intensity": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Body.Trunk.IsOpen": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Trunk.IsLocked": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.Windshield.WasherFluid.IsLevelLow": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Body.Windshield.WasherFluid.Level": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.Mode": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("STOP_HOLD", "WIPE", "PLANT_MODE", "EMERGENCY_STOP"),
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.Frequency": SignalMetadata(
+        ACTUATOR, "uint8"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.TargetPosition": SignalMetadata(
+        ACTUATOR, "float", unit="degrees"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.ActualPosition": SignalMetadata(
+        ACTUATOR, "float", unit="degrees"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.DriveCurrent": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.IsWiping": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Body.Windshield.Wiping.System.IsEndingWipeCycle": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.IsWiperError": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.IsPositionReached": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.IsBlocked": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Body.Windshield.Wiping.System.IsOverheated": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Body.Windshield.Wiping.Mode": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("OFF", "SLOW", "MEDIUM", "FAST", "INTERVAL", "RAIN_SENSOR"),
+    ),
+    "Vehicle.Body.Windshield.Wiping.Intensity": SignalMetadata(ACTUATOR, "uint8"),
+    "Vehicle.Body.Windshield.Wiping.WiperWear": SignalMetadata(
+        SENSOR, "uint8", max=100
+    ),
+    "Vehicle.Body.Windshield.Wiping.IsWipersWorn": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Body.Windshield.IsHeatingOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Body.BodyType": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.Body.RefuelPosition": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=(
+            "FRONT_LEFT",
+            "FRONT_RIGHT",
+            "MIDDLE_LEFT",
+            "MIDDLE_RIGHT",
+            "REAR_LEFT",
+            "REAR_RIGHT",
+        ),
+    ),
+    "Vehicle.Body.RearMainSpoilerPosition": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Convertible.Status": SignalMetadata(
+        SENSOR,
+        "string",
+        allowed=("UNDEFINED", "CLOSED", "OPEN", "CLOSING", "OPENING", "STALLED"),
+    ),
+    "Vehicle.Cabin.Door.Shade.Switch": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("INACTIVE", "CLOSE", "OPEN", "ONE_SHOT_CLOSE", "ONE_SHOT_OPEN"),
+    ),
+    "Vehicle.Cabin.Door.Shade.Position": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Door.Window.IsOpen": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Door.Window.Position": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Door.Window.IsChildLockEngaged": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Door.Window.Switch": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("INACTIVE", "CLOSE", "OPEN", "ONE_SHOT_CLOSE", "ONE_SHOT_OPEN"),
+    ),
+    "Vehicle.Cabin.Door.IsOpen": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Door.IsLocked": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Door.IsChildLockActive": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.HVAC.Station.FanSpeed": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.HVAC.Station.Temperature": SignalMetadata(
+        ACTUATOR, "int8", unit="celsius"
+    ),
+    "Vehicle.Cabin.HVAC.Station.AirDistribution": SignalMetadata(
+        ACTUATOR, "string", allowed=("UP", "MIDDLE", "DOWN")
+    ),
+    "Vehicle.Cabin.HVAC.IsRecirculationActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.HVAC.IsFrontDefrosterActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.HVAC.IsRearDefrosterActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.HVAC.IsAirConditioningActive": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.HVAC.AmbientAirTemperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.CurrentLanguage": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.HMI.DateFormat": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "YYYY_MM_DD",
+            "DD_MM_YYYY",
+            "MM_DD_YYYY",
+            "YY_MM_DD",
+            "DD_MM_YY",
+            "MM_DD_YY",
+        ),
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.TimeFormat": SignalMetadata(
+        ACTUATOR, "string", allowed=("HR_12", "HR_24")
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.DistanceUnit": SignalMetadata(
+        ACTUATOR, "string", allowed=("MILES", "KILOMETERS")
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.FuelEconomyUnits": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "MPG_UK",
+            "MPG_US",
+            "MILES_PER_LITER",
+            "KILOMETERS_PER_LITER",
+            "LITERS_PER_100_KILOMETERS",
+        ),
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.EVEconomyUnits": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "MILES_PER_KILOWATT_HOUR",
+            "KILOMETERS_PER_KILOWATT_HOUR",
+            "KILOWATT_HOURS_PER_100_MILES",
+            "KILOWATT_HOURS_PER_100_KILOMETERS",
+            "WATT_HOURS_PER_MILE",
+            "WATT_HOURS_PER_KILOMETER",
+        ),
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.TemperatureUnit": SignalMetadata(
+        ACTUATOR, "string", allowed=("C", "F")
+    ),
+    "Vehicle.Cabin.Infotainment.HMI.DayNightMode": SignalMetadata(
+        ACTUATOR, "string", allowed=("DAY", "NIGHT")
+    ),
+    "Vehicle.Cabin.Infotainment.Media.Played.Source": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "UNKNOWN",
+            "SIRIUS_XM",
+            "AM",
+            "FM",
+            "DAB",
+            "TV",
+            "CD",
+            "DVD",
+            "AUX",
+            "USB",
+            "DISK",
+            "BLUETOOTH",
+            "INTERNET",
+            "VOICE",
+            "BEEP",
+        ),
+    ),
+    "Vehicle.Cabin.Infotainment.Media.Played.Artist": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.Played.Album": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.Played.Track": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.Played.URI": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.Action": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "UNKNOWN",
+            "STOP",
+            "PLAY",
+            "FAST_FORWARD",
+            "FAST_BACKWARD",
+            "SKIP_FORWARD",
+            "SKIP_BACKWARD",
+        ),
+    ),
+    "Vehicle.Cabin.Infotainment.Media.DeclinedURI": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.SelectedURI": SignalMetadata(ACTUATOR, "string"),
+    "Vehicle.Cabin.Infotainment.Media.Volume": SignalMetadata(
+        ACTUATOR, "uint8", min=0, max=100
+    ),
+    "Vehicle.Cabin.Infotainment.Navigation.DestinationSet.Latitude": SignalMetadata(
+        ACTUATOR, "double", unit="degrees", min=-90, max=90
+    ),
+    "Vehicle.Cabin.Infotainment.Navigation.DestinationSet.Longitude": SignalMetadata(
+        ACTUATOR, "double", unit="degrees", min=-180, max=180
+    ),
+    "Vehicle.Cabin.Lights.Spotlight.IsSharedOn": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Lights.Spotlight.IsLeftOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Lights.Spotlight.IsRightOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Lights.IsGloveBoxOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Lights.IsTrunkOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Lights.IsDomeOn": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Lights.AmbientLight": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Lights.LightIntensity": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.RearShade.Switch": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("INACTIVE", "CLOSE", "OPEN", "ONE_SHOT_CLOSE", "ONE_SHOT_OPEN"),
+    ),
+    "Vehicle.Cabin.RearShade.Position": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.RearviewMirror.DimmingLevel": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Cabin.Seat.Airbag.IsDeployed": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Seat.Backrest.Lumbar.Support": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Seat.Backrest.Lumbar.Height": SignalMetadata(
+        ACTUATOR, "uint8", unit="mm", min=0
+    ),
+    "Vehicle.Cabin.Seat.Backrest.SideBolster.Support": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Seat.Backrest.Recline": SignalMetadata(
+        ACTUATOR, "float", unit="degrees"
+    ),
+    "Vehicle.Cabin.Seat.Headrest.Height": SignalMetadata(
+        ACTUATOR, "uint8", unit="mm", min=0
+    ),
+    "Vehicle.Cabin.Seat.Headrest.Angle": SignalMetadata(
+        ACTUATOR, "float", unit="degrees"
+    ),
+    "Vehicle.Cabin.Seat.Occupant.Identifier.Subject": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Seat.Occupant.Identifier.Issuer": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Cabin.Seat.Seating.Length": SignalMetadata(
+        ACTUATOR, "uint16", unit="mm", min=0
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.Lumbar.IsMoreSupportEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.Lumbar.IsLessSupportEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.Lumbar.IsUpEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.Lumbar.IsDownEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.SideBolster.IsMoreSupportEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.SideBolster.IsLessSupportEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.IsReclineForwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Backrest.IsReclineBackwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Headrest.IsUpEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Headrest.IsDownEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Headrest.IsForwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Headrest.IsBackwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Massage.IsIncreaseEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Massage.IsDecreaseEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Seating.IsForwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.Seating.IsBackwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.IsWarmerEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsCoolerEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsForwardEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsBackwardEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsUpEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsDownEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Cabin.Seat.Switch.IsTiltForwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.Switch.IsTiltBackwardEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Cabin.Seat.IsOccupied": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Seat.IsBelted": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Cabin.Seat.Heating": SignalMetadata(
+        ACTUATOR, "int8", unit="percent", min=-100, max=100
+    ),
+    "Vehicle.Cabin.Seat.Massage": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Seat.Position": SignalMetadata(ACTUATOR, "uint16", unit="mm", min=0),
+    "Vehicle.Cabin.Seat.Height": SignalMetadata(ACTUATOR, "uint16", unit="mm", min=0),
+    "Vehicle.Cabin.Seat.Tilt": SignalMetadata(ACTUATOR, "float", unit="degrees"),
+    "Vehicle.Cabin.Sunroof.Shade.Switch": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=("INACTIVE", "CLOSE", "OPEN", "ONE_SHOT_CLOSE", "ONE_SHOT_OPEN"),
+    ),
+    "Vehicle.Cabin.Sunroof.Shade.Position": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Cabin.Sunroof.Position": SignalMetadata(SENSOR, "int8", min=-100, max=100),
+    "Vehicle.Cabin.Sunroof.Switch": SignalMetadata(
+        ACTUATOR,
+        "string",
+        allowed=(
+            "INACTIVE",
+            "CLOSE",
+            "OPEN",
+            "ONE_SHOT_CLOSE",
+            "ONE_SHOT_OPEN",
+            "TILT_UP",
+            "TILT_DOWN",
+        ),
+    ),
+    "Vehicle.Cabin.DoorCount": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.Cabin.DriverPosition": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.Cabin.SeatRowCount": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.Cabin.SeatPosCount": SignalMetadata(ATTRIBUTE, "uint8[]"),
+    "Vehicle.Chassis.Accelerator.PedalPosition": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Brake.FluidLevel": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Brake.IsFluidLevelLow": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Brake.PadWear": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Brake.IsBrakesWorn": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Chassis.Axle.Wheel.Tire.Pressure": SignalMetadata(
+        SENSOR, "uint16", unit="kPa"
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Tire.IsPressureLow": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Chassis.Axle.Wheel.Tire.Temperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Chassis.Axle.Wheel.Speed": SignalMetadata(SENSOR, "float", unit="km/h"),
+    "Vehicle.Chassis.Axle.WheelCount": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.Chassis.Axle.WheelDiameter": SignalMetadata(
+        ATTRIBUTE, "float", unit="inch"
+    ),
+    "Vehicle.Chassis.Axle.WheelWidth": SignalMetadata(ATTRIBUTE, "float", unit="inch"),
+    "Vehicle.Chassis.Axle.TireDiameter": SignalMetadata(
+        ATTRIBUTE, "float", unit="inch"
+    ),
+    "Vehicle.Chassis.Axle.TireWidth": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+    "Vehicle.Chassis.Axle.TireAspectRatio": SignalMetadata(
+        ATTRIBUTE, "uint8", unit="percent"
+    ),
+    "Vehicle.Chassis.Brake.PedalPosition": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Chassis.Brake.IsDriverEmergencyBrakingDetected": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Chassis.ParkingBrake.IsEngaged": SignalMetadata(ACTUATOR, "boolean"),
+    "Vehicle.Chassis.SteeringWheel.Angle": SignalMetadata(
+        SENSOR, "int16", unit="degrees"
+    ),
+    "Vehicle.Chassis.SteeringWheel.Tilt": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Chassis.SteeringWheel.Extension": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Chassis.SteeringWheel.Position": SignalMetadata(
+        ATTRIBUTE, "string", allowed=("FRONT_LEFT", "FRONT_RIGHT")
+    ),
+    "Vehicle.Chassis.Wheelbase": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+    "Vehicle.Chassis.Track": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+    "Vehicle.Chassis.AxleCount": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.Connectivity.IsConnectivityAvailable": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.CurrentLocation.GNSSReceiver.MountingPosition.X": SignalMetadata(
+        ATTRIBUTE, "int16", unit="mm"
+    ),
+    "Vehicle.CurrentLocation.GNSSReceiver.MountingPosition.Y": SignalMetadata(
+        ATTRIBUTE, "int16", unit="mm"
+    ),
+    "Vehicle.CurrentLocation.GNSSReceiver.MountingPosition.Z": SignalMetadata(
+        ATTRIBUTE, "int16", unit="mm"
+    ),
+    "Vehicle.CurrentLocation.GNSSReceiver.FixType": SignalMetadata(
+        SENSOR,
+        "string",
+        allowed=(
+            "NONE",
+            "TWO_D",
+            "TWO_D_SATELLITE_BASED_AUGMENTATION",
+            "TWO_D_GROUND_BASED_AUGMENTATION",
+            "TWO_D_SATELLITE_AND_GROUND_BASED_AUGMENTATION",
+            "THREE_D",
+            "THREE_D_SATELLITE_BASED_AUGMENTATION",
+            "THREE_D_GROUND_BASED_AUGMENTATION",
+            "THREE_D_SATELLITE_AND_GROUND_BASED_AUGMENTATION",
+        ),
+    ),
+    "Vehicle.CurrentLocation.Timestamp": SignalMetadata(SENSOR, "string"),
+    "Vehicle.CurrentLocation.Latitude": SignalMetadata(
+        SENSOR, "double", unit="degrees", min=-90, max=90
+    ),
+    "Vehicle.CurrentLocation.Longitude": SignalMetadata(
+        SENSOR, "double", unit="degrees", min=-180, max=180
+    ),
+    "Vehicle.CurrentLocation.Heading": SignalMetadata(
+        SENSOR, "double", unit="degrees", min=0, max=360
+    ),
+    "Vehicle.CurrentLocation.HorizontalAccuracy": SignalMetadata(
+        SENSOR, "double", unit="m"
+    ),
+    "Vehicle.CurrentLocation.Altitude": SignalMetadata(SENSOR, "double", unit="m"),
+    "Vehicle.CurrentLocation.VerticalAccuracy": SignalMetadata(
+        SENSOR, "double", unit="m"
+    ),
+    "Vehicle.Driver.Identifier.Subject": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Driver.Identifier.Issuer": SignalMetadata(SENSOR, "string"),
+    "Vehicle.Driver.DistractionLevel": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Driver.IsEyesOnRoad": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Driver.AttentiveProbability": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Driver.FatigueLevel": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Driver.HeartRate": SignalMetadata(SENSOR, "uint16"),
+    "Vehicle.Exterior.AirTemperature": SignalMetadata(SENSOR, "float", unit="celsius"),
+    "Vehicle.Exterior.Humidity": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Exterior.LightIntensity": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.OBD.Catalyst.Bank1.Temperature1": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.OBD.Catalyst.Bank1.Temperature2": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.OBD.Catalyst.Bank2.Temperature1": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.OBD.Catalyst.Bank2.Temperature2": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.OBD.DriveCycleStatus.IsMILOn": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.OBD.DriveCycleStatus.DTCCount": SignalMetadata(SENSOR, "uint8"),
+    "Vehicle.OBD.DriveCycleStatus.IgnitionType": SignalMetadata(
+        SENSOR, "string", allowed=("SPARK", "COMPRESSION")
+    ),
+    "Vehicle.OBD.O2.Voltage": SignalMetadata(SENSOR, "float", unit="V"),
+    "Vehicle.OBD.O2.ShortTermFuelTrim": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.O2WR.Lambda": SignalMetadata(SENSOR, "float"),
+    "Vehicle.OBD.O2WR.Voltage": SignalMetadata(SENSOR, "float", unit="V"),
+    "Vehicle.OBD.O2WR.Current": SignalMetadata(SENSOR, "float", unit="A"),
+    "Vehicle.OBD.Status.IsMILOn": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.OBD.Status.DTCCount": SignalMetadata(SENSOR, "uint8"),
+    "Vehicle.OBD.Status.IgnitionType": SignalMetadata(
+        SENSOR, "string", allowed=("SPARK", "COMPRESSION")
+    ),
+    "Vehicle.OBD.PidsA": SignalMetadata(SENSOR, "uint32"),
+    "Vehicle.OBD.DTCList": SignalMetadata(SENSOR, "string[]"),
+    "Vehicle.OBD.FreezeDTC": SignalMetadata(SENSOR, "string"),
+    "Vehicle.OBD.FuelStatus": SignalMetadata(SENSOR, "string"),
+    "Vehicle.OBD.EngineLoad": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.CoolantTemperature": SignalMetadata(SENSOR, "float", unit="celsius"),
+    "Vehicle.OBD.ShortTermFuelTrim1": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermFuelTrim1": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ShortTermFuelTrim2": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermFuelTrim2": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.FuelPressure": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.MAP": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.EngineSpeed": SignalMetadata(SENSOR, "float", unit="rpm"),
+    "Vehicle.OBD.Speed": SignalMetadata(SENSOR, "float", unit="km/h"),
+    "Vehicle.OBD.TimingAdvance": SignalMetadata(SENSOR, "float", unit="degrees"),
+    "Vehicle.OBD.IntakeTemp": SignalMetadata(SENSOR, "float", unit="celsius"),
+    "Vehicle.OBD.MAF": SignalMetadata(SENSOR, "float", unit="g/s"),
+    "Vehicle.OBD.ThrottlePosition": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.AirStatus": SignalMetadata(SENSOR, "string"),
+    "Vehicle.OBD.OxygenSensorsIn2Banks": SignalMetadata(SENSOR, "uint8"),
+    "Vehicle.OBD.OBDStandards": SignalMetadata(ATTRIBUTE, "uint8"),
+    "Vehicle.OBD.OxygenSensorsIn4Banks": SignalMetadata(SENSOR, "uint8"),
+    "Vehicle.OBD.IsPTOActive": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.OBD.RunTime": SignalMetadata(SENSOR, "float", unit="s"),
+    "Vehicle.OBD.PidsB": SignalMetadata(SENSOR, "uint32"),
+    "Vehicle.OBD.DistanceWithMIL": SignalMetadata(SENSOR, "float", unit="km"),
+    "Vehicle.OBD.FuelRailPressureVac": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.FuelRailPressureDirect": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.CommandedEGR": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.EGRError": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.CommandedEVAP": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.FuelLevel": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.WarmupsSinceDTCClear": SignalMetadata(SENSOR, "uint8"),
+    "Vehicle.OBD.DistanceSinceDTCClear": SignalMetadata(SENSOR, "float", unit="km"),
+    "Vehicle.OBD.EVAPVaporPressure": SignalMetadata(SENSOR, "float", unit="Pa"),
+    "Vehicle.OBD.BarometricPressure": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.PidsC": SignalMetadata(SENSOR, "uint32"),
+    "Vehicle.OBD.ControlModuleVoltage": SignalMetadata(SENSOR, "float", unit="V"),
+    "Vehicle.OBD.AbsoluteLoad": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.CommandedEquivalenceRatio": SignalMetadata(
+        SENSOR, "float", unit="ratio"
+    ),
+    "Vehicle.OBD.RelativeThrottlePosition": SignalMetadata(
+        SENSOR, "float", unit="percent"
+    ),
+    "Vehicle.OBD.AmbientAirTemperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.OBD.ThrottlePositionB": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ThrottlePositionC": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.AcceleratorPositionD": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.AcceleratorPositionE": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.AcceleratorPositionF": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ThrottleActuator": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.RunTimeMIL": SignalMetadata(SENSOR, "float", unit="min"),
+    "Vehicle.OBD.TimeSinceDTCCleared": SignalMetadata(SENSOR, "float", unit="min"),
+    "Vehicle.OBD.MaxMAF": SignalMetadata(SENSOR, "float", unit="g/s"),
+    "Vehicle.OBD.FuelType": SignalMetadata(SENSOR, "string"),
+    "Vehicle.OBD.EthanolPercent": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.EVAPVaporPressureAbsolute": SignalMetadata(
+        SENSOR, "float", unit="kPa"
+    ),
+    "Vehicle.OBD.EVAPVaporPressureAlternate": SignalMetadata(
+        SENSOR, "float", unit="Pa"
+    ),
+    "Vehicle.OBD.ShortTermO2Trim1": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ShortTermO2Trim3": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermO2Trim1": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermO2Trim3": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ShortTermO2Trim2": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.ShortTermO2Trim4": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermO2Trim2": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.LongTermO2Trim4": SignalMetadata(SENSOR, "float", unit="percent"),
+    "Vehicle.OBD.FuelRailPressureAbsolute": SignalMetadata(SENSOR, "float", unit="kPa"),
+    "Vehicle.OBD.RelativeAcceleratorPosition": SignalMetadata(
+        SENSOR, "float", unit="percent"
+    ),
+    "Vehicle.OBD.HybridBatteryRemaining": SignalMetadata(
+        SENSOR, "float", unit="percent"
+    ),
+    "Vehicle.OBD.OilTemperature": SignalMetadata(SENSOR, "float", unit="celsius"),
+    "Vehicle.OBD.FuelInjectionTiming": SignalMetadata(SENSOR, "float", unit="degrees"),
+    "Vehicle.OBD.FuelRate": SignalMetadata(SENSOR, "float", unit="l/h"),
+    "Vehicle.Powertrain.CombustionEngine.DieselExhaustFluid.Capacity": SignalMetadata(
+        ATTRIBUTE, "float", unit="l"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselExhaustFluid.Level": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselExhaustFluid.Range": SignalMetadata(
+        SENSOR, "uint32", unit="m"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselExhaustFluid.IsLevelLow": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselParticulateFilter.InletTemperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselParticulateFilter.OutletTemperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.DieselParticulateFilter.DeltaPressure": SignalMetadata(
+        SENSOR, "float", unit="Pa"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EngineCode": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.Displacement": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="cm^3"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.StrokeLength": SignalMetadata(
+        ATTRIBUTE, "float", unit="mm"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.Bore": SignalMetadata(
+        ATTRIBUTE, "float", unit="mm"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.Configuration": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=(
+            "UNKNOWN",
+            "STRAIGHT",
+            "V",
+            "BOXER",
+            "W",
+            "ROTARY",
+            "RADIAL",
+            "SQUARE",
+            "H",
+            "U",
+            "OPPOSED",
+            "X",
+        ),
+    ),
+    "Vehicle.Powertrain.CombustionEngine.NumberOfCylinders": SignalMetadata(
+        ATTRIBUTE, "uint16"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.NumberOfValvesPerCylinder": SignalMetadata(
+        ATTRIBUTE, "uint16"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.CompressionRatio": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EngineOilCapacity": SignalMetadata(
+        ATTRIBUTE, "float", unit="l"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EngineCoolantCapacity": SignalMetadata(
+        ATTRIBUTE, "float", unit="l"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.MaxPower": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="kW"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.MaxTorque": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="Nm"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.AspirationType": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=("UNKNOWN", "NATURAL", "SUPERCHARGER", "TURBOCHARGER"),
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EngineOilLevel": SignalMetadata(
+        SENSOR,
+        "string",
+        allowed=("CRITICALLY_LOW", "LOW", "NORMAL", "HIGH", "CRITICALLY_HIGH"),
+    ),
+    "Vehicle.Powertrain.CombustionEngine.OilLifeRemaining": SignalMetadata(
+        SENSOR, "int32", unit="s"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.IsRunning": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Powertrain.CombustionEngine.Speed": SignalMetadata(
+        SENSOR, "uint16", unit="rpm"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EngineHours": SignalMetadata(
+        SENSOR, "float", unit="h"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.IdleHours": SignalMetadata(
+        SENSOR, "float", unit="h"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.ECT": SignalMetadata(
+        SENSOR, "int16", unit="celsius"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EOT": SignalMetadata(
+        SENSOR, "int16", unit="celsius"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.MAP": SignalMetadata(
+        SENSOR, "uint16", unit="kPa"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.MAF": SignalMetadata(
+        SENSOR, "uint16", unit="g/s"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.TPS": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Powertrain.CombustionEngine.EOP": SignalMetadata(
+        SENSOR, "uint16", unit="kPa"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.Power": SignalMetadata(
+        SENSOR, "uint16", unit="kW"
+    ),
+    "Vehicle.Powertrain.CombustionEngine.Torque": SignalMetadata(
+        SENSOR, "uint16", unit="Nm"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.EngineCode": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.Powertrain.ElectricMotor.MaxPower": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="kW"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.MaxTorque": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="Nm"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.MaxRegenPower": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="kW"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.MaxRegenTorque": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="Nm"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.Speed": SignalMetadata(
+        SENSOR, "int32", unit="rpm"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.Temperature": SignalMetadata(
+        SENSOR, "int16", unit="celsius"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.CoolantTemperature": SignalMetadata(
+        SENSOR, "int16", unit="celsius"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.Power": SignalMetadata(
+        SENSOR, "int16", unit="kW"
+    ),
+    "Vehicle.Powertrain.ElectricMotor.Torque": SignalMetadata(
+        SENSOR, "int16", unit="Nm"
+    ),
+    "Vehicle.Powertrain.FuelSystem.SupportedFuelTypes": SignalMetadata(
+        ATTRIBUTE,
+        "string[]",
+        allowed=("GASOLINE", "DIESEL", "E85", "LPG", "CNG", "LNG", "H2", "OTHER"),
+    ),
+    "Vehicle.Powertrain.FuelSystem.SupportedFuel": SignalMetadata(
+        ATTRIBUTE,
+        "string[]",
+        allowed=(
+            "E5_95",
+            "E5_98",
+            "E10_95",
+            "E10_98",
+            "E85",
+            "B7",
+            "B10",
+            "B20",
+            "B30",
+            "B100",
+            "XTL",
+            "LPG",
+            "CNG",
+            "LNG",
+            "H2",
+            "OTHER",
+        ),
+    ),
+    "Vehicle.Powertrain.FuelSystem.HybridType": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=("UNKNOWN", "NOT_APPLICABLE", "STOP_START", "BELT_ISG", "CIMG", "PHEV"),
+    ),
+    "Vehicle.Powertrain.FuelSystem.TankCapacity": SignalMetadata(
+        ATTRIBUTE, "float", unit="l"
+    ),
+    "Vehicle.Powertrain.FuelSystem.Level": SignalMetadata(
+        SENSOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.FuelSystem.Range": SignalMetadata(SENSOR, "uint32", unit="m"),
+    "Vehicle.Powertrain.FuelSystem.InstantConsumption": SignalMetadata(
+        SENSOR, "float", unit="l/100km", min=0
+    ),
+    "Vehicle.Powertrain.FuelSystem.AverageConsumption": SignalMetadata(
+        SENSOR, "float", unit="l/100km", min=0
+    ),
+    "Vehicle.Powertrain.FuelSystem.ConsumptionSinceStart": SignalMetadata(
+        SENSOR, "float", unit="l"
+    ),
+    "Vehicle.Powertrain.FuelSystem.TimeSinceStart": SignalMetadata(
+        SENSOR, "uint32", unit="s"
+    ),
+    "Vehicle.Powertrain.FuelSystem.IsEngineStopStartEnabled": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.FuelSystem.IsFuelLevelLow": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeCurrent.DC": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeCurrent.Phase1": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeCurrent.Phase2": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeCurrent.Phase3": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeVoltage.DC": SignalMetadata(
+        SENSOR, "float", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeVoltage.Phase1": SignalMetadata(
+        SENSOR, "float", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeVoltage.Phase2": SignalMetadata(
+        SENSOR, "float", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeVoltage.Phase3": SignalMetadata(
+        SENSOR, "float", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.MaximumChargingCurrent.DC": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.MaximumChargingCurrent.Phase1": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.MaximumChargingCurrent.Phase2": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.MaximumChargingCurrent.Phase3": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.Timer.Mode": SignalMetadata(
+        ACTUATOR, "string", allowed=("INACTIVE", "START_TIME", "END_TIME")
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.Timer.Time": SignalMetadata(
+        ACTUATOR, "string"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeLimit": SignalMetadata(
+        ACTUATOR, "uint8", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargePortFlap": SignalMetadata(
+        ACTUATOR, "string", allowed=("OPEN", "CLOSED")
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.IsChargingCableConnected": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.IsChargingCableLocked": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargePlugType": SignalMetadata(
+        ATTRIBUTE,
+        "string[]",
+        allowed=(
+            "IEC_TYPE_1_AC",
+            "IEC_TYPE_2_AC",
+            "IEC_TYPE_3_AC",
+            "IEC_TYPE_4_DC",
+            "IEC_TYPE_1_CCS_DC",
+            "IEC_TYPE_2_CCS_DC",
+            "TESLA_ROADSTER",
+            "TESLA_HPWC",
+            "TESLA_SUPERCHARGER",
+            "GBT_AC",
+            "GBT_DC",
+            "OTHER",
+        ),
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.Mode": SignalMetadata(
+        ACTUATOR, "string", allowed=("MANUAL", "TIMER", "GRID", "PROFILE")
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.IsCharging": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.IsDischarging": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.StartStopCharging": SignalMetadata(
+        ACTUATOR, "string", allowed=("START", "STOP")
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.PowerLoss": SignalMetadata(
+        SENSOR, "float", unit="W"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.Temperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.ChargeRate": SignalMetadata(
+        SENSOR, "float", unit="km/h"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Charging.TimeToComplete": SignalMetadata(
+        SENSOR, "uint32", unit="s"
+    ),
+    "Vehicle.Powertrain.TractionBattery.DCDC.PowerLoss": SignalMetadata(
+        SENSOR, "float", unit="W"
+    ),
+    "Vehicle.Powertrain.TractionBattery.DCDC.Temperature": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.TractionBattery.StateOfCharge.Current": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100.0
+    ),
+    "Vehicle.Powertrain.TractionBattery.StateOfCharge.Displayed": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100.0
+    ),
+    "Vehicle.Powertrain.TractionBattery.Temperature.Average": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Temperature.Min": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Temperature.Max": SignalMetadata(
+        SENSOR, "float", unit="celsius"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Id": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.Powertrain.TractionBattery.ProductionDate": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.Powertrain.TractionBattery.IsPowerConnected": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.IsGroundConnected": SignalMetadata(
+        SENSOR, "boolean"
+    ),
+    "Vehicle.Powertrain.TractionBattery.GrossCapacity": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="kWh"
+    ),
+    "Vehicle.Powertrain.TractionBattery.NetCapacity": SignalMetadata(
+        SENSOR, "uint16", unit="kWh"
+    ),
+    "Vehicle.Powertrain.TractionBattery.StateOfHealth": SignalMetadata(
+        SENSOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.TractionBattery.NominalVoltage": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.MaxVoltage": SignalMetadata(
+        ATTRIBUTE, "uint16", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.CurrentVoltage": SignalMetadata(
+        SENSOR, "float", unit="V"
+    ),
+    "Vehicle.Powertrain.TractionBattery.CurrentCurrent": SignalMetadata(
+        SENSOR, "float", unit="A"
+    ),
+    "Vehicle.Powertrain.TractionBattery.CurrentPower": SignalMetadata(
+        SENSOR, "float", unit="W"
+    ),
+    "Vehicle.Powertrain.TractionBattery.AccumulatedChargedEnergy": SignalMetadata(
+        SENSOR, "float", unit="kWh"
+    ),
+    "Vehicle.Powertrain.TractionBattery.AccumulatedConsumedEnergy": SignalMetadata(
+        SENSOR, "float", unit="kWh"
+    ),
+    "Vehicle.Powertrain.TractionBattery.AccumulatedChargedThroughput": SignalMetadata(
+        SENSOR, "float", unit="Ah"
+    ),
+    "Vehicle.Powertrain.TractionBattery.AccumulatedConsumedThroughput": SignalMetadata(
+        SENSOR, "float", unit="Ah"
+    ),
+    "Vehicle.Powertrain.TractionBattery.PowerLoss": SignalMetadata(
+        SENSOR, "float", unit="W"
+    ),
+    "Vehicle.Powertrain.TractionBattery.Range": SignalMetadata(
+        SENSOR, "uint32", unit="m"
+    ),
+    "Vehicle.Powertrain.Transmission.Type": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=("UNKNOWN", "SEQUENTIAL", "H", "AUTOMATIC", "DSG", "CVT"),
+    ),
+    "Vehicle.Powertrain.Transmission.GearCount": SignalMetadata(ATTRIBUTE, "int8"),
+    "Vehicle.Powertrain.Transmission.DriveType": SignalMetadata(
+        ATTRIBUTE,
+        "string",
+        allowed=(
+            "UNKNOWN",
+            "FORWARD_WHEEL_DRIVE",
+            "REAR_WHEEL_DRIVE",
+            "ALL_WHEEL_DRIVE",
+        ),
+    ),
+    "Vehicle.Powertrain.Transmission.TravelledDistance": SignalMetadata(
+        SENSOR, "float", unit="km"
+    ),
+    "Vehicle.Powertrain.Transmission.CurrentGear": SignalMetadata(SENSOR, "int8"),
+    "Vehicle.Powertrain.Transmission.SelectedGear": SignalMetadata(ACTUATOR, "int8"),
+    "Vehicle.Powertrain.Transmission.IsParkLockEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Powertrain.Transmission.IsLowRangeEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Powertrain.Transmission.IsElectricalPowertrainEngaged": SignalMetadata(
+        ACTUATOR, "boolean"
+    ),
+    "Vehicle.Powertrain.Transmission.PerformanceMode": SignalMetadata(
+        ACTUATOR, "string", allowed=("NORMAL", "SPORT", "ECONOMY", "SNOW", "RAIN")
+    ),
+    "Vehicle.Powertrain.Transmission.GearChangeMode": SignalMetadata(
+        ACTUATOR, "string", allowed=("MANUAL", "AUTOMATIC")
+    ),
+    "Vehicle.Powertrain.Transmission.Temperature": SignalMetadata(
+        SENSOR, "int16", unit="celsius"
+    ),
+    "Vehicle.Powertrain.Transmission.ClutchEngagement": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.Transmission.ClutchWear": SignalMetadata(
+        SENSOR, "uint8", unit="percent", max=100
+    ),
+    "Vehicle.Powertrain.Transmission.DiffLockFrontEngagement": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.Transmission.DiffLockRearEngagement": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=0, max=100
+    ),
+    "Vehicle.Powertrain.Transmission.TorqueDistribution": SignalMetadata(
+        ACTUATOR, "float", unit="percent", min=-100, max=100
+    ),
+    "Vehicle.Powertrain.AccumulatedBrakingEnergy": SignalMetadata(
+        SENSOR, "float", unit="kWh"
+    ),
+    "Vehicle.Powertrain.Range": SignalMetadata(SENSOR, "uint32", unit="m"),
+    "Vehicle.Powertrain.Type": SignalMetadata(
+        ATTRIBUTE, "string", allowed=("COMBUSTION", "HYBRID", "ELECTRIC")
+    ),
+    "Vehicle.Service.IsServiceDue": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.Service.DistanceToService": SignalMetadata(SENSOR, "float", unit="km"),
+    "Vehicle.Service.TimeToService": SignalMetadata(SENSOR, "int32", unit="s"),
+    "Vehicle.Trailer.IsConnected": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.VehicleIdentification.VIN": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.WMI": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.Brand": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.Model": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.Year": SignalMetadata(ATTRIBUTE, "uint16"),
+    "Vehicle.VehicleIdentification.AcrissCode": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.BodyType": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.DateVehicleFirstRegistered": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.MeetsEmissionStandard": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.ProductionDate": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.PurchaseDate": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.VehicleIdentification.VehicleModelDate": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.VehicleConfiguration": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.VehicleSeatingCapacity": SignalMetadata(
+        ATTRIBUTE, "uint16"
+    ),
+    "Vehicle.VehicleIdentification.VehicleSpecialUsage": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.VehicleInteriorColor": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.VehicleInteriorType": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VehicleIdentification.KnownVehicleDamages": SignalMetadata(
+        ATTRIBUTE, "string"
+    ),
+    "Vehicle.VersionVSS.Major": SignalMetadata(ATTRIBUTE, "uint32"),
+    "Vehicle.VersionVSS.Minor": SignalMetadata(ATTRIBUTE, "uint32"),
+    "Vehicle.VersionVSS.Patch": SignalMetadata(ATTRIBUTE, "uint32"),
+    "Vehicle.VersionVSS.Label": SignalMetadata(ATTRIBUTE, "string"),
+    "Vehicle.LowVoltageSystemState": SignalMetadata(
+        SENSOR, "string", allowed=("UNDEFINED", "LOCK", "OFF", "ACC", "ON", "START")
+    ),
+    "Vehicle.Speed": SignalMetadata(SENSOR, "float", unit="km/h"),
+    "Vehicle.TravelledDistance": SignalMetadata(SENSOR, "float", unit="km"),
+    "Vehicle.TripMeterReading": SignalMetadata(SENSOR, "float", unit="km"),
+    "Vehicle.IsBrokenDown": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.IsMoving": SignalMetadata(SENSOR, "boolean"),
+    "Vehicle.AverageSpeed": SignalMetadata(SENSOR, "float", unit="km/h"),
+    "Vehicle.RoofLoad": SignalMetadata(ATTRIBUTE, "int16", unit="kg"),
+    "Vehicle.CargoVolume": SignalMetadata(ATTRIBUTE, "float", unit="l", min=0),
+    "Vehicle.EmissionsCO2": SignalMetadata(ATTRIBUTE, "int16", unit="g/km"),
+    "Vehicle.CurrentOverallWeight": SignalMetadata(SENSOR, "uint16", unit="kg"),
+    "Vehicle.CurbWeight": SignalMetadata(ATTRIBUTE, "uint16", unit="kg"),
+    "Vehicle.GrossWeight": SignalMetadata(ATTRIBUTE, "uint16", unit="kg"),
+    "Vehicle.MaxTowWeight": SignalMetadata(ATTRIBUTE, "uint16", unit="kg"),
+    "Vehicle.MaxTowBallWeight": SignalMetadata(ATTRIBUTE, "uint16", unit="kg"),
+    "Vehicle.Length": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+    "Vehicle.Height": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+    "Vehicle.Width": SignalMetadata(ATTRIBUTE, "uint16", unit="mm"),
+}
+
+
+_spec_paths: Dict[Tuple[type, str], str] = {}
+
+
+def spec_path(datapoint: DataPoint) -> str:
+    """Return the specification path of a data point, e.g. Vehicle.Cabin.Seat.Heating."""
+    key = (type(datapoint.parent), datapoint.name)
+    path = _spec_paths.get(key)
+    if path is None:
+        module = key[0].__module__
+        path = _spec_paths[key] = (
+            "Vehicle" + module[len("sdv_model") :] + "." + datapoint.name
+        )
+    return path
+
+
+def get_metadata(datapoint: DataPoint) -> SignalMetadata:
+    """Return the metadata of a data point of the vehicle model."""
+    return SIGNALS[spec_path(datapoint)]
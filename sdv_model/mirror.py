@@ -0,0 +1,138 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process copy of the latest values of data points, fed by one subscription."""
+
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from sdv.model import DataPoint
+from sdv.vdb.reply import DataPointReply
+from sdv.vdb.types import TypedDataPointResult
+
+from sdv_model.multiplexer import MultiplexedSubscription, SubscriptionMultiplexer
+
+
+class MirroredValue:
+    """
+    Latest value of a mirrored data point.
+
+    ...
+
+    Attributes
+    ----------
+    result : TypedDataPointResult, optional
+        Latest value and timestamp, None until the first update
+    updates : int
+        Number of updates received
+    received : float
+        time.monotonic() of the latest update
+    """
+
+    __slots__ = ("result", "updates", "received")
+
+    def __init__(self):
+        self.result: Optional[TypedDataPointResult] = None
+        self.updates = 0
+        self.received = 0.0
+
+
+class Mirror:
+    """
+    Latest values of a set of data points, kept up to date by one subscription
+    to all of them. While the mirror runs, DataPoint.get() of a mirrored data
+    point is answered from memory, unless its latest update is older than
+    max_age seconds.
+
+    ...
+
+    Methods
+    -------
+    start(multiplexer=SubscriptionMultiplexer)
+        Subscribe to the mirrored data points
+
+    stop()
+        End the subscription
+
+    get(datapoint=DataPoint)
+        Return the latest result of a data point, None if unknown or too old
+
+    lookup(datapoint=DataPoint)
+        Return the mirrored value of a data point, None if it is not mirrored
+    """
+
+    def __init__(self, datapoints: Dict[str, DataPoint], max_age: Optional[float]):
+        self.max_age = max_age
+        self._datapoints = datapoints
+        self._values: Dict[DataPoint, MirroredValue] = {
+            datapoint: MirroredValue() for datapoint in datapoints.values()
+        }
+        self._subscription: Optional[MultiplexedSubscription] = None
+
+    @property
+    def paths(self) -> Iterable[str]:
+        return self._datapoints.keys()
+
+    @property
+    def is_running(self) -> bool:
+        return self._subscription is not None
+
+    def start(self, multiplexer: SubscriptionMultiplexer):
+        if self._subscription is None:
+            self._subscription = multiplexer.subscribe(
+                self._datapoints, self._on_update
+            )
+
+    async def stop(self):
+        if self._subscription is not None:
+            subscription, self._subscription = self._subscription, None
+            await subscription.unsubscribe()
+
+    def _on_update(self, reply: DataPointReply):
+        received = time.monotonic()
+        for path, broker_data_point in reply.reply.fields.items():
+            datapoint = self._datapoints.get(path)
+            if datapoint is None:
+                continue
+            entry = self._values[datapoint]
+            entry.result = TypedDataPointResult(
+                path,
+                datapoint.value_of(broker_data_point),  # type: ignore
+                broker_data_point.timestamp,
+            )
+            entry.updates += 1
+            entry.received = received
+
+    def values_by_path(self) -> Dict[str, Any]:
+        """Return the latest values received, keyed by path."""
+        return {
+            path: entry.result.value
+            for path, entry in zip(self._datapoints, self._values.values())
+            if entry.result is not None
+        }
+
+    def lookup(self, datapoint: DataPoint) -> Optional[MirroredValue]:
+        return self._values.get(datapoint)
+
+    def get(self, datapoint: DataPoint) -> Optional[TypedDataPointResult]:
+        """Return the mirrored result of a data point, None if unknown or stale."""
+        entry = self._values.get(datapoint)
+        if entry is None or entry.result is None:
+            return None
+        if (
+            self.max_age is not None
+            and time.monotonic() - entry.received > self.max_age
+        ):
+            return None
+        return entry.result
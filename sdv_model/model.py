@@ -0,0 +1,74 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Base class of the branches of the vehicle model."""
+
+from typing import TYPE_CHECKING
+
+from sdv import model
+
+from sdv_model.queues import DROP_OLDEST
+
+if TYPE_CHECKING:
+    from sdv_model.batch import BatchSetBuilder
+    from sdv_model.snapshot import Snapshot
+    from sdv_model.stream import UpdateStream
+
+
+class Model(model.Model):
+    """
+    A branch of the vehicle model, extending the Model of the SDK with
+    operations on all data points below the branch.
+
+    ...
+
+    Methods
+    -------
+    set_many()
+        Return a builder setting the values of many data points with one request
+
+    snapshot()
+        Fetch the values of all data points below the branch with one request
+
+    stream()
+        Iterate over the change sets of the data points below the branch
+    """
+
+    # name and parent are set by Node of the SDK, which has no __slots__; as
+    # slots they keep the instance dictionary of branches empty
+    __slots__ = ("name", "parent")
+
+    def set_many(self) -> "BatchSetBuilder":
+        # pylint: disable=C0415
+        from sdv_model.batch import BatchSetBuilder
+
+        return BatchSetBuilder(self.get_client())
+
+    async def snapshot(self) -> "Snapshot":
+        # pylint: disable=C0415
+        from sdv_model.snapshot import take_snapshot
+
+        return await take_snapshot(self)
+
+    def stream(
+        self,
+        maxsize: int = 0,
+        policy: str = DROP_OLDEST,
+        multiplex: bool = False,
+        as_enum: bool = False,
+    ) -> "UpdateStream":
+        # pylint: disable=C0415
+        from sdv_model.stream import UpdateStream
+
+        return UpdateStream(self, maxsize, policy, multiplex, as_enum)
@@ -0,0 +1,328 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sharing of one Databroker subscription between all subscribers of a process."""
+
+import asyncio
+import functools
+import logging
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from sdv.proto.broker_pb2 import SubscribeReply
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.vdb.reply import DataPointReply
+from sdv.vdb.subscriptions import SubscriptionManager, VdbSubscription
+
+if TYPE_CHECKING:
+    from sdv_model.queues import UpdateQueue
+
+logger = logging.getLogger(__name__)
+
+
+class MultiplexedSubscription:
+    """
+    Subscription of a callback to some data points, served by the upstream
+    subscription of a SubscriptionMultiplexer. Offers the methods of the
+    subscriptions of the SDK.
+    """
+
+    def __init__(
+        self,
+        multiplexer: "SubscriptionMultiplexer",
+        paths: Tuple[str, ...],
+        call_back: Callable[[DataPointReply], Any],
+    ):
+        self.paths = paths
+        self._path_set = frozenset(paths)
+        self.query = "SELECT " + ", ".join(paths)
+        self.call_back = call_back
+        self._multiplexer = multiplexer
+        # set until the subscriber received the current values of its paths
+        self.initial = True
+        # queue of the updates not passed on to the callback yet, if any
+        self.queue: Optional["UpdateQueue"] = None
+        self._pending: Deque[DataPointReply] = deque()
+        self._worker: Optional["asyncio.Future[None]"] = None
+
+    def reply_of(self, reply: DataPointReply) -> DataPointReply:
+        """Return the update with the values of the data points of the subscription."""
+        fields = reply.reply.fields
+        if self._path_set.issuperset(fields):
+            return reply
+        own = SubscribeReply()
+        for path in self.paths:
+            if path in fields:
+                own.fields[path].CopyFrom(fields[path])
+        return DataPointReply(own)
+
+    def deliver(self, reply: DataPointReply):
+        """
+        Pass an update on to the callback, by a task of its own which calls it
+        with one pending update after the other, in order.
+        """
+        self._pending.append(reply)
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._drain())
+
+    async def _drain(self):
+        try:
+            while self._pending:
+                await _call(self.call_back, self._pending.popleft())
+        finally:
+            self._worker = None
+
+    async def drain(self):
+        """Wait until the callback handled all updates delivered so far."""
+        while self._worker is not None:
+            await asyncio.shield(self._worker)
+
+    async def unsubscribe(self):
+        self._multiplexer.remove(self)
+        self._pending.clear()
+        if self.queue is not None:
+            self.queue.close()
+
+    async def subscribe(self):
+        if self.queue is not None:
+            self.queue.reopen()
+        self._multiplexer.add(self)
+
+
+class SubscriptionMultiplexer:
+    """
+    Merges the subscriptions of all local subscribers into one upstream
+    subscription to the union of their data points, and fans the updates out to
+    the callbacks of the subscribers of the updated data points. Each callback
+    gets the values of the data points of its subscription only, and is
+    called by a task of the subscription, so a slow callback does not hold up
+    the others. Updates arriving faster than a callback handles them are kept
+    until it is ready; subscribe with a queue_size to bound them.
+
+    Changes of the data points are applied update_delay seconds after the
+    first of them, however many subscribers were added or removed meanwhile.
+    The upstream subscription is only replaced when data points were added;
+    data points no longer subscribed to are dropped with the next replacement,
+    or when there are no subscribers left. The replaced subscription keeps
+    delivering updates until the new one delivered its first reply, so no
+    update is lost in between. Values that did not change since they were
+    last received, e.g. the initial values of the new subscription, are only
+    delivered to subscribers which did not receive them yet.
+
+    ...
+
+    Attributes
+    ----------
+    update_delay : float
+        Seconds changes of the subscribed data points are collected before
+        they are applied to the upstream subscription
+
+    Methods
+    -------
+    subscribe(paths=list, call_back=callable)
+        Subscribe a callback to data points
+
+    add(subscription=MultiplexedSubscription)
+        Add a subscription again, after it was removed
+
+    remove(subscription=MultiplexedSubscription)
+        Remove a subscription
+
+    dispatch(reply=DataPointReply)
+        Pass an update on to the subscribers of its data points
+
+    drain()
+        Wait until the callbacks handled all updates dispatched so far
+
+    disconnect()
+        End the upstream subscription, so updates only come from dispatch()
+
+    connect()
+        Subscribe upstream again, after disconnect()
+    """
+
+    def __init__(self, client, update_delay: float = 0.01):
+        self.update_delay = update_delay
+        self._client = client
+        self._subscribers: Dict[str, List[MultiplexedSubscription]] = {}
+        self._latest: Dict[str, BrokerDatapoint] = {}
+        self._upstream: Optional[VdbSubscription] = None
+        # the replaced upstream subscription, until the new one replied
+        self._previous: Optional[VdbSubscription] = None
+        self._upstream_paths: Tuple[str, ...] = ()
+        self._update_scheduled = False
+        self._connected = True
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        """The data points of the upstream subscription."""
+        return self._upstream_paths
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def disconnect(self):
+        """
+        End the upstream subscription, and open none until connect(). The
+        subscribers then only get the updates passed to dispatch(), e.g. by
+        sdv_model.replay.replay(), without any request to the Databroker.
+        """
+        self._connected = False
+        _stop(self._previous)
+        _stop(self._upstream)
+        self._previous = self._upstream = None
+        self._upstream_paths = ()
+
+    def connect(self):
+        """Subscribe to the data points of the subscribers upstream again."""
+        if not self._connected:
+            self._connected = True
+            self._schedule_update()
+
+    def subscribe(
+        self, paths: Iterable[str], call_back: Callable[[DataPointReply], Any]
+    ) -> MultiplexedSubscription:
+        subscription = MultiplexedSubscription(self, tuple(paths), call_back)
+        self.add(subscription)
+        return subscription
+
+    def add(self, subscription: MultiplexedSubscription):
+        subscription.initial = True
+        for path in subscription.paths:
+            subscribers = self._subscribers.setdefault(path, [])
+            if subscription not in subscribers:
+                subscribers.append(subscription)
+        # values received before are delivered right away
+        if all(path in self._latest for path in subscription.paths):
+            asyncio.get_running_loop().call_soon(self._replay, subscription)
+        self._schedule_update()
+
+    def remove(self, subscription: MultiplexedSubscription):
+        for path in subscription.paths:
+            subscribers = self._subscribers.get(path)
+            if subscribers and subscription in subscribers:
+                subscribers.remove(subscription)
+                if not subscribers:
+                    del self._subscribers[path]
+        self._schedule_update()
+
+    def _schedule_update(self):
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            asyncio.get_running_loop().call_later(
+                self.update_delay, self._update_upstream
+            )
+
+    def _update_upstream(self):
+        self._update_scheduled = False
+        if not self._connected:
+            return
+        subscribed = self._subscribers.keys()
+        if not subscribed:
+            _stop(self._previous)
+            _stop(self._upstream)
+            self._previous = self._upstream = None
+            self._upstream_paths = ()
+            self._latest.clear()
+            return
+        if subscribed <= set(self._upstream_paths):
+            return
+        paths = tuple(sorted(subscribed))
+        # a subscription replaced before is stopped, whether it replied or not
+        _stop(self._previous)
+        self._previous = self._upstream
+        self._upstream_paths = paths
+        self._latest = {
+            path: self._latest[path] for path in paths if path in self._latest
+        }
+        upstream = VdbSubscription(self._client, "SELECT " + ", ".join(paths))
+        upstream.call_back = functools.partial(self._receive, upstream)
+        self._upstream = upstream
+        SubscriptionManager._add_subscription(upstream)  # pylint: disable=W0212
+        logger.debug("Multiplexing %d data points", len(paths))
+
+    async def _receive(self, upstream: VdbSubscription, reply: DataPointReply):
+        if upstream is self._upstream and self._previous is not None:
+            _stop(self._previous)
+            self._previous = None
+        await self.dispatch(reply)
+
+    def _replay(self, subscription: MultiplexedSubscription):
+        if not subscription.initial:
+            return
+        reply = DataPointReply(SubscribeReply())
+        for path in subscription.paths:
+            if path not in self._latest:
+                return
+            reply.reply.fields[path].CopyFrom(self._latest[path])
+        subscription.initial = False
+        subscription.deliver(reply)
+
+    async def dispatch(self, reply: DataPointReply):
+        """
+        Pass an update on to the subscribers of its data points. Returns
+        without waiting for the callbacks, so a slow callback neither delays
+        the other subscribers nor the upstream subscription.
+        """
+        latest = self._latest
+        receivers: Dict[MultiplexedSubscription, None] = {}
+        for path, datapoint in reply.reply.fields.items():
+            changed = latest.get(path) != datapoint
+            if changed:
+                latest[path] = datapoint
+            for subscription in self._subscribers.get(path, ()):
+                if changed or subscription.initial:
+                    receivers[subscription] = None
+        for subscription in receivers:
+            subscription.initial = False
+            subscription.deliver(subscription.reply_of(reply))
+
+    async def drain(self):
+        """Wait until the callbacks handled all updates dispatched so far."""
+        subscriptions = {
+            subscription: None
+            for subscribers in self._subscribers.values()
+            for subscription in subscribers
+        }
+        for subscription in subscriptions:
+            await subscription.drain()
+
+
+def _stop(upstream: Optional[VdbSubscription]):
+    # VdbSubscription.unsubscribe() leaves the task in the subscription manager
+    tasks = SubscriptionManager._subscription_tasks  # pylint: disable=W0212
+    task = tasks.pop(upstream, None)
+    if task is not None:
+        task.cancel()
+
+
+async def _call(call_back: Callable[[DataPointReply], Any], reply: DataPointReply):
+    try:
+        if asyncio.iscoroutinefunction(call_back):
+            await call_back(reply)
+        else:
+            call_back(reply)
+    except Exception:  # pylint: disable=W0703
+        logger.exception("Error occured in the callback of a subscription")
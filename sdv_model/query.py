@@ -0,0 +1,132 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Selection of data points by wildcard patterns over their VSS paths."""
+
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
+
+from sdv.model import DataPoint, Model
+
+_LITERAL = 0
+_ANY = 1
+_GLOB = 2
+_DEEP = 3
+
+Segment = Tuple[int, object]
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> Tuple[Segment, ...]:
+    """
+    Compile a path pattern into a tuple of segment matchers.
+
+    The pattern is split at dots. A segment is matched literally, unless it is
+    "*" (any single segment), "**" (any number of segments, including none) or
+    contains one of the shell wildcards *, ? or [...], e.g. "Is*On".
+    """
+    segments: List[Segment] = []
+    for segment in pattern.split("."):
+        if not segment:
+            raise ValueError(f"Empty segment in pattern {pattern!r}")
+        if segment == "**":
+            segments.append((_DEEP, None))
+        elif segment == "*":
+            segments.append((_ANY, None))
+        elif any(char in segment for char in "*?["):
+            segments.append((_GLOB, re.compile(fnmatch.translate(segment)).match))
+        else:
+            segments.append((_LITERAL, segment))
+    return tuple(segments)
+
+
+class _TrieNode:
+    __slots__ = ("node", "children")
+
+    def __init__(self, node: Union[DataPoint, Model]):
+        self.node = node
+        self.children: Dict[str, "_TrieNode"] = {}
+
+
+class PathTrie:
+    """
+    Trie of the VSS path segments of a model tree.
+
+    Literal pattern segments are resolved with one dictionary lookup per
+    segment, so the cost of a selection depends on the number of branches the
+    wildcards fan out to, not on the size of the whole tree.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Union[DataPoint, Model]]]):
+        self._root: Dict[str, _TrieNode] = {}
+        for path, node in items:
+            *parents, name = path.split(".")
+            level = self._root
+            for segment in parents:
+                level = level[segment].children
+            level[name] = _TrieNode(node)
+
+    def select(self, pattern: str) -> List[DataPoint]:
+        """Return all data points whose path matches the pattern, in tree order."""
+        segments = compile_pattern(pattern)
+        matches: List[DataPoint] = []
+        self._match(self._root, segments, 0, matches)
+        if sum(kind == _DEEP for kind, _ in segments) > 1:
+            # several "**" can reach the same data point on different ways
+            matches = list({id(node): node for node in matches}.values())
+        return matches
+
+    def _match(
+        self,
+        level: Dict[str, _TrieNode],
+        segments: Tuple[Segment, ...],
+        position: int,
+        matches: List[DataPoint],
+    ):
+        kind, argument = segments[position]
+        last = position == len(segments) - 1
+
+        if kind == _DEEP:
+            if last:
+                self._collect(level, matches)
+                return
+            self._match(level, segments, position + 1, matches)
+            for child in level.values():
+                self._match(child.children, segments, position, matches)
+            return
+
+        if kind == _LITERAL:
+            child = level.get(argument)  # type: ignore
+            candidates: Iterable[_TrieNode] = () if child is None else (child,)
+        elif kind == _ANY:
+            candidates = level.values()
+        else:
+            candidates = (
+                child for name, child in level.items() if argument(name)  # type: ignore
+            )
+
+        for child in candidates:
+            if not last:
+                self._match(child.children, segments, position + 1, matches)
+            elif isinstance(child.node, DataPoint):
+                matches.append(child.node)
+
+    def _collect(self, level: Dict[str, _TrieNode], matches: List[DataPoint]):
+        for child in level.values():
+            if isinstance(child.node, DataPoint):
+                matches.append(child.node)
+            else:
+                self._collect(child.children, matches)
@@ -0,0 +1,188 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bounded queues of subscription updates, for callbacks slower than the updates."""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Optional
+
+from sdv.proto.broker_pb2 import SubscribeReply
+from sdv.vdb.reply import DataPointReply
+
+logger = logging.getLogger(__name__)
+
+# what a full queue does with another update
+DROP_OLDEST = "drop-oldest"
+DROP_NEWEST = "drop-newest"
+COALESCE = "coalesce"
+BLOCK = "block"
+
+POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE, BLOCK)
+
+
+def merge_replies(older: DataPointReply, newer: DataPointReply) -> DataPointReply:
+    """Return a reply with the latest value of every data point of both replies."""
+    reply = SubscribeReply()
+    reply.fields.MergeFrom(older.reply.fields)
+    reply.fields.MergeFrom(newer.reply.fields)
+    return DataPointReply(reply)
+
+
+class UpdateQueue:
+    """
+    First-in first-out queue of updates holding at most maxsize of them.
+
+    The policy decides what happens to an update arriving at a full queue:
+
+    drop-oldest
+        The oldest queued update is dropped to make room.
+    drop-newest
+        The arriving update is dropped.
+    coalesce
+        The arriving update is merged into the newest queued one, so the
+        latest value of every data point is kept, but intermediate values of
+        data points updated again are lost.
+    block
+        put() waits until there is room, which holds up the delivery of the
+        updates of all other subscribers too and, once the buffers of the
+        connection are full, the Databroker.
+
+    ...
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of queued updates, 0 for no limit
+    policy : str
+        One of DROP_OLDEST, DROP_NEWEST, COALESCE and BLOCK
+    dropped : int
+        Number of updates dropped so far
+    coalesced : int
+        Number of updates merged into a queued update so far
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str = DROP_OLDEST,
+        merge: Callable[[Any, Any], Any] = merge_replies,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, expected one of {POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self._merge = merge
+        self._items: Deque[Any] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._closed = False
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item):
+        """
+        Queue an update, applying the policy if the queue is full. Raises
+        asyncio.QueueFull if the policy is BLOCK.
+        """
+        items = self._items
+        if self.full():
+            if self.policy == BLOCK:
+                raise asyncio.QueueFull
+            if self.policy == DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.policy == COALESCE:
+                items[-1] = self._merge(items[-1], item)
+                self.coalesced += 1
+                return
+            items.popleft()
+            self.dropped += 1
+        items.append(item)
+        self._not_empty.set()
+
+    async def put(self, item):
+        while self.policy == BLOCK and self.full() and not self._closed:
+            self._not_full.clear()
+            await self._not_full.wait()
+        if not self._closed:
+            self.put_nowait(item)
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty
+        self._not_full.set()
+        return self._items.popleft()
+
+    async def get(self) -> Optional[Any]:
+        """Return the oldest update, waiting for one; None once the queue is closed."""
+        while not self._items:
+            if self._closed:
+                return None
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def close(self):
+        """Drop the queued updates and wake up the waiting consumer and producer."""
+        self._closed = True
+        self._items.clear()
+        self._not_empty.set()
+        self._not_full.set()
+
+    def reopen(self):
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class QueuedCallback:
+    """
+    Decouples a callback from the delivery of the updates: updates are queued
+    and passed on to the callback by a task of their own, which runs while
+    there are updates in the queue. A slow callback therefore neither delays
+    the other subscribers nor lets the updates pile up without limit.
+    """
+
+    def __init__(self, call_back: Callable[[DataPointReply], Any], queue: UpdateQueue):
+        self.queue = queue
+        self._call_back = call_back
+        self._is_async = asyncio.iscoroutinefunction(call_back)
+        self._worker: Optional["asyncio.Future[None]"] = None
+
+    async def on_update(self, reply: DataPointReply):
+        await self.queue.put(reply)
+        if self._worker is None and len(self.queue):
+            self._worker = asyncio.ensure_future(self._drain())
+
+    async def _drain(self):
+        try:
+            while len(self.queue):
+                reply = self.queue.get_nowait()
+                try:
+                    if self._is_async:
+                        await self._call_back(reply)
+                    else:
+                        self._call_back(reply)
+                        # let the updates in, or a slow callback starves them
+                        await asyncio.sleep(0)
+                except Exception:  # pylint: disable=W0703
+                    logger.exception("Error occured in the callback of a subscription")
+        finally:
+            self._worker = None
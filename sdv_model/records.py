@@ -0,0 +1,322 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Fixed-layout binary records of the values of all data points of a vehicle.
+
+A file of records starts with a 16 byte header: the magic b"SDVREC01" and the
+fingerprint of the layout. The records follow without any separator, so the
+file can be memory mapped as an array of records. Reading the records requires
+NumPy, writing them does not.
+"""
+
+import hashlib
+import struct
+from enum import IntEnum
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from sdv.model import Model
+
+from sdv_model.enums import enum_of, members
+from sdv_model.metadata import SIGNALS, spec_path
+from sdv_model.snapshot import iter_datapoints
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+MAGIC = b"SDVREC01"
+HEADER_SIZE = 16
+
+# struct format of the numeric datatypes; enumerated strings are stored as
+# the uint8 code of their IntEnum, booleans as one bit
+_FORMATS = {
+    "double": "d",
+    "float": "f",
+    "int32": "i",
+    "uint32": "I",
+    "int16": "h",
+    "uint16": "H",
+    "int8": "b",
+    "uint8": "B",
+}
+_NUMPY_FORMATS = {
+    "d": "<f8",
+    "f": "<f4",
+    "i": "<i4",
+    "I": "<u4",
+    "h": "<i2",
+    "H": "<u2",
+    "b": "i1",
+    "B": "u1",
+}
+
+
+class RecordLayout:
+    """
+    Byte layout of the records of the data points of a vehicle or branch.
+
+    Every number, boolean and enumerated string gets a fixed offset, which only
+    depends on the generated model: after the timestamp (float64) come the
+    numbers ordered by size, so each of them is naturally aligned, then the
+    bits of the booleans and a bit per data point telling whether its value is
+    known. Enumerated strings are stored as the uint8 code of their IntEnum.
+    Other strings and arrays are not recorded.
+
+    ...
+
+    Attributes
+    ----------
+    paths : tuple
+        Paths of the recorded data points, in the order of their fields
+    size : int
+        Size of one record in bytes
+    fingerprint : bytes
+        Hash of the layout, stored in the header of record files
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Tuple[str, str]],
+        enums: Optional[Mapping[str, Type[IntEnum]]] = None,
+    ):
+        fields = list(fields)
+        self.enums: Dict[str, Tuple[IntEnum, ...]] = {
+            path: members(enum_type) for path, enum_type in (enums or {}).items()
+        }
+        self.numbers = sorted(
+            (field for field in fields if field[1] != "boolean"),
+            key=lambda field: -struct.calcsize(_FORMATS[field[1]]),
+        )
+        self.booleans = [path for path, datatype in fields if datatype == "boolean"]
+        self.paths = tuple(path for path, _ in self.numbers) + tuple(self.booleans)
+
+        self._bit_bytes = (len(self.booleans) + 7) // 8
+        self._valid_bytes = (len(self.paths) + 7) // 8
+        self._struct = struct.Struct(
+            "<d"
+            + "".join(_FORMATS[datatype] for _, datatype in self.numbers)
+            + f"{self._bit_bytes}s{self._valid_bytes}s"
+        )
+        # records are padded to keep the timestamps of all records aligned
+        self.size = -(-self._struct.size // 8) * 8
+        self._padding = bytes(self.size - self._struct.size)
+        self._dtype = None
+
+        description = ";".join(
+            [f"{path}:{datatype}" for path, datatype in self.numbers]
+            + [f"{path}:boolean" for path in self.booleans]
+        )
+        self.fingerprint = hashlib.sha1(description.encode()).digest()[:8]
+
+    @classmethod
+    def of(cls, branch: Model) -> "RecordLayout":
+        """Return the layout recording the data points below a vehicle or branch."""
+        fields = []
+        enums = {}
+        for path, datapoint in iter_datapoints(branch, branch.get_path()):
+            datatype = SIGNALS[spec_path(datapoint)].datatype
+            if datatype == "string":
+                enum_type = enum_of(datapoint)
+                if enum_type is None:
+                    continue
+                enums[path] = enum_type
+                datatype = "uint8"
+            if datatype == "boolean" or datatype in _FORMATS:
+                fields.append((path, datatype))
+        return cls(fields, enums)
+
+    def pack(self, timestamp: float, values: Mapping[str, Any]) -> bytes:
+        """
+        Return the record of the values, keyed by path. Data points without a
+        value (missing or None) are recorded as unknown.
+        """
+        numbers = []
+        valid = 0
+        bit = 1
+        for path, _ in self.numbers:
+            value = values.get(path)
+            if value is not None and path in self.enums:
+                value = _enum_code(self.enums[path], value)
+            if value is None:
+                value = 0
+            else:
+                valid |= bit
+            numbers.append(value)
+            bit <<= 1
+        bits = 0
+        flag = 1
+        for path in self.booleans:
+            value = values.get(path)
+            if value is not None:
+                valid |= bit
+                if value:
+                    bits |= flag
+            bit <<= 1
+            flag <<= 1
+        return (
+            self._struct.pack(
+                timestamp,
+                *numbers,
+                bits.to_bytes(self._bit_bytes, "little"),
+                valid.to_bytes(self._valid_bytes, "little"),
+            )
+            + self._padding
+        )
+
+    @property
+    def dtype(self):
+        """NumPy structured dtype of one record. Requires NumPy."""
+        if self._dtype is None:
+            names = ["timestamp"]
+            formats: List[Any] = ["<f8"]
+            offsets = [0]
+            offset = 8
+            for path, datatype in self.numbers:
+                names.append(path)
+                formats.append(_NUMPY_FORMATS[_FORMATS[datatype]])
+                offsets.append(offset)
+                offset += struct.calcsize(_FORMATS[datatype])
+            names += ["_bits", "_valid"]
+            formats += [("u1", (self._bit_bytes,)), ("u1", (self._valid_bytes,))]
+            offsets += [offset, offset + self._bit_bytes]
+            self._dtype = np.dtype(
+                {
+                    "names": names,
+                    "formats": formats,
+                    "offsets": offsets,
+                    "itemsize": self.size,
+                }
+            )
+        return self._dtype
+
+    def header(self) -> bytes:
+        return MAGIC + self.fingerprint
+
+
+def _enum_code(enum_members: Tuple[IntEnum, ...], value) -> Optional[int]:
+    if isinstance(value, str):
+        member = type(enum_members[0]).__members__.get(value)
+        return None if member is None else int(member)
+    return int(value)
+
+
+class RecordWriter:
+    """
+    Appends records to a file, writing the header first if the file is empty:
+
+        with RecordWriter("drive.rec", layout) as writer:
+            writer.write(time.time(), mirror.values_by_path())
+    """
+
+    def __init__(self, file: Union[str, BinaryIO], layout: RecordLayout):
+        self.layout = layout
+        self._owned = isinstance(file, str)
+        self._file: BinaryIO = open(file, "ab") if isinstance(file, str) else file
+        if self._file.tell() == 0:
+            self._file.write(layout.header())
+
+    def write(self, timestamp: float, values: Mapping[str, Any]):
+        self._file.write(self.layout.pack(timestamp, values))
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RecordReader:
+    """
+    Memory mapped file of records. Requires NumPy.
+
+    The values of a data point across all records are a strided view of the
+    file, so reading a signal does not parse the records:
+
+        reader = RecordReader("drive.rec", layout)
+        speed = reader["Vehicle.Speed"]
+    """
+
+    def __init__(self, path: str, layout: RecordLayout):
+        if np is None:
+            raise ImportError("RecordReader requires NumPy")
+        self.layout = layout
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+        if header[:8] != MAGIC:
+            raise ValueError(f"{path} is not a record file")
+        if header[8:] != layout.fingerprint:
+            raise ValueError(f"The records of {path} have a different layout")
+        self._booleans = {path: i for i, path in enumerate(layout.booleans)}
+        self._positions = {path: i for i, path in enumerate(layout.paths)}
+        self.records = np.memmap(path, dtype=layout.dtype, mode="r", offset=HEADER_SIZE)
+
+    @property
+    def timestamps(self):
+        return self.records["timestamp"]
+
+    def __getitem__(self, path: str):
+        """Return the values of a data point in all records."""
+        if path in self._booleans:
+            return self._bit(self.records["_bits"], self._booleans[path])
+        if path not in self._positions:
+            raise KeyError(path)
+        return self.records[path]
+
+    def valid(self, path: str):
+        """Return whether the value of a data point is known, for all records."""
+        return self._bit(self.records["_valid"], self._positions[path])
+
+    @staticmethod
+    def _bit(bits, index: int):
+        return (bits[:, index // 8] >> (index % 8)) & 1 == 1
+
+    def values(self, index: int) -> Dict[str, Any]:
+        """Return the known values of one record, by path."""
+        record = self.records[index]
+        values: Dict[str, Any] = {}
+        for path in self.layout.paths:
+            position = self._positions[path]
+            if not (record["_valid"][position // 8] >> (position % 8)) & 1:
+                continue
+            if path in self._booleans:
+                bit = self._booleans[path]
+                values[path] = bool((record["_bits"][bit // 8] >> (bit % 8)) & 1)
+            else:
+                values[path] = record[path].item()
+        for path, enum_members in self.layout.enums.items():
+            if path in values:
+                values[path] = enum_members[values[path]].name
+        return values
+
+    def __len__(self) -> int:
+        return len(self.records)
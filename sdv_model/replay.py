@@ -0,0 +1,288 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Recording of the updates delivered to a vehicle model, and their replay.
+
+A log file starts with the magic b"SDVLOG01" and the table of the recorded
+data points (count, then path and datatype of each, as length-prefixed UTF-8).
+The updates follow in the order they were delivered, each as a flags byte, the
+uint16 index of its data point, the float64 timestamp and the value. Numbers
+and booleans are stored with the size of their datatype, strings and arrays
+are prefixed with their length.
+"""
+
+import asyncio
+import struct
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from sdv.model import DataPoint
+from sdv.proto.broker_pb2 import SubscribeReply
+from sdv.vdb.reply import DataPointReply
+
+from sdv_model.index import ModelNode
+from sdv_model.metadata import SIGNALS, spec_path
+from sdv_model.snapshot import iter_datapoints
+
+if TYPE_CHECKING:
+    from sdv_model.fakebroker import FakeDatabroker
+
+MAGIC = b"SDVLOG01"
+
+# replies delivered at full speed before waiting for the callbacks
+YIELD_EVERY = 256
+
+# set if the update was delivered in the same reply as the update before
+CONTINUED = 1
+
+_ENTRY = struct.Struct("<BHd")
+_LENGTH = struct.Struct("<H")
+_SCALARS = {
+    "boolean": struct.Struct("<?"),
+    "double": struct.Struct("<d"),
+    "float": struct.Struct("<f"),
+    "int8": struct.Struct("<b"),
+    "int16": struct.Struct("<h"),
+    "int32": struct.Struct("<i"),
+    "uint8": struct.Struct("<B"),
+    "uint16": struct.Struct("<H"),
+    "uint32": struct.Struct("<I"),
+}
+
+
+class Update(NamedTuple):
+    """An update of a data point read from a log."""
+
+    path: str
+    timestamp: float
+    value: Any
+    continued: bool
+
+
+def _encode_string(value: str) -> bytes:
+    data = value.encode()
+    return _LENGTH.pack(len(data)) + data
+
+
+def _encode(datatype: str, value) -> bytes:
+    if datatype == "string":
+        return _encode_string(value)
+    if datatype.endswith("[]"):
+        element_type = datatype[:-2]
+        return _LENGTH.pack(len(value)) + b"".join(
+            _encode(element_type, element) for element in value
+        )
+    return _SCALARS[datatype].pack(value)
+
+
+def _read_string(file: BinaryIO) -> str:
+    (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+    return file.read(length).decode()
+
+
+def _decode(datatype: str, file: BinaryIO):
+    if datatype == "string":
+        return _read_string(file)
+    if datatype.endswith("[]"):
+        (count,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        return [_decode(datatype[:-2], file) for _ in range(count)]
+    scalar = _SCALARS[datatype]
+    return scalar.unpack(file.read(scalar.size))[0]
+
+
+class UpdateRecorder:
+    """
+    Appends the updates of data points delivered to a vehicle model to a log:
+
+        recorder = UpdateRecorder(vehicle, "drive.log", vehicle.Speed)
+        await recorder.start()
+        ...
+        await recorder.stop()
+
+    Without nodes, all data points of the vehicle are recorded.
+    """
+
+    def __init__(self, vehicle, path: str, *nodes: ModelNode):
+        self._vehicle = vehicle
+        self._path = path
+        self._indices: Dict[str, Tuple[int, str]] = {}
+        for node in nodes or (vehicle,):
+            node_path = vehicle.path_of(node)
+            datapoints = (
+                [(node_path, node)]
+                if isinstance(node, DataPoint)
+                else iter_datapoints(node, node_path)
+            )
+            for datapoint_path, datapoint in datapoints:
+                datatype = SIGNALS[spec_path(datapoint)].datatype
+                self._indices[datapoint_path] = (len(self._indices), datatype)
+        self._file: Optional[BinaryIO] = None
+        self._subscription = None
+        self.count = 0
+
+    async def start(self):
+        if self._file is not None:
+            return
+        self._file = open(self._path, "wb")
+        self._file.write(MAGIC + _LENGTH.pack(len(self._indices)))
+        for path, (_, datatype) in self._indices.items():
+            self._file.write(_encode_string(path) + _encode_string(datatype))
+        self._subscription = self._vehicle.multiplexer.subscribe(
+            self._indices, self.on_update
+        )
+
+    def on_update(self, reply: DataPointReply):
+        if self._file is None:
+            return
+        flags = 0
+        chunks = []
+        for path, broker_data_point in reply.reply.fields.items():
+            entry = self._indices.get(path)
+            if entry is None:
+                continue
+            index, datatype = entry
+            if broker_data_point.HasField("timestamp"):
+                timestamp = broker_data_point.timestamp
+                seconds = timestamp.seconds + timestamp.nanos * 1e-9
+            else:
+                seconds = time.time()
+            datapoint = self._vehicle.get_by_path(path)
+            chunks.append(
+                _ENTRY.pack(flags, index, seconds)
+                + _encode(datatype, datapoint.value_of(broker_data_point))
+            )
+            flags = CONTINUED
+        self._file.write(b"".join(chunks))
+        self.count += len(chunks)
+
+    async def stop(self):
+        if self._subscription is not None:
+            await self._subscription.unsubscribe()
+            self._subscription = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_log(path: str) -> Iterator[Update]:
+    """Yield the updates of a log in the order they were recorded."""
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an update log")
+        (count,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        table = [(_read_string(file), _read_string(file)) for _ in range(count)]
+        while True:
+            header = file.read(_ENTRY.size)
+            if len(header) < _ENTRY.size:
+                return
+            flags, index, timestamp = _ENTRY.unpack(header)
+            signal_path, datatype = table[index]
+            value = _decode(datatype, file)
+            yield Update(signal_path, timestamp, value, bool(flags & CONTINUED))
+
+
+def _groups(updates: Iterator[Update]) -> Iterator[Tuple[float, List[Update]]]:
+    # the updates recorded from one reply, with the timestamp of the first
+    group: List[Update] = []
+    for update in updates:
+        if group and not update.continued:
+            yield group[0].timestamp, group
+            group = []
+        group.append(update)
+    if group:
+        yield group[0].timestamp, group
+
+
+def _reply(vehicle, group: List[Update]) -> SubscribeReply:
+    reply = SubscribeReply()
+    for update in group:
+        datapoint = vehicle.get_by_path(update.path)
+        broker_data_point = reply.fields[update.path]
+        broker_data_point.CopyFrom(
+            datapoint.create_validated_broker_data_point(update.value)
+        )
+        broker_data_point.timestamp.FromNanoseconds(round(update.timestamp * 1e9))
+    return reply
+
+
+async def replay(
+    vehicle,
+    path: str,
+    speed: Optional[float] = 1.0,
+    broker: Optional["FakeDatabroker"] = None,
+) -> int:
+    """
+    Deliver the updates of a log to the subscribers of a vehicle model, in the
+    order they were recorded, and return the number of replies delivered.
+
+    With a broker, every recorded reply is applied to the values of the
+    FakeDatabroker, so all subscriptions, streams and reads of the model see
+    the drive, with the timestamps of the replay. Without a broker, the
+    replies go to the multiplexed subscribers only, see
+    sdv_model.multiplexer.SubscriptionMultiplexer, and the upstream
+    subscription of the multiplexer is disconnected during the replay, so
+    live updates do not mix with the replayed ones, and connected again
+    afterwards if it was connected before. To replay without any Databroker,
+    disconnect the multiplexer before subscribing.
+
+    With speed 1.0 the updates are delivered in the pace they were recorded,
+    with speed N N times faster, and with speed None as fast as possible. At
+    full speed a broker replay waits until the subscriptions handled each
+    reply, so the replies are not merged, while a multiplexed replay waits for
+    the callbacks every YIELD_EVERY replies, so the updates do not pile up,
+    and other tasks, e.g. the timers of filtered subscriptions, keep running.
+    The replay returns once the callbacks handled all its updates.
+    """
+    multiplexer = vehicle.multiplexer
+    connected = multiplexer.connected
+    if broker is None:
+        multiplexer.disconnect()
+    start: List[float] = []
+    delivered = 0
+    try:
+        for timestamp, group in _groups(read_log(path)):
+            if speed is not None:
+                if not start:
+                    start[:] = [timestamp, time.monotonic()]
+                delay = start[1] + (timestamp - start[0]) / speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if broker is not None:
+                broker.update({update.path: update.value for update in group})
+                if speed is None:
+                    await broker.drain()
+            else:
+                if speed is None and delivered % YIELD_EVERY == 0:
+                    await multiplexer.drain()
+                    await asyncio.sleep(0)
+                await multiplexer.dispatch(DataPointReply(_reply(vehicle, group)))
+            delivered += 1
+        if broker is not None:
+            await broker.drain()
+        await multiplexer.drain()
+    finally:
+        if connected and broker is None:
+            multiplexer.connect()
+    return delivered
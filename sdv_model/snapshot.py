@@ -0,0 +1,113 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Values of all data points of a branch, fetched with one request."""
+
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Union
+
+from sdv.model import DataPoint, Model
+from sdv.vdb.types import TypedDataPointResult
+
+from sdv_model.index import iter_children
+
+
+def iter_datapoints(branch: Model, path: str) -> Iterator[Tuple[str, DataPoint]]:
+    """Yield the paths and data points below a branch with the given path."""
+    for name, child in iter_children(branch):
+        if isinstance(child, DataPoint):
+            yield f"{path}.{name}", child
+        else:
+            yield from iter_datapoints(child, f"{path}.{name}")
+
+
+class Snapshot(Mapping[str, TypedDataPointResult]):
+    """
+    Read-only record of the values of the data points below a branch.
+
+    The results are keyed by their path relative to the branch and can also
+    be read like the attributes of the branch:
+
+        seat = await vehicle.Cabin.Seat.Row1.Pos1.snapshot()
+        seat.Heating.value == seat["Heating"].value
+        seat.Position.value == seat[vehicle.Cabin.Seat.Row1.Pos1.Position].value
+        seat.Switch.Massage  # a snapshot of the Switch.Massage branch
+    """
+
+    __slots__ = ("_path", "_results")
+
+    _path: str
+    _results: Dict[str, TypedDataPointResult]
+
+    def __init__(self, path: str, results: Dict[str, TypedDataPointResult]):
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_results", results)
+
+    @property
+    def path(self) -> str:
+        """Path of the branch."""
+        return self._path
+
+    def __getitem__(self, key: Union[str, DataPoint]) -> TypedDataPointResult:
+        path = key.get_path() if isinstance(key, DataPoint) else f"{self._path}.{key}"
+        try:
+            return self._results[path]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __getattr__(self, name: str) -> Union[TypedDataPointResult, "Snapshot"]:
+        path = f"{self._path}.{name}"
+        if path in self._results:
+            return self._results[path]
+        prefix = path + "."
+        if any(key.startswith(prefix) for key in self._results):
+            return Snapshot(path, self._results)
+        raise AttributeError(f"{self._path} has no data point or branch {name!r}")
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("Snapshots are read-only")
+
+    def __iter__(self) -> Iterator[str]:
+        prefix = self._path + "."
+        for path in self._results:
+            if path.startswith(prefix):
+                yield path[len(prefix) :]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def values_by_path(self) -> Dict[str, Any]:
+        """Return the plain values keyed by their absolute path."""
+        prefix = self._path + "."
+        return {
+            path: result.value
+            for path, result in self._results.items()
+            if path.startswith(prefix)
+        }
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self._path!r}, {len(self)} data points)"
+
+
+async def take_snapshot(branch: Model) -> Snapshot:
+    """Fetch the values of all data points below a branch with one request."""
+    path = branch.get_path()
+    datapoints: List[Tuple[str, DataPoint]] = list(iter_datapoints(branch, path))
+    response = await branch.get_client().GetDatapoints([p for p, _ in datapoints])
+    return Snapshot(
+        path,
+        {
+            p: datapoint.result_of(response.datapoints[p])  # type: ignore
+            for p, datapoint in datapoints
+        },
+    )
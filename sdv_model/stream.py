@@ -0,0 +1,153 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Streams of the changes of the data points below a branch."""
+
+from enum import IntEnum
+from typing import Any, Dict, Type
+
+from sdv.model import DataPoint, Model
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.vdb.reply import DataPointReply
+from sdv.vdb.subscriptions import SubscriptionManager, VdbSubscription
+
+from sdv_model.enums import enum_of, member_of
+from sdv_model.queues import DROP_OLDEST, UpdateQueue
+from sdv_model.snapshot import iter_datapoints
+
+ChangeSet = Dict[DataPoint, Any]
+
+
+def merge_changes(older: ChangeSet, newer: ChangeSet) -> ChangeSet:
+    return {**older, **newer}
+
+
+class UpdateStream:
+    """
+    Asynchronous iterator over the changes of the data points below a branch.
+
+    Each item is one change set: the data points changed by one notification
+    of the Databroker, mapped to their new values. Data points updated
+    together, e.g. the speeds of all wheels, therefore arrive in one item
+    instead of one callback each:
+
+        async with vehicle.Chassis.Axle.Row1.Wheel.stream() as updates:
+            async for changes in updates:
+                for datapoint, value in changes.items():
+                    ...
+
+    The subscription starts with the first iteration and ends with close(),
+    or when the async with block is left. Change sets which were not consumed
+    yet are queued in order. With a maxsize, at most that many change sets are
+    queued, and a full queue applies the policy, see
+    sdv_model.queues.UpdateQueue; coalescing merges change sets. The queue and
+    its counters are the queue attribute of the stream. With multiplex set,
+    the stream shares the upstream subscription of the vehicle, see
+    sdv_model.multiplexer.SubscriptionMultiplexer. With as_enum set, the
+    values of enumerated string signals are members of their IntEnum.
+    """
+
+    def __init__(
+        self,
+        branch: Model,
+        maxsize: int = 0,
+        policy: str = DROP_OLDEST,
+        multiplex: bool = False,
+        as_enum: bool = False,
+    ):
+        path = branch.get_path()
+        self._branch = branch
+        self._datapoints: Dict[str, DataPoint] = dict(iter_datapoints(branch, path))
+        self._last: Dict[str, BrokerDatapoint] = {}
+        self._enums: Dict[str, Type[IntEnum]] = {}
+        if as_enum:
+            for datapoint_path, datapoint in self._datapoints.items():
+                enum_type = enum_of(datapoint)
+                if enum_type is not None:
+                    self._enums[datapoint_path] = enum_type
+        self.queue = UpdateQueue(maxsize, policy, merge_changes)
+        self._multiplex = multiplex
+        self._subscription: Any = None
+        self._closed = False
+
+    def _root(self):
+        root = self._branch
+        while root.parent is not None:
+            root = root.parent
+        return root
+
+    def _start(self):
+        multiplexer = None
+        if self._multiplex:
+            multiplexer = getattr(self._root(), "multiplexer", None)
+        if multiplexer is not None:
+            self._subscription = multiplexer.subscribe(self._datapoints, self.on_update)
+        else:
+            query = "SELECT " + ", ".join(self._datapoints)
+            self._subscription = VdbSubscription(
+                self._branch.get_client(), query, self.on_update
+            )
+            SubscriptionManager._add_subscription(  # pylint: disable=W0212
+                self._subscription
+            )
+
+    async def on_update(self, reply: DataPointReply):
+        changes: ChangeSet = {}
+        last = self._last
+        for path, broker_data_point in reply.reply.fields.items():
+            datapoint = self._datapoints.get(path)
+            if datapoint is None or last.get(path) == broker_data_point:
+                continue
+            last[path] = broker_data_point
+            value = datapoint.value_of(broker_data_point)  # type: ignore
+            enum_type = self._enums.get(path)
+            changes[datapoint] = (
+                value if enum_type is None else member_of(enum_type, value)
+            )
+        if changes:
+            await self.queue.put(changes)
+
+    def __aiter__(self) -> "UpdateStream":
+        return self
+
+    async def __anext__(self) -> ChangeSet:
+        if self._closed:
+            raise StopAsyncIteration
+        if self._subscription is None:
+            self._start()
+        changes = await self.queue.get()
+        if changes is None:
+            raise StopAsyncIteration
+        return changes
+
+    async def close(self):
+        """End the subscription; a pending iteration stops."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._subscription is not None:
+            subscription, self._subscription = self._subscription, None
+            await subscription.unsubscribe()
+            # VdbSubscription.unsubscribe() leaves the task in the subscription
+            # manager, which would keep the stream alive
+            SubscriptionManager._subscription_tasks.pop(  # pylint: disable=W0212
+                subscription, None
+            )
+        self.queue.close()
+
+    async def __aenter__(self) -> "UpdateStream":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Fixed-size time series of the values of numeric data points. Requires NumPy."""
+
+from typing import Optional, Tuple
+
+from sdv.model import DataPoint
+from sdv.vdb.reply import DataPointReply
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+
+class RingBuffer:
+    """
+    Preallocated buffer of the latest capacity samples, as timestamps in
+    seconds and values.
+
+    Every sample is written twice, at its position and one capacity further,
+    so the latest n samples are always one contiguous range of the arrays.
+    Windows are therefore returned as read-only views without copying. Their
+    samples are overwritten once the buffer wraps around them, so windows which
+    are kept for longer need to be copied.
+    """
+
+    def __init__(self, capacity: int, dtype=float):
+        if np is None:
+            raise ImportError("RingBuffer requires NumPy")
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=float)
+        self._values = np.zeros(2 * capacity, dtype=dtype)
+        self._next = 0
+        self._count = 0
+
+    def append(self, timestamp: float, value):
+        position = self._next
+        self._timestamps[position] = self._timestamps[position + self.capacity] = (
+            timestamp
+        )
+        self._values[position] = self._values[position + self.capacity] = value
+        self._next = (position + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _window(self, n: int):
+        n = max(0, min(n, self._count))
+        end = self._next + self.capacity
+        timestamps = self._timestamps[end - n : end]
+        values = self._values[end - n : end]
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        return timestamps, values
+
+    def last(self, n: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the timestamps and values of the latest n samples, oldest first."""
+        return self._window(n)
+
+    def since(self, seconds: float) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Return the timestamps and values of the samples of the last seconds,
+        counted back from the latest sample, oldest first.
+        """
+        timestamps, values = self._window(self._count)
+        if not self._count:
+            return timestamps, values
+        start = np.searchsorted(timestamps, timestamps[-1] - seconds, side="left")
+        return timestamps[start:], values[start:]
+
+    @property
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """The timestamp and value of the latest sample, None if empty."""
+        if not self._count:
+            return None
+        position = self._next + self.capacity - 1
+        return float(self._timestamps[position]), self._values[position].item()
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class TimeSeries(RingBuffer):
+    """
+    Ring buffer filled from the updates of a numeric data point.
+
+    Created by DataPoint.record(); close() ends the subscription.
+    """
+
+    def __init__(self, datapoint: DataPoint, capacity: int):
+        datatype = datapoint.metadata.datatype  # type: ignore
+        if datatype in ("boolean", "string") or datatype.endswith("[]"):
+            raise TypeError(f"{datapoint.get_path()} is not numeric")
+        # integer signals keep their own width, float and double become float64
+        dtype = datatype if datatype.startswith(("int", "uint")) else "float64"
+        super().__init__(capacity, dtype)
+        self.datapoint = datapoint
+        self._path = datapoint.get_path()
+        self._subscription = None
+
+    async def start(self):
+        if self._subscription is None:
+            self._subscription = await self.datapoint.subscribe(self.on_update)
+
+    def on_update(self, reply: DataPointReply):
+        broker_data_point = reply.reply.fields.get(self._path)
+        if broker_data_point is not None:
+            timestamp = broker_data_point.timestamp
+            self.append(
+                timestamp.seconds + timestamp.nanos * 1e-9,
+                self.datapoint.value_of(broker_data_point),  # type: ignore
+            )
+
+    async def close(self):
+        if self._subscription is not None:
+            subscription, self._subscription = self._subscription, None
+            await subscription.unsubscribe()
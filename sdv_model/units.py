@@ -0,0 +1,178 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Conversion of data point values from the unit of their signal to other units."""
+
+import math
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+from sdv.model import DataPoint
+
+from sdv_model.metadata import SIGNALS, spec_path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+# unit: (quantity, scale, offset), so that value * scale + offset is the value
+# in the base unit of the quantity
+UNITS: Dict[str, Tuple[str, float, float]] = {
+    # speed, base m/s
+    "m/s": ("speed", 1.0, 0.0),
+    "km/h": ("speed", 1 / 3.6, 0.0),
+    "mph": ("speed", 0.44704, 0.0),
+    "kn": ("speed", 1852 / 3600, 0.0),
+    # length, base m
+    "m": ("length", 1.0, 0.0),
+    "mm": ("length", 1e-3, 0.0),
+    "cm": ("length", 1e-2, 0.0),
+    "km": ("length", 1e3, 0.0),
+    "inch": ("length", 0.0254, 0.0),
+    "ft": ("length", 0.3048, 0.0),
+    "mi": ("length", 1609.344, 0.0),
+    # angle, base rad
+    "rad": ("angle", 1.0, 0.0),
+    "degrees": ("angle", math.pi / 180, 0.0),
+    # angular speed, base rad/s
+    "rad/s": ("angular speed", 1.0, 0.0),
+    "degrees/s": ("angular speed", math.pi / 180, 0.0),
+    "rpm": ("angular speed", math.pi / 30, 0.0),
+    # acceleration, base m/s^2
+    "m/s^2": ("acceleration", 1.0, 0.0),
+    "g": ("acceleration", 9.80665, 0.0),
+    # pressure, base Pa
+    "Pa": ("pressure", 1.0, 0.0),
+    "kPa": ("pressure", 1e3, 0.0),
+    "bar": ("pressure", 1e5, 0.0),
+    "psi": ("pressure", 6894.757293168361, 0.0),
+    # temperature, base K
+    "K": ("temperature", 1.0, 0.0),
+    "celsius": ("temperature", 1.0, 273.15),
+    "fahrenheit": ("temperature", 5 / 9, 273.15 - 32 * 5 / 9),
+    # mass, base kg
+    "kg": ("mass", 1.0, 0.0),
+    "lb": ("mass", 0.45359237, 0.0),
+    # volume, base l
+    "l": ("volume", 1.0, 0.0),
+    "ml": ("volume", 1e-3, 0.0),
+    "cm^3": ("volume", 1e-3, 0.0),
+    "m^3": ("volume", 1e3, 0.0),
+    "gal": ("volume", 3.785411784, 0.0),
+    # time, base s
+    "s": ("time", 1.0, 0.0),
+    "ms": ("time", 1e-3, 0.0),
+    "min": ("time", 60.0, 0.0),
+    "h": ("time", 3600.0, 0.0),
+    # power, base W
+    "W": ("power", 1.0, 0.0),
+    "kW": ("power", 1e3, 0.0),
+    "hp": ("power", 745.69987158227022, 0.0),
+    # energy, base Wh
+    "Wh": ("energy", 1.0, 0.0),
+    "kWh": ("energy", 1e3, 0.0),
+    "J": ("energy", 1 / 3600, 0.0),
+    "MJ": ("energy", 1e6 / 3600, 0.0),
+    # torque, base Nm
+    "Nm": ("torque", 1.0, 0.0),
+    "lbf ft": ("torque", 1.3558179483314004, 0.0),
+    # electric current, voltage and charge
+    "A": ("current", 1.0, 0.0),
+    "mA": ("current", 1e-3, 0.0),
+    "V": ("voltage", 1.0, 0.0),
+    "mV": ("voltage", 1e-3, 0.0),
+    "Ah": ("charge", 1.0, 0.0),
+    "mAh": ("charge", 1e-3, 0.0),
+    "C": ("charge", 1 / 3600, 0.0),
+    # mass flow, base g/s
+    "g/s": ("mass flow", 1.0, 0.0),
+    "kg/h": ("mass flow", 1 / 3.6, 0.0),
+    # volume flow, base l/h
+    "l/h": ("volume flow", 1.0, 0.0),
+    "gal/h": ("volume flow", 3.785411784, 0.0),
+    # emission and fuel consumption per distance
+    "g/km": ("emission", 1.0, 0.0),
+    "g/mi": ("emission", 1 / 1.609344, 0.0),
+    "l/100km": ("consumption", 1.0, 0.0),
+    # ratios
+    "ratio": ("ratio", 1.0, 0.0),
+    "percent": ("ratio", 1e-2, 0.0),
+}
+
+
+class Conversion(NamedTuple):
+    """
+    Affine conversion between two units, computed once per pair of units.
+
+    Calling a conversion converts a single value. convert_array() converts a
+    whole sequence or NumPy array of values in one vectorized operation.
+    """
+
+    scale: float
+    offset: float
+
+    def __call__(self, value: float) -> float:
+        return value * self.scale + self.offset
+
+    def convert_array(self, values):
+        """Return the converted values as NumPy array of floats. Requires NumPy."""
+        result = np.array(values, dtype=float)
+        if self.scale != 1.0:
+            result *= self.scale
+        if self.offset != 0.0:
+            result += self.offset
+        return result
+
+
+def _lookup(unit: str) -> Tuple[str, float, float]:
+    try:
+        return UNITS[unit]
+    except KeyError:
+        raise ValueError(f"Unknown unit {unit!r}") from None
+
+
+@lru_cache(maxsize=None)
+def get_conversion(source: str, target: str) -> Conversion:
+    """Return the conversion of values from the source to the target unit."""
+    quantity, source_scale, source_offset = _lookup(source)
+    target_quantity, target_scale, target_offset = _lookup(target)
+    if quantity != target_quantity:
+        raise ValueError(f"Cannot convert {source!r} ({quantity}) to {target!r}")
+    scale = source_scale / target_scale
+    offset = (source_offset - target_offset) / target_scale
+    return Conversion(scale, offset)
+
+
+@lru_cache(maxsize=None)
+def _signal_conversion(path: str, target: str) -> Conversion:
+    unit = SIGNALS[path].unit
+    if unit is None:
+        raise ValueError(f"{path} has no unit")
+    return get_conversion(unit, target)
+
+
+def conversion_of(datapoint: DataPoint, target: str) -> Conversion:
+    """Return the conversion of the values of a data point to the target unit."""
+    return _signal_conversion(spec_path(datapoint), target)
+
+
+def convert(datapoint: DataPoint, value: float, target: str) -> float:
+    """Convert a value of a data point to the target unit."""
+    return conversion_of(datapoint, target)(value)
+
+
+def convert_array(datapoint: DataPoint, values, target: str):
+    """Convert many values of a data point to the target unit. Requires NumPy."""
+    return conversion_of(datapoint, target).convert_array(values)
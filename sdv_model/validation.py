@@ -0,0 +1,226 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local validation of data point values against the VSS specification."""
+
+import math
+import numbers
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from sdv.model import DataPoint
+
+from sdv_model.metadata import SIGNALS, SignalMetadata, spec_path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+_INTEGER_RANGES = {
+    "int8": (-(2**7), 2**7 - 1),
+    "int16": (-(2**15), 2**15 - 1),
+    "int32": (-(2**31), 2**31 - 1),
+    "uint8": (0, 2**8 - 1),
+    "uint16": (0, 2**16 - 1),
+    "uint32": (0, 2**32 - 1),
+}
+_FLOAT_MAX = 3.4028234663852886e38
+
+
+class ValidationFailure(NamedTuple):
+    """A value rejected by the validator of a data point."""
+
+    path: str
+    value: Any
+    reason: str
+
+    def __str__(self):
+        return f"{self.path}: {self.reason}"
+
+
+class ValidationError(ValueError):
+    """Raised when values do not conform to the specification of their signals."""
+
+    def __init__(self, failures: List[ValidationFailure]):
+        super().__init__("; ".join(str(failure) for failure in failures))
+        self.failures = failures
+
+
+def _is_bool(value) -> bool:
+    return isinstance(value, bool) or (np is not None and isinstance(value, np.bool_))
+
+
+def _is_integer(value) -> bool:
+    return isinstance(value, numbers.Integral) and not _is_bool(value)
+
+
+def _is_real(value) -> bool:
+    return isinstance(value, numbers.Real) and not _is_bool(value)
+
+
+def _is_string(value) -> bool:
+    return isinstance(value, str)
+
+
+_TYPE_CHECKS = {"boolean": _is_bool, "string": _is_string, "float": _is_real}
+_TYPE_CHECKS["double"] = _is_real
+_TYPE_CHECKS.update(dict.fromkeys(_INTEGER_RANGES, _is_integer))
+
+
+class Validator:
+    """
+    Check of the values of one signal, compiled once from its metadata.
+
+    The bounds combine the range of the VSS specification with the range of
+    the datatype, e.g. [0, 100] for Seat.Massage or [0, 255] for any uint8.
+    Array signals apply the checks to each of their elements. NaN is out of
+    every range.
+
+    ...
+
+    Attributes
+    ----------
+    datatype : str
+        VSS datatype of the signal, e.g. "uint8" or "string[]"
+    lower : float
+        Smallest allowed value, -inf if unbounded
+    upper : float
+        Largest allowed value, inf if unbounded
+    allowed : frozenset, optional
+        Allowed values of an enumerated signal
+    """
+
+    __slots__ = (
+        "datatype",
+        "lower",
+        "upper",
+        "allowed",
+        "is_array",
+        "is_type",
+        "_ranged",
+    )
+
+    def __init__(self, metadata: SignalMetadata):
+        self.datatype = metadata.datatype
+        self.is_array = self.datatype.endswith("[]")
+        element_type = self.datatype[:-2] if self.is_array else self.datatype
+        self.is_type = _TYPE_CHECKS[element_type]
+        self._ranged = self.is_type in (_is_integer, _is_real)
+
+        lower, upper = _INTEGER_RANGES.get(element_type, (-math.inf, math.inf))
+        if element_type == "float":
+            lower, upper = -_FLOAT_MAX, _FLOAT_MAX
+        if metadata.min is not None:
+            lower = max(lower, metadata.min)
+        if metadata.max is not None:
+            upper = min(upper, metadata.max)
+        self.lower = lower
+        self.upper = upper
+        self.allowed = frozenset(metadata.allowed) if metadata.allowed else None
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether the signal is a single number, which can be checked in bulk."""
+        return self._ranged and not self.is_array
+
+    def check(self, value) -> Optional[str]:
+        """Return why the value is invalid for the signal, or None if it is valid."""
+        if not self.is_array:
+            return self._check_element(value)
+        if not isinstance(value, (list, tuple)):
+            return f"expected a list for {self.datatype}, got {type(value).__name__}"
+        for element in value:
+            reason = self._check_element(element)
+            if reason is not None:
+                return f"element {element!r}: {reason}"
+        return None
+
+    def _check_element(self, value) -> Optional[str]:
+        if not self.is_type(value):
+            return f"expected {self.datatype}, got {type(value).__name__}"
+        if self.allowed is not None:
+            if value not in self.allowed:
+                return f"{value!r} is not one of {sorted(self.allowed)}"
+        elif self._ranged and not self.lower <= value <= self.upper:
+            # also true for NaN, which is in no range
+            return f"{value!r} is out of range [{self.lower}, {self.upper}]"
+        return None
+
+    def check_array(self, values):
+        """
+        Return a boolean mask of the valid entries of a NumPy array of values of a
+        numeric signal. Requires NumPy.
+        """
+        values = np.asarray(values)
+        valid = (values >= self.lower) & (values <= self.upper)
+        if self.is_type is _is_integer and values.dtype.kind == "f":
+            valid &= np.floor(values) == values
+        return valid
+
+
+@lru_cache(maxsize=None)
+def get_validator(path: str) -> Validator:
+    """Return the validator of the signal with the given specification path."""
+    return Validator(SIGNALS[path])
+
+
+def validator_of(datapoint: DataPoint) -> Validator:
+    """Return the validator of a data point of the vehicle model."""
+    return get_validator(spec_path(datapoint))
+
+
+def validate(datapoint: DataPoint, value):
+    """Raise a ValidationError if the value is invalid for the data point."""
+    reason = validator_of(datapoint).check(value)
+    if reason is not None:
+        raise ValidationError([ValidationFailure(datapoint.get_path(), value, reason)])
+
+
+def validate_many(items: Iterable[Tuple[DataPoint, Any]]) -> List[ValidationFailure]:
+    """
+    Validate many (data point, value) pairs in one call and return the failures
+    in the order of the pairs.
+
+    With NumPy installed, the range checks of all numeric values are done in
+    one vectorized comparison.
+    """
+    failures: List[Tuple[int, ValidationFailure]] = []
+    deferred: List[Tuple[int, DataPoint, Any, Validator]] = []
+
+    for position, (datapoint, value) in enumerate(items):
+        validator = validator_of(datapoint)
+        if np is not None and validator.is_numeric and validator.is_type(value):
+            deferred.append((position, datapoint, value, validator))
+            continue
+        reason = validator.check(value)
+        if reason is not None:
+            failures.append(
+                (position, ValidationFailure(datapoint.get_path(), value, reason))
+            )
+
+    if deferred:
+        values = np.array([entry[2] for entry in deferred], dtype=float)
+        lower = np.array([entry[3].lower for entry in deferred], dtype=float)
+        upper = np.array([entry[3].upper for entry in deferred], dtype=float)
+        for i in np.flatnonzero(~((values >= lower) & (values <= upper))):
+            position, datapoint, value, validator = deferred[i]
+            reason = validator.check(value)
+            if reason is not None:
+                failures.append(
+                    (position, ValidationFailure(datapoint.get_path(), value, reason))
+                )
+        failures.sort(key=lambda failure: failure[0])
+
+    return [failure for _, failure in failures]
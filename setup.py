@@ -19,5 +19,6 @@
     version="0.3.0",
     description="SDV Vehicle Model for Python",
     packages=find_packages(),
+    extras_require={"numpy": ["numpy"]},
     zip_safe=False,
 )
@@ -0,0 +1,119 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import grpc
+import pytest
+
+from sdv_model.fakebroker import FakeDatabroker
+from sdv_model.metadata import ATTRIBUTE, SIGNALS, spec_path
+from sdv_model.snapshot import iter_datapoints
+
+
+@pytest.fixture
+def requests(broker):
+    """The paths of the GetDatapoints requests served by the broker."""
+    paths = []
+    get_datapoints = broker.GetDatapoints
+
+    async def counting_get_datapoints(request, metadata=None):
+        paths.append(list(request.datapoints))
+        return await get_datapoints(request, metadata)
+
+    broker.GetDatapoints = counting_get_datapoints
+    return paths
+
+
+async def test_attributes_are_read_from_the_databroker_by_default(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.CurbWeight": 1500})
+    assert vehicle.attributes is None
+    await vehicle.CurbWeight.get()
+    await vehicle.CurbWeight.get()
+    assert requests == [["Vehicle.CurbWeight"], ["Vehicle.CurbWeight"]]
+
+
+async def test_attributes_are_fetched_together_and_cached(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.CurbWeight": 1500, "Vehicle.Length": 4500})
+    vehicle.enable_attribute_cache()
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    assert (await vehicle.Length.get()).value == 4500
+    assert len(requests) == 1
+    assert "Vehicle.Length" in requests[0]
+
+
+async def test_the_batch_requests_every_attribute_instance(
+    vehicle, broker: FakeDatabroker, requests
+):
+    await vehicle.enable_attribute_cache().load()
+    attributes = {
+        path
+        for path, datapoint in iter_datapoints(vehicle, vehicle.get_path())
+        if SIGNALS[spec_path(datapoint)].kind == ATTRIBUTE
+    }
+    assert len(requests) == 1
+    assert len(requests[0]) == len(attributes)
+    assert set(requests[0]) == attributes
+    assert "Vehicle.Chassis.Axle.Row2.TireWidth" in attributes
+    assert "Vehicle.Chassis.Axle.TireWidth" not in attributes
+
+
+async def test_invalidated_attributes_are_fetched_again(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.CurbWeight": 1500})
+    cache = vehicle.enable_attribute_cache()
+    assert (await vehicle.CurbWeight.get()).value == 1500
+
+    broker.update({"Vehicle.CurbWeight": 1600})
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    cache.invalidate()
+    assert not cache.is_loaded
+    assert (await vehicle.CurbWeight.get()).value == 1600
+    assert len(requests) == 2
+
+
+async def test_attributes_without_value_are_read_again(
+    vehicle, broker: FakeDatabroker, requests
+):
+    vehicle.enable_attribute_cache()
+    await vehicle.CurbWeight.get()
+    broker.update({"Vehicle.CurbWeight": 1500})
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    # the batch, then one read each until the attribute had a value
+    assert requests[1:] == [["Vehicle.CurbWeight"], ["Vehicle.CurbWeight"]]
+
+
+async def test_attributes_are_read_one_by_one_if_the_batch_fails(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.CurbWeight": 1500})
+    get_datapoints = broker.GetDatapoints
+
+    async def failing_batch(request, metadata=None):
+        if len(request.datapoints) > 1:
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNAVAILABLE, grpc.aio.Metadata(), grpc.aio.Metadata()
+            )
+        return await get_datapoints(request, metadata)
+
+    broker.GetDatapoints = failing_batch
+    vehicle.enable_attribute_cache()
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    assert requests == [["Vehicle.CurbWeight"]]
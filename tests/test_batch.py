@@ -0,0 +1,93 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from sdv.proto.broker_pb2 import SetDatapointsReply
+from sdv.proto.types_pb2 import DatapointError
+
+from sdv_model.batch import BatchSetError
+from sdv_model.fakebroker import FakeDatabroker
+from sdv_model.validation import ValidationError
+
+
+@pytest.fixture
+def requests(broker):
+    """The paths of the SetDatapoints requests served by the broker."""
+    paths = []
+    set_datapoints = broker.SetDatapoints
+
+    async def counting_set_datapoints(request, metadata=None):
+        paths.append(list(request.datapoints))
+        return await set_datapoints(request, metadata)
+
+    broker.SetDatapoints = counting_set_datapoints
+    return paths
+
+
+async def test_all_values_are_set_with_one_request(
+    vehicle, broker: FakeDatabroker, requests
+):
+    seats = vehicle.Cabin.Seat.Row1
+    batch = vehicle.set_many().add(seats.Pos1.Massage, 20).add(seats.Pos2.Massage, 40)
+    await batch.apply()
+    assert requests == [
+        ["Vehicle.Cabin.Seat.Row1.Pos1.Massage", "Vehicle.Cabin.Seat.Row1.Pos2.Massage"]
+    ]
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos1.Massage") == 20
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos2.Massage") == 40
+
+
+async def test_one_invalid_value_sends_nothing(
+    vehicle, broker: FakeDatabroker, requests
+):
+    seats = vehicle.Cabin.Seat.Row1
+    batch = (
+        vehicle.set_many()
+        .add(seats.Pos1.Massage, 20)
+        .add(seats.Pos2.Massage, 120)
+        .add(vehicle.LowVoltageSystemState, "DRIVE")
+    )
+    with pytest.raises(ValidationError) as error:
+        await batch.apply()
+    assert [failure.path for failure in error.value.failures] == [
+        "Vehicle.Cabin.Seat.Row1.Pos2.Massage",
+        "Vehicle.LowVoltageSystemState",
+    ]
+    assert requests == []
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos1.Massage") is None
+
+
+async def test_rejected_data_points_are_raised_together(
+    vehicle, broker: FakeDatabroker
+):
+    denied = "Vehicle.Cabin.Seat.Row1.Pos2.Massage"
+    set_datapoints = broker.SetDatapoints
+
+    async def denying_set_datapoints(request, metadata=None):
+        if denied not in request.datapoints:
+            return await set_datapoints(request, metadata)
+        # like the Databroker, nothing is set if any data point is rejected
+        reply = SetDatapointsReply()
+        reply.errors[denied] = DatapointError.ACCESS_DENIED
+        return reply
+
+    broker.SetDatapoints = denying_set_datapoints
+    seats = vehicle.Cabin.Seat.Row1
+    batch = vehicle.set_many().add(seats.Pos1.Massage, 20).add(seats.Pos2.Massage, 40)
+    with pytest.raises(BatchSetError) as error:
+        await batch.apply()
+    assert error.value.errors == {denied: "ACCESS_DENIED"}
+    assert f"{denied} (ACCESS_DENIED)" in str(error.value)
+    assert isinstance(error.value, TypeError)
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos1.Massage") is None
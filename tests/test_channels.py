@@ -0,0 +1,80 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+from sdv_model.channels import ChannelPool
+
+ADDRESS = "localhost:50051"
+
+
+async def test_channels_are_handed_out_in_turn():
+    pool = ChannelPool()
+    pool.set_size(ADDRESS, 2)
+    first, second, third = (pool.channel(ADDRESS) for _ in range(3))
+    assert first is not second
+    assert third is first
+    assert pool.channel("localhost:50052") is not first
+    await pool.close()
+
+
+async def test_closed_pool_creates_new_channels():
+    pool = ChannelPool()
+    channel = pool.channel(ADDRESS)
+    await pool.close()
+    assert pool.channel(ADDRESS) is not channel
+    await pool.close()
+
+
+def test_every_event_loop_gets_channels_of_its_own():
+    pool = ChannelPool()
+
+    async def get_channel():
+        return pool.channel(ADDRESS)
+
+    first = asyncio.run(get_channel())
+    second = asyncio.run(get_channel())
+    assert first is not second
+
+
+def test_finished_event_loop_leaves_no_channels():
+    pool = ChannelPool()
+
+    async def get_channels():
+        return [pool.channel(ADDRESS) for _ in range(2)]
+
+    for _ in range(3):
+        channels = asyncio.run(get_channels())
+        assert not pool._loops  # pylint: disable=W0212
+        assert all(channel._channel.closed() for channel in channels)
+
+
+def test_channels_of_loops_closed_otherwise_are_dropped():
+    pool = ChannelPool()
+
+    async def get_channel():
+        return pool.channel(ADDRESS)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(get_channel())
+    # closed without cancelling its tasks
+    loop.close()
+
+    other = asyncio.new_event_loop()
+    other.run_until_complete(get_channel())
+    assert len(pool._loops) == 1  # pylint: disable=W0212
+    other.run_until_complete(pool.close())
+    assert not pool._loops  # pylint: disable=W0212
+    other.close()
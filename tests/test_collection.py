@@ -0,0 +1,45 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+
+def test_collections_are_indexed_from_one(vehicle):
+    seats = vehicle.Cabin.Seat
+    assert len(seats) == 2
+    assert seats[1] is seats.Row1 is seats.Row(1) is seats["Row1"]
+    assert seats[2] is seats.Row2
+    assert len(seats[1]) == 3
+    assert seats[1][3] is seats.Row1.Pos3 is seats.Row1.Pos(3)
+
+
+def test_iteration_follows_the_instance_names(vehicle):
+    seats = vehicle.Cabin.Seat
+    assert list(seats) == [seats.Row1, seats.Row2]
+    assert [seat.get_path() for row in seats for seat in row] == [
+        f"Vehicle.Cabin.Seat.Row{row}.Pos{pos}" for row in (1, 2) for pos in (1, 2, 3)
+    ]
+    doors = vehicle.Cabin.Door
+    assert list(doors[2]) == [doors.Row2.Left, doors.Row2.Right]
+
+
+@pytest.mark.parametrize("index", [0, 3, -1])
+def test_positions_out_of_range_raise(vehicle, index):
+    with pytest.raises(IndexError, match=r"out of range \[1, 2\]"):
+        vehicle.Cabin.Seat[index]
+
+
+def test_unknown_instance_names_raise(vehicle):
+    with pytest.raises(KeyError):
+        vehicle.Cabin.Seat["Row3"]
@@ -0,0 +1,44 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+from sdv_model.enums import LowVoltageSystemState
+
+# longer than the latency of the broker
+SETTLE = 0.05
+
+
+async def test_subscription_delivers_enum_members(vehicle, broker):
+    state = vehicle.LowVoltageSystemState
+    values = []
+    subscription = await state.subscribe(
+        lambda reply: values.append(reply.get(state).value), as_enum=True
+    )
+    broker.update({"Vehicle.LowVoltageSystemState": "ON"})
+    await asyncio.sleep(SETTLE)
+    await subscription.unsubscribe()
+
+    assert values == [LowVoltageSystemState.ON]
+    assert isinstance(values[0], LowVoltageSystemState)
+
+
+async def test_stream_delivers_enum_members(vehicle, broker):
+    broker.update({"Vehicle.LowVoltageSystemState": "START", "Vehicle.Speed": 1.0})
+    async with vehicle.stream(as_enum=True) as updates:
+        changes = await updates.__anext__()
+
+    assert changes[vehicle.LowVoltageSystemState] == LowVoltageSystemState.START
+    assert changes[vehicle.Speed] == 1.0
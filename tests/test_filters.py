@@ -0,0 +1,75 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+from sdv.proto.broker_pb2 import SubscribeReply
+from sdv.vdb.reply import DataPointReply
+
+from sdv_model.filters import UpdateFilter
+
+
+def speed_reply(value: float) -> DataPointReply:
+    reply = SubscribeReply()
+    reply.fields["Vehicle.Speed"].float_value = value
+    return DataPointReply(reply)
+
+
+def values_of(replies):
+    return [reply.reply.fields["Vehicle.Speed"].float_value for reply in replies]
+
+
+async def test_max_rate_holds_back_all_but_the_latest_update(vehicle):
+    delivered = []
+    update_filter = UpdateFilter(vehicle.Speed, delivered.append, max_rate=10)
+    for value in range(5):
+        await update_filter.on_update(speed_reply(float(value)))
+    assert values_of(delivered) == [0.0]
+
+    await asyncio.sleep(0.15)
+    assert values_of(delivered) == [0.0, 4.0]
+
+
+async def test_max_rate_counts_from_the_flushed_update(vehicle):
+    delivered = []
+    update_filter = UpdateFilter(vehicle.Speed, delivered.append, max_rate=10)
+    await update_filter.on_update(speed_reply(1.0))
+    await update_filter.on_update(speed_reply(2.0))
+    await asyncio.sleep(0.12)
+    assert values_of(delivered) == [1.0, 2.0]
+
+    # right after the flush, the next update is held back again
+    await update_filter.on_update(speed_reply(3.0))
+    assert values_of(delivered) == [1.0, 2.0]
+    await asyncio.sleep(0.12)
+    assert values_of(delivered) == [1.0, 2.0, 3.0]
+
+
+async def test_deadband_drops_small_changes(vehicle):
+    delivered = []
+    update_filter = UpdateFilter(vehicle.Speed, delivered.append, deadband=1.0)
+    for value in (10.0, 10.5, 11.0, 11.5, 13.0):
+        await update_filter.on_update(speed_reply(value))
+    assert values_of(delivered) == [10.0, 11.0, 13.0]
+
+
+async def test_updates_without_the_filtered_data_point_pass(vehicle):
+    delivered = []
+    update_filter = UpdateFilter(vehicle.Speed, delivered.append, deadband=1.0)
+    await update_filter.on_update(speed_reply(10.0))
+    reply = SubscribeReply()
+    reply.fields["Vehicle.IsMoving"].bool_value = True
+    await update_filter.on_update(DataPointReply(reply))
+    assert len(delivered) == 2
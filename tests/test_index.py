@@ -0,0 +1,42 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from sdv_model import Vehicle
+
+
+def test_paths_and_nodes_round_trip(vehicle):
+    index = vehicle.index
+    assert len(index) > 1000
+    for path, node in index.items():
+        assert node.get_path() == path
+        assert vehicle.get_by_path(path) is node
+        assert vehicle.path_of(node) == path
+    assert vehicle.get_by_path("Vehicle") is vehicle
+    assert "Vehicle.Cabin.Seat.Row2.Pos3.Heating" in index
+
+
+def test_the_index_builds_a_lazy_vehicle():
+    vehicle = Vehicle("Vehicle", lazy=True)
+    seat = vehicle.get_by_path("Vehicle.Cabin.Seat.Row2.Pos3")
+    assert seat is vehicle.Cabin.Seat.Row2.Pos3
+    assert len(vehicle.index) == len(Vehicle("Vehicle").index)
+
+
+def test_unknown_paths_and_nodes_raise(vehicle):
+    with pytest.raises(KeyError, match="Vehicle.Cabin.Seat.Row3"):
+        vehicle.get_by_path("Vehicle.Cabin.Seat.Row3")
+    with pytest.raises(KeyError, match="not part of this model"):
+        vehicle.path_of(Vehicle("Vehicle").Speed)
@@ -0,0 +1,51 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from sdv_model import Vehicle
+from sdv_model.lazy import branch_names, materialize
+from sdv_model.snapshot import iter_datapoints
+
+
+def built(model):
+    """The names of the branches of a model which were created."""
+    return [name for name in branch_names(type(model)) if name in vars(model)]
+
+
+def test_branches_are_built_on_first_access():
+    vehicle = Vehicle("Vehicle", lazy=True)
+    assert built(vehicle) == []
+    # data points are created with their branch
+    assert vehicle.Speed.get_path() == "Vehicle.Speed"
+
+    cabin = vehicle.Cabin
+    assert built(vehicle) == ["Cabin"]
+    assert vehicle.Cabin is cabin
+    assert cabin.parent is vehicle
+    assert built(cabin) == []
+
+    seat = vehicle.Cabin.Seat.Row1.Pos2
+    assert seat.get_path() == "Vehicle.Cabin.Seat.Row1.Pos2"
+    assert built(cabin) == ["Seat"]
+    assert built(cabin.Seat) == ["Row1"]
+    assert built(cabin.Seat.Row1) == ["Pos2"]
+
+
+def test_materialize_builds_all_branches():
+    vehicle = Vehicle("Vehicle", lazy=True)
+    materialize(vehicle)
+    assert built(vehicle) == list(branch_names(Vehicle))
+    assert built(vehicle.Cabin.Seat.Row2) == ["Pos1", "Pos2", "Pos3"]
+    assert [path for path, _ in iter_datapoints(vehicle, "Vehicle")] == [
+        path for path, _ in iter_datapoints(Vehicle("Vehicle"), "Vehicle")
+    ]
@@ -0,0 +1,90 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from sdv_model.fakebroker import FakeDatabroker
+
+MAX_AGE = 0.1
+
+# longer than the update delay of the multiplexer and the latency of the broker
+SETTLE = 0.05
+
+
+@pytest.fixture
+def requests(broker):
+    """The paths of the GetDatapoints requests served by the broker."""
+    paths = []
+    get_datapoints = broker.GetDatapoints
+
+    async def counting_get_datapoints(request, metadata=None):
+        paths.append(list(request.datapoints))
+        return await get_datapoints(request, metadata)
+
+    broker.GetDatapoints = counting_get_datapoints
+    return paths
+
+
+async def test_mirrored_values_are_read_from_memory(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.Speed": 50.0})
+    mirror = await vehicle.start_mirror(vehicle.Speed)
+    await asyncio.sleep(SETTLE)
+    assert mirror.lookup(vehicle.Speed).updates == 1
+
+    broker.update({"Vehicle.Speed": 60.0})
+    await asyncio.sleep(SETTLE)
+    assert (await vehicle.Speed.get()).value == 60.0
+    assert requests == []
+    assert mirror.values_by_path() == {"Vehicle.Speed": 60.0}
+
+    await vehicle.stop_mirror()
+    assert vehicle.mirror is None
+    assert (await vehicle.Speed.get()).value == 60.0
+    assert requests == [["Vehicle.Speed"]]
+
+
+async def test_stale_values_are_read_from_the_broker(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.Speed": 50.0})
+    await vehicle.start_mirror(vehicle.Speed, max_age=MAX_AGE)
+    await asyncio.sleep(SETTLE)
+    assert (await vehicle.Speed.get()).value == 50.0
+    assert requests == []
+
+    await asyncio.sleep(MAX_AGE)
+    assert (await vehicle.Speed.get()).value == 50.0
+    assert requests == [["Vehicle.Speed"]]
+
+    # a new update makes the mirrored value fresh again
+    broker.update({"Vehicle.Speed": 70.0})
+    await asyncio.sleep(SETTLE)
+    assert (await vehicle.Speed.get()).value == 70.0
+    assert len(requests) == 1
+    await vehicle.stop_mirror()
+
+
+async def test_data_points_not_mirrored_are_read_from_the_broker(
+    vehicle, broker: FakeDatabroker, requests
+):
+    broker.update({"Vehicle.Speed": 50.0, "Vehicle.CurbWeight": 1500})
+    await vehicle.start_mirror(vehicle.Speed)
+    await asyncio.sleep(SETTLE)
+    assert (await vehicle.CurbWeight.get()).value == 1500
+    assert requests == [["Vehicle.CurbWeight"]]
+    await vehicle.stop_mirror()
@@ -0,0 +1,134 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+from sdv.vdb.subscriptions import SubscriptionManager
+
+# longer than the update delay of the multiplexer and the latency of the broker
+SETTLE = 0.05
+
+
+def upstream_tasks():
+    return set(SubscriptionManager._subscription_tasks)  # pylint: disable=W0212
+
+
+async def test_subscribers_share_one_upstream_subscription(vehicle, broker):
+    tasks = upstream_tasks()
+    speeds, joined = [], []
+    await vehicle.Speed.subscribe(
+        lambda reply: speeds.append(dict(reply.reply.fields)), multiplex=True
+    )
+    await vehicle.Speed.join(vehicle.IsMoving).subscribe(
+        lambda reply: joined.append(sorted(reply.reply.fields)), multiplex=True
+    )
+    await asyncio.sleep(SETTLE)
+
+    assert len(upstream_tasks() - tasks) == 1
+    assert vehicle.multiplexer.paths == ("Vehicle.IsMoving", "Vehicle.Speed")
+
+    broker.update({"Vehicle.Speed": 10.0})
+    await asyncio.sleep(SETTLE)
+    broker.update({"Vehicle.IsMoving": True})
+    await asyncio.sleep(SETTLE)
+
+    assert [list(fields) for fields in speeds] == [["Vehicle.Speed"]]
+    assert joined == [["Vehicle.Speed"], ["Vehicle.IsMoving"]]
+
+
+async def test_leaving_subscriber_gets_no_more_updates(vehicle, broker):
+    tasks = upstream_tasks()
+    speeds, joined = [], []
+    speed = await vehicle.Speed.subscribe(
+        lambda reply: speeds.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    both = await vehicle.Speed.join(vehicle.IsMoving).subscribe(
+        joined.append, multiplex=True
+    )
+    await asyncio.sleep(SETTLE)
+
+    await both.unsubscribe()
+    broker.update({"Vehicle.Speed": 20.0, "Vehicle.IsMoving": True})
+    await asyncio.sleep(SETTLE)
+    assert speeds == [20.0]
+    assert joined == []
+
+    await speed.unsubscribe()
+    await asyncio.sleep(SETTLE)
+    assert vehicle.multiplexer.paths == ()
+    assert upstream_tasks() == tasks
+
+
+async def test_joining_subscriber_gets_the_current_values(vehicle, broker):
+    first, second = [], []
+    await vehicle.Speed.subscribe(
+        lambda reply: first.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    broker.update({"Vehicle.Speed": 30.0})
+    await asyncio.sleep(SETTLE)
+
+    await vehicle.Speed.subscribe(
+        lambda reply: second.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert second == [30.0]
+
+    await asyncio.sleep(SETTLE)
+    assert first == [30.0]
+    assert second == [30.0]
+
+
+async def test_replaced_upstream_subscription_loses_no_updates(vehicle, broker):
+    tasks = upstream_tasks()
+    speeds = []
+    await vehicle.Speed.subscribe(
+        lambda reply: speeds.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    await asyncio.sleep(SETTLE)
+    added = iter((vehicle.Width, vehicle.Height, vehicle.Length, vehicle.CurbWeight))
+    for value in range(20):
+        broker.update({"Vehicle.Speed": float(value)})
+        if value % 5 == 0:
+            # adding a data point replaces the upstream subscription
+            await next(added).subscribe(lambda reply: None, multiplex=True)
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(SETTLE)
+
+    assert speeds == [float(value) for value in range(20)]
+    assert len(upstream_tasks() - tasks) == 1
+
+
+async def test_slow_callback_does_not_delay_other_subscribers(vehicle, broker):
+    slow, fast = [], []
+
+    async def on_slow(reply):
+        await asyncio.sleep(0.1)
+        slow.append(reply.get(vehicle.Speed).value)
+
+    await vehicle.Speed.subscribe(on_slow, multiplex=True)
+    await vehicle.Speed.subscribe(
+        lambda reply: fast.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    await asyncio.sleep(SETTLE)
+    broker.update({"Vehicle.Speed": 1.0})
+    await asyncio.sleep(0.01)
+    broker.update({"Vehicle.Speed": 2.0})
+    await asyncio.sleep(0.01)
+
+    assert fast == [1.0, 2.0]
+    assert slow == []
+    await vehicle.multiplexer.drain()
+    assert slow == [1.0, 2.0]
@@ -0,0 +1,72 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from sdv_model.query import compile_pattern
+
+
+def paths(datapoints):
+    return [datapoint.get_path() for datapoint in datapoints]
+
+
+def test_star_matches_one_segment(vehicle):
+    assert paths(vehicle.select("Vehicle.Chassis.Axle.*.Wheel.*.Tire.Pressure")) == [
+        "Vehicle.Chassis.Axle.Row1.Wheel.Left.Tire.Pressure",
+        "Vehicle.Chassis.Axle.Row1.Wheel.Right.Tire.Pressure",
+        "Vehicle.Chassis.Axle.Row2.Wheel.Left.Tire.Pressure",
+        "Vehicle.Chassis.Axle.Row2.Wheel.Right.Tire.Pressure",
+    ]
+    # branches are not selected
+    assert vehicle.select("Vehicle.Chassis.Axle.*.Wheel.*") == []
+
+
+def test_double_star_matches_any_number_of_segments(vehicle):
+    assert paths(vehicle.select("Vehicle.**.Tire.Pressure")) == paths(
+        vehicle.select("Vehicle.Chassis.Axle.*.Wheel.*.Tire.Pressure")
+    )
+    speeds = paths(vehicle.select("Vehicle.**.Speed"))
+    assert speeds[0] == "Vehicle.Speed"
+    assert "Vehicle.Chassis.Axle.Row2.Wheel.Right.Speed" in speeds
+
+    below = paths(vehicle.select("Vehicle.Chassis.Axle.Row1.Wheel.Left.**"))
+    assert "Vehicle.Chassis.Axle.Row1.Wheel.Left.Speed" in below
+    assert "Vehicle.Chassis.Axle.Row1.Wheel.Left.Tire.Pressure" in below
+    assert all(
+        path.startswith("Vehicle.Chassis.Axle.Row1.Wheel.Left.") for path in below
+    )
+
+
+def test_glob_segments(vehicle):
+    assert paths(vehicle.select("Vehicle.Cabin.Seat.Row*.Pos1.Heating")) == [
+        "Vehicle.Cabin.Seat.Row1.Pos1.Heating",
+        "Vehicle.Cabin.Seat.Row2.Pos1.Heating",
+    ]
+    assert paths(vehicle.select("Vehicle.Cabin.Door.Row1.Left.Is*")) == [
+        "Vehicle.Cabin.Door.Row1.Left.IsOpen",
+        "Vehicle.Cabin.Door.Row1.Left.IsLocked",
+        "Vehicle.Cabin.Door.Row1.Left.IsChildLockActive",
+    ]
+
+
+def test_several_double_stars_select_each_data_point_once(vehicle):
+    speeds = vehicle.select("Vehicle.**.**.Speed")
+    assert len({id(datapoint) for datapoint in speeds}) == len(speeds)
+    assert paths(speeds) == paths(vehicle.select("Vehicle.**.Speed"))
+
+
+@pytest.mark.parametrize("pattern", ["", "Vehicle..Speed", "Vehicle.Speed.", ".Speed"])
+def test_empty_segments_are_rejected(pattern):
+    with pytest.raises(ValueError, match="Empty segment"):
+        compile_pattern(pattern)
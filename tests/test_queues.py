@@ -0,0 +1,77 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+import pytest
+
+from sdv_model.queues import BLOCK, COALESCE, DROP_NEWEST, DROP_OLDEST, UpdateQueue
+
+
+def contents(queue: UpdateQueue):
+    return [queue.get_nowait() for _ in range(len(queue))]
+
+
+def test_drop_oldest_keeps_the_newest_updates():
+    queue = UpdateQueue(2, DROP_OLDEST)
+    for item in range(4):
+        queue.put_nowait(item)
+    assert contents(queue) == [2, 3]
+    assert queue.dropped == 2
+
+
+def test_drop_newest_keeps_the_oldest_updates():
+    queue = UpdateQueue(2, DROP_NEWEST)
+    for item in range(4):
+        queue.put_nowait(item)
+    assert contents(queue) == [0, 1]
+    assert queue.dropped == 2
+
+
+def test_coalesce_merges_into_the_newest_update():
+    queue = UpdateQueue(2, COALESCE, lambda older, newer: {**older, **newer})
+    queue.put_nowait({"a": 1})
+    queue.put_nowait({"b": 1})
+    queue.put_nowait({"b": 2, "c": 2})
+    assert contents(queue) == [{"a": 1}, {"b": 2, "c": 2}]
+    assert queue.coalesced == 1
+    assert queue.dropped == 0
+
+
+async def test_block_waits_for_room():
+    queue = UpdateQueue(1, BLOCK)
+    await queue.put(1)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(2)
+
+    put = asyncio.ensure_future(queue.put(2))
+    await asyncio.sleep(0)
+    assert not put.done()
+    assert await queue.get() == 1
+    await put
+    assert await queue.get() == 2
+
+
+async def test_close_ends_a_pending_get():
+    queue = UpdateQueue(0)
+    get = asyncio.ensure_future(queue.get())
+    await asyncio.sleep(0)
+    queue.close()
+    assert await get is None
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        UpdateQueue(1, "drop-all")
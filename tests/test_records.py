@@ -0,0 +1,52 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import pytest
+
+from sdv_model.records import RecordLayout, RecordReader, RecordWriter
+
+pytest.importorskip("numpy")
+
+
+def test_records_roundtrip(vehicle, tmp_path):
+    layout = RecordLayout.of(vehicle)
+    path = str(tmp_path / "drive.rec")
+    first = {
+        "Vehicle.Speed": 50.5,
+        "Vehicle.IsMoving": True,
+        "Vehicle.RoofLoad": -5,
+        "Vehicle.CurbWeight": 1500,
+        "Vehicle.LowVoltageSystemState": "ON",
+    }
+    second = {"Vehicle.Speed": 0.0, "Vehicle.IsMoving": False}
+    with RecordWriter(path, layout) as writer:
+        writer.write(1.0, first)
+        writer.write(2.0, second)
+
+    reader = RecordReader(path, layout)
+    assert len(reader) == 2
+    assert list(reader.timestamps) == [1.0, 2.0]
+    assert reader.values(0) == first
+    assert reader.values(1) == second
+    assert list(reader["Vehicle.Speed"]) == [50.5, 0.0]
+    assert list(reader.valid("Vehicle.CurbWeight")) == [True, False]
+
+
+def test_records_of_another_layout_are_rejected(vehicle, tmp_path):
+    path = str(tmp_path / "drive.rec")
+    with RecordWriter(path, RecordLayout.of(vehicle.Cabin)) as writer:
+        writer.write(1.0, {})
+    with pytest.raises(ValueError):
+        RecordReader(path, RecordLayout.of(vehicle))
@@ -0,0 +1,95 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+
+from sdv.vdb.subscriptions import SubscriptionManager
+
+from sdv_model.replay import UpdateRecorder, read_log, replay
+
+# longer than the update delay of the multiplexer and the latency of the broker
+SETTLE = 0.05
+
+
+async def record_speeds(vehicle, broker, log: str, speeds):
+    recorder = UpdateRecorder(vehicle, log, vehicle.Speed)
+    await recorder.start()
+    await asyncio.sleep(SETTLE)
+    for speed in speeds:
+        broker.update({"Vehicle.Speed": speed})
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(SETTLE)
+    await recorder.stop()
+    await asyncio.sleep(SETTLE)
+
+
+async def test_recorded_updates_are_read_back(vehicle, broker, tmp_path):
+    log = str(tmp_path / "drive.log")
+    await record_speeds(vehicle, broker, log, [1.0, 2.0, 3.0])
+    updates = list(read_log(log))
+    assert [update.path for update in updates] == ["Vehicle.Speed"] * 3
+    assert [update.value for update in updates] == [1.0, 2.0, 3.0]
+
+
+async def test_replay_without_databroker(vehicle, broker, tmp_path):
+    log = str(tmp_path / "drive.log")
+    await record_speeds(vehicle, broker, log, [1.0, 2.0, 3.0])
+    broker.uninstall()
+
+    tasks = set(SubscriptionManager._subscription_tasks)  # pylint: disable=W0212
+    vehicle.multiplexer.disconnect()
+    speeds = []
+    await vehicle.Speed.subscribe(
+        lambda reply: speeds.append(reply.get(vehicle.Speed).value), multiplex=True
+    )
+    await asyncio.sleep(SETTLE)
+
+    assert await replay(vehicle, log, speed=None) == 3
+    assert speeds == [1.0, 2.0, 3.0]
+    await asyncio.sleep(SETTLE)
+    assert vehicle.multiplexer.paths == ()
+    assert (
+        set(SubscriptionManager._subscription_tasks) == tasks
+    )  # pylint: disable=W0212
+
+
+async def test_replay_through_the_broker_reaches_subscriptions_and_streams(
+    vehicle, broker, tmp_path
+):
+    log = str(tmp_path / "drive.log")
+    await record_speeds(vehicle, broker, log, [1.0, 2.0, 3.0])
+
+    speeds = []
+    await vehicle.Speed.subscribe(
+        lambda reply: speeds.append(reply.get(vehicle.Speed).value)
+    )
+    streamed = []
+    updates = vehicle.stream()
+
+    async def consume():
+        async for changes in updates:
+            streamed.append(changes[vehicle.Speed])
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(SETTLE)
+    # both start with the current value
+    assert speeds == [3.0] and streamed == [3.0]
+
+    assert await replay(vehicle, log, speed=None, broker=broker) == 3
+    assert speeds == [3.0, 1.0, 2.0, 3.0]
+    assert streamed == [3.0, 1.0, 2.0, 3.0]
+    assert broker.value_of("Vehicle.Speed") == 3.0
+    await updates.close()
+    await consumer
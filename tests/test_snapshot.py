@@ -0,0 +1,60 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from sdv_model.fakebroker import FakeDatabroker
+from sdv_model.snapshot import iter_datapoints
+
+
+async def test_snapshot_holds_the_values_of_the_branch(vehicle, broker: FakeDatabroker):
+    seat = vehicle.Cabin.Seat.Row1.Pos1
+    broker.update(
+        {
+            "Vehicle.Cabin.Seat.Row1.Pos1.Heating": 50,
+            "Vehicle.Cabin.Seat.Row1.Pos1.Position": 300,
+            "Vehicle.Cabin.Seat.Row1.Pos1.Switch.Massage.IsIncreaseEngaged": True,
+            "Vehicle.Cabin.Seat.Row1.Pos2.Heating": 10,
+        }
+    )
+    snapshot = await seat.snapshot()
+
+    assert snapshot.path == "Vehicle.Cabin.Seat.Row1.Pos1"
+    assert set(snapshot) == {
+        path[len("Vehicle.Cabin.Seat.Row1.Pos1.") :]
+        for path, _ in iter_datapoints(seat, seat.get_path())
+    }
+    assert snapshot["Heating"].value == 50
+    assert snapshot.Heating.value == 50
+    assert snapshot[seat.Position].value == 300
+    assert snapshot.Switch.Massage.IsIncreaseEngaged.value is True
+    assert len(snapshot.Switch.Massage) == 2
+    assert snapshot.values_by_path()["Vehicle.Cabin.Seat.Row1.Pos1.Heating"] == 50
+    assert "Vehicle.Cabin.Seat.Row1.Pos2.Heating" not in snapshot.values_by_path()
+
+    # the snapshot keeps the values it was taken with
+    broker.update({"Vehicle.Cabin.Seat.Row1.Pos1.Heating": 70})
+    assert snapshot.Heating.value == 50
+
+
+async def test_snapshot_is_read_only(vehicle, broker: FakeDatabroker):
+    snapshot = await vehicle.Cabin.Seat.Row1.Pos1.snapshot()
+    with pytest.raises(AttributeError, match="read-only"):
+        snapshot.Heating = 0
+    with pytest.raises(TypeError):
+        snapshot["Heating"] = 0  # type: ignore
+    with pytest.raises(KeyError):
+        snapshot["Unknown"]
+    with pytest.raises(AttributeError):
+        snapshot.Unknown
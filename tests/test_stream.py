@@ -0,0 +1,103 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+from sdv.vdb.subscriptions import SubscriptionManager
+
+from sdv_model.fakebroker import FakeDatabroker
+from sdv_model.queues import COALESCE
+
+# longer than the latency of the broker
+SETTLE = 0.05
+
+LEFT = "Vehicle.Chassis.Axle.Row1.Wheel.Left.Speed"
+RIGHT = "Vehicle.Chassis.Axle.Row1.Wheel.Right.Speed"
+
+
+async def start(updates):
+    """Start the subscription of a stream and take its initial values."""
+    first = asyncio.ensure_future(updates.__anext__())
+    await asyncio.sleep(SETTLE)
+    return await first
+
+
+async def test_changes_of_one_reply_arrive_together(vehicle, broker: FakeDatabroker):
+    wheels = vehicle.Chassis.Axle.Row1.Wheel
+    broker.update({LEFT: 10.0, RIGHT: 10.0})
+    async with wheels.stream() as updates:
+        assert await start(updates) == {
+            wheels.Left.Speed: 10.0,
+            wheels.Right.Speed: 10.0,
+        }
+
+        broker.update({LEFT: 20.0, RIGHT: 21.0})
+        await asyncio.sleep(SETTLE)
+        broker.update({LEFT: 30.0})
+        await asyncio.sleep(SETTLE)
+        broker.update({RIGHT: 31.0})
+        await asyncio.sleep(SETTLE)
+
+        assert await updates.__anext__() == {
+            wheels.Left.Speed: 20.0,
+            wheels.Right.Speed: 21.0,
+        }
+        assert await updates.__anext__() == {wheels.Left.Speed: 30.0}
+        assert await updates.__anext__() == {wheels.Right.Speed: 31.0}
+
+
+async def test_coalescing_stream_merges_pending_changes(
+    vehicle, broker: FakeDatabroker
+):
+    wheels = vehicle.Chassis.Axle.Row1.Wheel
+    broker.update({LEFT: 10.0, RIGHT: 10.0})
+    async with wheels.stream(maxsize=1, policy=COALESCE) as updates:
+        await start(updates)
+        for speed in (20.0, 30.0):
+            broker.update({LEFT: speed})
+            await asyncio.sleep(SETTLE)
+        broker.update({RIGHT: 40.0})
+        await asyncio.sleep(SETTLE)
+
+        assert await updates.__anext__() == {
+            wheels.Left.Speed: 30.0,
+            wheels.Right.Speed: 40.0,
+        }
+        assert len(updates.queue) == 0
+
+
+async def test_close_ends_the_subscription(vehicle, broker: FakeDatabroker):
+    tasks = dict(SubscriptionManager._subscription_tasks)  # pylint: disable=W0212
+    updates = vehicle.Chassis.Axle.Row1.Wheel.stream()
+    broker.update({LEFT: 10.0})
+    await start(updates)
+    assert len(SubscriptionManager._subscription_tasks) == len(tasks) + 1
+
+    pending = asyncio.ensure_future(updates.__anext__())
+    await asyncio.sleep(0)
+    await updates.close()
+    with pytest.raises(StopAsyncIteration):
+        await pending
+    assert SubscriptionManager._subscription_tasks == tasks
+    await asyncio.sleep(SETTLE)
+    # the broker ended the subscription, and nothing refers to the stream
+    broker.update({LEFT: 20.0})
+    assert len(updates.queue) == 0
+    stream = weakref.ref(updates)
+    del updates, pending
+    gc.collect()
+    assert stream() is None
@@ -0,0 +1,78 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from sdv_model.fakebroker import FakeDatabroker
+from sdv_model.timeseries import RingBuffer, TimeSeries
+
+pytest.importorskip("numpy")
+
+# time between the updates of the recorded data point
+PERIOD = 0.05
+
+
+def test_ring_buffer_keeps_the_latest_samples():
+    buffer = RingBuffer(3)
+    assert buffer.latest is None
+    for second in range(5):
+        buffer.append(float(second), second * 10.0)
+
+    assert len(buffer) == 3
+    timestamps, values = buffer.last(3)
+    assert list(timestamps) == [2.0, 3.0, 4.0]
+    assert list(values) == [20.0, 30.0, 40.0]
+    assert list(buffer.last(2)[1]) == [30.0, 40.0]
+    assert list(buffer.last(10)[1]) == [20.0, 30.0, 40.0]
+    assert buffer.latest == (4.0, 40.0)
+    assert not values.flags.writeable
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert list(buffer.last(3)[1]) == []
+
+
+def test_ring_buffer_since():
+    buffer = RingBuffer(4)
+    assert list(buffer.since(1.0)[0]) == []
+    for second in range(6):
+        buffer.append(float(second), second)
+    assert list(buffer.since(1.0)[0]) == [4.0, 5.0]
+    assert list(buffer.since(0.0)[0]) == [5.0]
+    assert list(buffer.since(100.0)[0]) == [2.0, 3.0, 4.0, 5.0]
+
+
+async def test_time_series_records_the_updates(vehicle, broker: FakeDatabroker):
+    series = await vehicle.Speed.record(capacity=3)
+    for speed in (10.0, 20.0, 30.0, 40.0):
+        broker.update({"Vehicle.Speed": speed})
+        await asyncio.sleep(PERIOD)
+
+    assert list(series.last(3)[1]) == [20.0, 30.0, 40.0]
+    assert list(series.since(PERIOD / 2)[1]) == [40.0]
+    assert list(series.since(1.5 * PERIOD)[1]) == [30.0, 40.0]
+    timestamps = series.last(3)[0]
+    assert all(later > earlier for earlier, later in zip(timestamps, timestamps[1:]))
+
+    await series.close()
+    broker.update({"Vehicle.Speed": 50.0})
+    await asyncio.sleep(PERIOD)
+    assert series.latest[1] == 40.0
+
+
+def test_time_series_requires_a_numeric_data_point(vehicle):
+    with pytest.raises(TypeError, match="is not numeric"):
+        TimeSeries(vehicle.IsMoving, 3)
@@ -0,0 +1,93 @@
+# Copyright (c) 2022-2024 Contributors to the Eclipse Foundation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import math
+
+import pytest
+
+from sdv_model import validation
+from sdv_model.validation import ValidationError, validate, validate_many
+
+
+@pytest.fixture(params=["numpy", "python"])
+def vectorized(request, monkeypatch):
+    """Run validate_many with NumPy and with the pure Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validation, "np", None)
+    return request.param
+
+
+def test_values_out_of_range_are_rejected(vehicle):
+    massage = vehicle.Cabin.Seat.Row1.Pos1.Massage
+    validate(massage, 100)
+    with pytest.raises(ValidationError) as error:
+        validate(massage, 120)
+    (failure,) = error.value.failures
+    assert failure.path == "Vehicle.Cabin.Seat.Row1.Pos1.Massage"
+    assert failure.value == 120
+    assert "out of range [0, 100]" in failure.reason
+
+
+def test_values_of_the_wrong_type_are_rejected(vehicle):
+    with pytest.raises(ValidationError, match="expected float, got str"):
+        validate(vehicle.Speed, "fast")
+    with pytest.raises(ValidationError, match="expected uint16, got float"):
+        validate(vehicle.CurbWeight, 1500.5)
+    with pytest.raises(ValidationError, match="expected boolean, got int"):
+        validate(vehicle.Cabin.Seat.Row1.Pos1.Switch.Massage.IsIncreaseEngaged, 1)
+
+
+def test_unknown_enum_values_are_rejected(vehicle):
+    validate(vehicle.LowVoltageSystemState, "ON")
+    with pytest.raises(ValidationError, match="'DRIVE' is not one of"):
+        validate(vehicle.LowVoltageSystemState, "DRIVE")
+
+
+def test_nan_is_rejected(vehicle):
+    with pytest.raises(ValidationError, match="nan is out of range"):
+        validate(vehicle.Speed, math.nan)
+
+
+def test_validate_many_returns_the_failures_in_order(vehicle, vectorized):
+    seat = vehicle.Cabin.Seat.Row1.Pos1
+    failures = validate_many(
+        [
+            (vehicle.Speed, math.nan),
+            (seat.Massage, 50),
+            (vehicle.LowVoltageSystemState, "DRIVE"),
+            (seat.Massage, 120),
+            (vehicle.Speed, 80.0),
+            (vehicle.CurbWeight, -1),
+        ]
+    )
+    assert [(failure.path, failure.value) for failure in failures[1:]] == [
+        ("Vehicle.LowVoltageSystemState", "DRIVE"),
+        ("Vehicle.Cabin.Seat.Row1.Pos1.Massage", 120),
+        ("Vehicle.CurbWeight", -1),
+    ]
+    assert failures[0].path == "Vehicle.Speed" and math.isnan(failures[0].value)
+
+
+async def test_invalid_values_are_not_sent_nor_logged(vehicle, broker, caplog):
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(ValidationError):
+            await vehicle.Cabin.Seat.Row1.Pos1.Massage.set(120)
+    assert caplog.records == []
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos1.Massage") is None
+
+    await vehicle.Cabin.Seat.Row1.Pos1.Massage.set(80)
+    assert broker.value_of("Vehicle.Cabin.Seat.Row1.Pos1.Massage") == 80